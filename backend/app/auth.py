@@ -1,19 +1,26 @@
 import os
+import time
+import uuid
 import bcrypt
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
+from jose import JWTError
 from fastapi import Depends, HTTPException, status, Request, Response
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.database import get_db
-from app.models import User, UserRole
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.database import AsyncSessionLocal, get_db
+from app.models import User, UserRole, token_revocations
+from app.services.token_cache import token_digest, verified_tokens, revoked_tokens
+from app.services.invalidation_bus import invalidation_bus
 
 SECRET_KEY = os.environ.get("SESSION_SECRET", "pathfinder-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 7
 COOKIE_NAME = "pathfinder_token"
+TOKEN_TOPIC = "token"
+REVOCATION_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
 
 security = HTTPBearer(auto_error=False)
 
@@ -32,17 +39,77 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(days=ACCESS_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+    from jose import jwt
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_token(token: str) -> Optional[dict]:
+    digest = token_digest(token)
+    if revoked_tokens.is_revoked(digest):
+        return None
+    
+    payload = verified_tokens.get(digest)
+    if payload is not None:
+        return payload
+    
+    from jose import jwt
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+    verified_tokens.put(digest, payload)
+    return payload
+
+
+async def revoke_token(db: AsyncSession, token: str):
+    """Record the token as revoked until it expires and tell every worker."""
+    payload = decode_token(token)
+    if not payload:
+        return
+    expires_at = float(payload.get("exp", time.time()))
+    digest = token_digest(token).hex()
+    # expires_at is a naive UTC column.
+    row = {"digest": digest, "expires_at": datetime.fromtimestamp(expires_at, timezone.utc).replace(tzinfo=None)}
+    
+    await db.execute(delete(token_revocations).where(token_revocations.c.expires_at <= datetime.utcnow()))
+    dialect_insert = REVOCATION_INSERTS.get(db.bind.dialect.name)
+    if dialect_insert is not None:
+        await db.execute(
+            dialect_insert(token_revocations).values(**row)
+            .on_conflict_do_nothing(index_elements=[token_revocations.c.digest])
+        )
+    else:
+        existing = await db.execute(select(token_revocations.c.digest).where(token_revocations.c.digest == digest))
+        if existing.first() is None:
+            await db.execute(insert(token_revocations).values(**row))
+    await invalidation_bus.publish(db, TOKEN_TOPIC, f"{digest}:{expires_at}")
+    await db.commit()
+
+
+async def load_revoked_tokens() -> int:
+    """Fill this worker's revocation list from the table (at startup)."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(token_revocations.c.digest, token_revocations.c.expires_at)
+            .where(token_revocations.c.expires_at > datetime.utcnow())
+        )
+        rows = result.all()
+    for digest, expires_at in rows:
+        revoked_tokens.revoke(bytes.fromhex(digest), expires_at.replace(tzinfo=timezone.utc).timestamp())
+    return len(rows)
+
+
+@invalidation_bus.subscribe(TOKEN_TOPIC)
+def _revoke_on_event(keys):
+    for key in keys:
+        digest, _, expires_at = key.partition(":")
+        if not expires_at:
+            continue
+        digest = bytes.fromhex(digest)
+        revoked_tokens.revoke(digest, float(expires_at))
+        verified_tokens.discard(digest)
 
 
 def set_auth_cookie(response: Response, token: str):
@@ -76,6 +143,73 @@ async def get_token_from_request(request: Request) -> Optional[str]:
     return None
 
 
+class Principal:
+    """
+    The authenticated caller as described by verified token claims.
+    
+    `id` and `role` come straight from the JWT (`sub`, `role`), so role-only
+    endpoints need no database round trip. Handlers that need the full user
+    call `await principal.get_user()`, which loads it once per request.
+    """
+    
+    def __init__(self, user_id: int, role: Optional[UserRole], db: AsyncSession):
+        self.id = user_id
+        self.role = role
+        self._db = db
+        self._user: Optional[User] = None
+    
+    async def get_user(self) -> User:
+        if self._user is None:
+            from sqlalchemy.orm import selectinload
+            
+            result = await self._db.execute(
+                select(User)
+                .where(User.id == self.id)
+                .options(selectinload(User.profile), selectinload(User.skills))
+            )
+            self._user = result.scalar_one_or_none()
+            if not self._user:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found"
+                )
+        return self._user
+
+
+async def get_current_principal(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    token = await get_token_from_request(request)
+    
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+    
+    payload = decode_token(token)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload"
+        )
+    
+    principal = Principal(int(user_id), None, db)
+    try:
+        principal.role = UserRole(payload.get("role"))
+    except ValueError:
+        principal.role = (await principal.get_user()).role
+    return principal
+
+
 async def get_current_user(
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -141,6 +275,21 @@ def require_role(*roles: UserRole):
     return role_checker
 
 
+def require_principal_role(*roles: UserRole):
+    async def role_checker(principal: Principal = Depends(get_current_principal)) -> Principal:
+        if principal.role not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. Required role: {[r.value for r in roles]}"
+            )
+        return principal
+    return role_checker
+
+
 require_student = require_role(UserRole.STUDENT)
 require_employer = require_role(UserRole.EMPLOYER)
 require_advisor = require_role(UserRole.ADVISOR)
+
+require_student_principal = require_principal_role(UserRole.STUDENT)
+require_employer_principal = require_principal_role(UserRole.EMPLOYER)
+require_advisor_principal = require_principal_role(UserRole.ADVISOR)
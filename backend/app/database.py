@@ -15,12 +15,13 @@ def get_async_database_url():
     parsed = urlparse(database_url)
     query_params = parse_qs(parsed.query)
     
+    clean_url = database_url
     if 'sslmode' in query_params:
+        # Rebuild only when needed: urlunparse drops the empty host of sqlite:/// URLs.
         del query_params['sslmode']
-    
-    new_query = urlencode(query_params, doseq=True)
-    new_parsed = parsed._replace(query=new_query)
-    clean_url = urlunparse(new_parsed)
+        new_query = urlencode(query_params, doseq=True)
+        new_parsed = parsed._replace(query=new_query)
+        clean_url = urlunparse(new_parsed)
     
     if clean_url.startswith("postgresql://"):
         clean_url = clean_url.replace("postgresql://", "postgresql+asyncpg://", 1)
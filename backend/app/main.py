@@ -1,25 +1,64 @@
+import time
+_import_started = time.perf_counter()
+
 import os
 from pathlib import Path
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from app.database import engine, Base
+from app.pagination import NEXT_CURSOR_HEADER
+from app.startup import startup_report
+from app.migrations import schema_is_current, run_migrations
+from app.services.static_assets import StaticManifest
+from app.services.catalog_cache import load_catalog_version
+from app.services.reference_cache import warm_reference_caches, reference_cache_stats
+from app.services.match_store import ensure_job_matches
+from app.services.application_scores import rescorer, rescore_stats
+from app.services.token_cache import token_cache_stats
+from app.auth import load_revoked_tokens
+from app.services.note_search import note_search_stats
+from app.services.shared_snapshot import job_matrix
+from app.services.invalidation_bus import invalidation_bus
+from app.services.request_metrics import RequestMetricsMiddleware, instrument_routes, metrics_access_allowed, render_metrics
 from app.routers import auth, users, jobs, applications, skills, notes, interviews, notifications, careers, analytics
 
 FRONTEND_DIR = Path(__file__).parent.parent.parent / "frontend" / "dist"
+AUTO_MIGRATE = os.environ.get("AUTO_MIGRATE", "1") != "0"
+
+startup_report.record("import", _import_started)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    with startup_report.phase("db_connect"):
+        schema_current = await schema_is_current()
+    
+    if not schema_current:
+        if not AUTO_MIGRATE:
+            raise RuntimeError("Database schema is out of date; run `python -m app.migrations`")
+        with startup_report.phase("migrations"):
+            startup_report.migrations_applied = await run_migrations()
     
     from app.seed import seed_initial_data
-    await seed_initial_data()
+    with startup_report.phase("seed"):
+        await seed_initial_data()
+    
+    with startup_report.phase("warmup"):
+        await load_catalog_version()
+        await warm_reference_caches()
+        await load_revoked_tokens()
+        await ensure_job_matches()
+        await job_matrix.ensure_current()
+    rescorer.start()
+    await invalidation_bus.start()
+    startup_report.mark_ready()
     
     yield
+    
+    await rescorer.stop()
+    await job_matrix.stop()
+    await invalidation_bus.stop()
 
 
 app = FastAPI(
@@ -35,7 +74,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
+app.add_middleware(RequestMetricsMiddleware)
 
 app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
@@ -50,16 +91,38 @@ app.include_router(analytics.router, prefix="/api")
 
 
 @app.get("/api/health")
-async def health_check():
-    return {"status": "healthy", "service": "pathfinder-v2"}
+async def health_check(request: Request):
+    health = {
+        "status": "healthy",
+        "service": "pathfinder-v2",
+        "startup": startup_report.as_dict()
+    }
+    # Cache, token and bus internals only for the clients allowed to scrape /api/metrics.
+    if metrics_access_allowed(request):
+        health.update({
+            "caches": reference_cache_stats(),
+            "rescoring": rescore_stats(),
+            "tokens": token_cache_stats(),
+            "note_search": note_search_stats(),
+            "job_matrix": job_matrix.stats(),
+            "invalidation": invalidation_bus.stats()
+        })
+    return health
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request):
+    if not metrics_access_allowed(request):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Metrics are not available to this client")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
 if FRONTEND_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="static")
+    spa_manifest = StaticManifest(FRONTEND_DIR)
     
-    @app.get("/{full_path:path}")
+    @app.api_route("/{full_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
     async def serve_spa(request: Request, full_path: str):
-        file_path = FRONTEND_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(FRONTEND_DIR / "index.html")
+        return spa_manifest.respond(request, full_path)
+
+
+instrument_routes(app)
@@ -0,0 +1,119 @@
+"""
+Versioned schema migrations, run once per deploy.
+
+Each migration is a module in this package named `vNNNN_<description>.py`
+exposing `upgrade(connection)`; it runs synchronously on a Core connection
+inside the migration transaction. Applied versions are recorded in the
+`schema_migrations` table, so a worker that finds the schema current pays
+for a single query instead of `create_all` probing every table.
+
+Run pending migrations and seeding with:
+
+    python -m app.migrations
+
+Migrations never import `app.models` or services: each declares the tables
+and DDL it needs as they were when it was written, so replaying it on an
+empty database later still produces the same schema. `v0001_initial_schema`
+creates the baseline tables with `create_all`, so it is also safe against
+databases created by earlier `create_all` boots. Later schema changes must
+be added as new numbered migrations.
+"""
+
+import importlib
+import pkgutil
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.database import engine
+
+
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+seed_versions = Table(
+    "seed_versions",
+    migration_metadata,
+    Column("name", String(100), primary_key=True),
+    Column("version", Integer, nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+MIGRATION_LOCK_ID = 7_202_401
+
+
+def discover_migrations() -> List[Tuple[int, str, object]]:
+    migrations = []
+    for module_info in pkgutil.iter_modules(__path__):
+        name = module_info.name
+        if not (name.startswith("v") and name[1:5].isdigit()):
+            continue
+        module = importlib.import_module(f"{__name__}.{name}")
+        migrations.append((int(name[1:5]), name[6:].replace("_", " "), module))
+    migrations.sort(key=lambda migration: migration[0])
+    return migrations
+
+
+def latest_version() -> int:
+    migrations = discover_migrations()
+    return migrations[-1][0] if migrations else 0
+
+
+async def _current_version(conn: AsyncConnection) -> int:
+    await conn.run_sync(lambda sync_conn: migration_metadata.create_all(sync_conn))
+    return (await conn.execute(select(func.max(schema_migrations.c.version)))).scalar() or 0
+
+
+async def schema_is_current() -> bool:
+    """One query: is every known migration already applied?"""
+    try:
+        async with engine.connect() as conn:
+            version = (await conn.execute(select(func.max(schema_migrations.c.version)))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        # A fresh database has no schema_migrations table yet; anything
+        # else (connection refused, permissions) must not be hidden.
+        async with engine.connect() as conn:
+            if await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(schema_migrations.name)):
+                raise
+        return False
+    return version >= latest_version()
+
+
+async def run_migrations() -> List[int]:
+    """Apply pending migrations in order; returns the versions applied."""
+    applied = []
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+
+        current = await _current_version(conn)
+        for version, description, module in discover_migrations():
+            if version <= current:
+                continue
+            started = time.perf_counter()
+            await conn.run_sync(module.upgrade)
+            await conn.execute(schema_migrations.insert().values(version=version, description=description))
+            applied.append(version)
+            print(f"Applied migration {version:04d} {description} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+    return applied
+
+
+async def get_seed_version(db: AsyncSession, name: str) -> int:
+    result = await db.execute(select(seed_versions.c.version).where(seed_versions.c.name == name))
+    return result.scalar() or 0
+
+
+async def record_seed_version(db: AsyncSession, name: str, version: int):
+    await db.execute(seed_versions.delete().where(seed_versions.c.name == name))
+    await db.execute(seed_versions.insert().values(name=name, version=version))
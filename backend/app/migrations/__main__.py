@@ -0,0 +1,16 @@
+import asyncio
+
+from app.migrations import run_migrations
+
+
+async def main():
+    applied = await run_migrations()
+    if not applied:
+        print("Schema is up to date")
+
+    from app.seed import seed_initial_data
+    await seed_initial_data()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,204 @@
+"""
+Baseline: the schema earlier `create_all` boots produced.
+
+The tables are declared here rather than taken from `app.models`, so this
+migration keeps creating the same schema however the models change later.
+`create_all` skips tables that already exist, which makes it safe against
+databases created before migrations were introduced.
+"""
+
+from sqlalchemy import (
+    Boolean, Column, DateTime, Double, Enum, ForeignKey, Integer, MetaData, String, Table, Text
+)
+
+metadata = MetaData()
+
+USER_ROLES = ("STUDENT", "EMPLOYER", "ADVISOR")
+APPLICATION_STATUSES = ("PENDING", "REVIEWED", "INTERVIEW", "REJECTED", "ACCEPTED")
+INTERVIEW_STATUSES = ("SCHEDULED", "CONFIRMED", "COMPLETED", "CANCELLED", "RESCHEDULED")
+NOTIFICATION_TYPES = (
+    "APPLICATION_SUBMITTED", "APPLICATION_STATUS_CHANGED", "INTERVIEW_SCHEDULED",
+    "ADVISOR_NOTE", "JOB_DEADLINE_REMINDER", "PROFILE_INCOMPLETE",
+)
+
+
+def _id():
+    return Column("id", Integer, primary_key=True, index=True)
+
+
+def _user_fk(name, nullable=False, ondelete="CASCADE"):
+    return Column(name, Integer, ForeignKey("users.id", ondelete=ondelete), nullable=nullable)
+
+
+Table(
+    "users", metadata,
+    _id(),
+    Column("email", String(255), unique=True, index=True, nullable=False),
+    Column("password_hash", String(255), nullable=False),
+    Column("role", Enum(*USER_ROLES, name="userrole"), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "skills", metadata,
+    _id(),
+    Column("name", String(100), unique=True, nullable=False, index=True),
+    Column("is_technical", Boolean, nullable=False),
+    Column("category", String(100)),
+    Column("onet_element_id", String(50)),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "user_skills", metadata,
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+    Column("proficiency", Integer),
+)
+
+Table(
+    "advisor_students", metadata,
+    Column("advisor_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("student_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+)
+
+Table(
+    "profiles", metadata,
+    _id(),
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False),
+    Column("first_name", String(100), nullable=False),
+    Column("last_name", String(100), nullable=False),
+    Column("headline", String(255)),
+    Column("bio", Text),
+    Column("academic_background", Text),
+    Column("company_name", String(255)),
+    Column("company_description", Text),
+    Column("location", String(255)),
+    Column("avatar_url", String(500)),
+    Column("resume_url", String(500)),
+    Column("resume_filename", String(255)),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "jobs", metadata,
+    _id(),
+    _user_fk("employer_id"),
+    Column("title", String(255), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("location", String(255)),
+    Column("salary_min", Integer),
+    Column("salary_max", Integer),
+    Column("job_type", String(50)),
+    Column("experience_level", String(50)),
+    Column("onet_soc_code", String(20)),
+    Column("deadline", DateTime),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "job_skills", metadata,
+    Column("job_id", Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+)
+
+Table(
+    "applications", metadata,
+    _id(),
+    Column("job_id", Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False),
+    _user_fk("applicant_id"),
+    Column("status", Enum(*APPLICATION_STATUSES, name="applicationstatus"), nullable=False),
+    Column("cover_letter", Text),
+    Column("resume_url", String(500)),
+    Column("match_score", Double),
+    Column("feedback_notes", Text),
+    _user_fk("feedback_by", nullable=True, ondelete=None),
+    Column("feedback_at", DateTime),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "notes", metadata,
+    _id(),
+    _user_fk("advisor_id"),
+    _user_fk("student_id"),
+    Column("content", Text, nullable=False),
+    Column("note_type", String(50), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "interviews", metadata,
+    _id(),
+    Column("application_id", Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False),
+    Column("scheduled_at", DateTime, nullable=False),
+    Column("duration_minutes", Integer, nullable=False),
+    Column("interview_type", String(50), nullable=False),
+    Column("location", String(255)),
+    Column("meeting_link", String(500)),
+    Column("notes", Text),
+    Column("status", Enum(*INTERVIEW_STATUSES, name="interviewstatus"), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "onet_occupations", metadata,
+    _id(),
+    Column("soc_code", String(20), unique=True, nullable=False, index=True),
+    Column("title", String(255), nullable=False),
+    Column("description", Text),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "notifications", metadata,
+    _id(),
+    _user_fk("user_id"),
+    Column("notification_type", Enum(*NOTIFICATION_TYPES, name="notificationtype"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("message", Text, nullable=False),
+    Column("link", String(500)),
+    Column("is_read", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "career_details", metadata,
+    _id(),
+    Column("soc_code", String(20), unique=True, nullable=False, index=True),
+    Column("title", String(255), nullable=False),
+    Column("salary_low", Integer),
+    Column("salary_median", Integer),
+    Column("salary_high", Integer),
+    Column("demand_outlook", String(100)),
+    Column("growth_rate", Double),
+    Column("responsibilities", Text),
+    Column("education_required", String(255)),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "learning_resources", metadata,
+    _id(),
+    Column("skill_id", Integer, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("provider", String(100), nullable=False),
+    Column("url", String(500), nullable=False),
+    Column("resource_type", String(50), nullable=False),
+    Column("estimated_hours", Integer),
+    Column("difficulty_level", String(50)),
+    Column("is_free", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection)
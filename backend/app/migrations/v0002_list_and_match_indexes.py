@@ -0,0 +1,28 @@
+"""
+Composite indexes for keyset pagination on pre-existing tables.
+
+The job_matches indexes this migration used to create are part of 0009.
+"""
+
+from sqlalchemy import text
+
+# (name, table, columns): filter, sort key, id.
+INDEXES = (
+    ("ix_jobs_active_created_id", "jobs", "is_active, created_at, id"),
+    ("ix_jobs_employer_created_id", "jobs", "employer_id, created_at, id"),
+    ("ix_jobs_salary_max_id", "jobs", "coalesce(salary_max, 0), id"),
+    ("ix_jobs_salary_min_id", "jobs", "coalesce(salary_min, 0), id"),
+    ("ix_applications_applicant_created_id", "applications", "applicant_id, created_at, id"),
+    ("ix_applications_job_score_id", "applications", "job_id, coalesce(match_score, -1.0), id"),
+    ("ix_notes_advisor_created_id", "notes", "advisor_id, created_at, id"),
+    ("ix_notes_student_created_id", "notes", "student_id, created_at, id"),
+    ("ix_interviews_application_scheduled_id", "interviews", "application_id, scheduled_at, id"),
+    ("ix_interviews_scheduled_id", "interviews", "scheduled_at, id"),
+    ("ix_notifications_user_created_id", "notifications", "user_id, created_at, id"),
+    ("ix_career_details_title_id", "career_details", "title, id"),
+)
+
+
+def upgrade(connection):
+    for name, table, columns in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
@@ -0,0 +1,22 @@
+"""Version counters for data shared across workers (the job/skill matrix snapshot)."""
+
+import uuid
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+JOB_MATRIX = "job_matrix"
+
+data_versions = Table(
+    "data_versions",
+    MetaData(),
+    Column("name", String(50), primary_key=True),
+    Column("epoch", String(32), nullable=False),
+    Column("version", Integer, nullable=False),
+)
+
+
+def upgrade(connection):
+    data_versions.create(connection, checkfirst=True)
+    exists = connection.execute(select(data_versions.c.name).where(data_versions.c.name == JOB_MATRIX)).first()
+    if not exists:
+        connection.execute(data_versions.insert().values(name=JOB_MATRIX, epoch=uuid.uuid4().hex, version=1))
@@ -0,0 +1,84 @@
+"""
+Interview participants for conflict detection.
+
+Adds `employer_id` and `applicant_id` to interviews (backfilled from the
+application and its job) with a (participant, scheduled_at) index each.
+SQLite cannot add NOT NULL to an existing column, so there they stay
+nullable; the application always sets them. On
+PostgreSQL it also adds GiST exclusion constraints so overlapping
+non-cancelled interviews cannot be committed for the same employer or
+candidate. If existing rows already overlap, the constraint is skipped with
+a warning listing them; the application-level check still applies.
+"""
+
+from sqlalchemy import inspect, text
+
+PARTICIPANT_COLUMNS = ("employer_id", "applicant_id")
+PARTICIPANT_INDEXES = {
+    "ix_interviews_employer_scheduled": "employer_id",
+    "ix_interviews_applicant_scheduled": "applicant_id",
+}
+# Names must match `app.services.interview_schedule.EXCLUSION_CONSTRAINTS`.
+EXCLUSION_CONSTRAINTS = {
+    "interviews_employer_no_overlap": "employer_id",
+    "interviews_applicant_no_overlap": "applicant_id",
+}
+EXCLUSION_DDL = (
+    "ALTER TABLE interviews ADD CONSTRAINT {name} EXCLUDE USING gist ("
+    "{column} WITH =, "
+    "tsrange(scheduled_at, scheduled_at + make_interval(mins => duration_minutes)) WITH &&"
+    ") WHERE (status <> 'CANCELLED')"
+)
+OVERLAPS_SQL = (
+    "SELECT a.id, b.id FROM interviews a JOIN interviews b "
+    "ON a.{column} = b.{column} AND a.id < b.id "
+    "AND a.scheduled_at < b.scheduled_at + make_interval(mins => b.duration_minutes) "
+    "AND b.scheduled_at < a.scheduled_at + make_interval(mins => a.duration_minutes) "
+    "WHERE a.status <> 'CANCELLED' AND b.status <> 'CANCELLED' LIMIT 20"
+)
+
+
+def add_participant_columns(connection):
+    existing = {column["name"] for column in inspect(connection).get_columns("interviews")}
+    for column in PARTICIPANT_COLUMNS:
+        if column not in existing:
+            connection.execute(text(
+                f"ALTER TABLE interviews ADD COLUMN {column} INTEGER REFERENCES users(id) ON DELETE CASCADE"
+            ))
+
+    connection.execute(text(
+        "UPDATE interviews SET "
+        "employer_id = (SELECT jobs.employer_id FROM applications JOIN jobs ON jobs.id = applications.job_id "
+        "WHERE applications.id = interviews.application_id), "
+        "applicant_id = (SELECT applications.applicant_id FROM applications "
+        "WHERE applications.id = interviews.application_id) "
+        "WHERE employer_id IS NULL OR applicant_id IS NULL"
+    ))
+    if connection.dialect.name == "postgresql":
+        for column in PARTICIPANT_COLUMNS:
+            connection.execute(text(f"ALTER TABLE interviews ALTER COLUMN {column} SET NOT NULL"))
+
+    for name, column in PARTICIPANT_INDEXES.items():
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON interviews ({column}, scheduled_at)"))
+
+
+def add_exclusion_constraints(connection):
+    existing = set(connection.execute(text(
+        "SELECT conname FROM pg_constraint WHERE conrelid = 'interviews'::regclass"
+    )).scalars())
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+    for name, column in EXCLUSION_CONSTRAINTS.items():
+        if name in existing:
+            continue
+        overlapping = connection.execute(text(OVERLAPS_SQL.format(column=column))).all()
+        if overlapping:
+            pairs = ", ".join(f"{a}/{b}" for a, b in overlapping)
+            print(f"  Skipped {name}: overlapping interviews by {column} (ids {pairs}); cancel or move them first")
+            continue
+        connection.execute(text(EXCLUSION_DDL.format(name=name, column=column)))
+
+
+def upgrade(connection):
+    add_participant_columns(connection)
+    if connection.dialect.name == "postgresql":
+        add_exclusion_constraints(connection)
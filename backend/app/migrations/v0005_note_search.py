@@ -0,0 +1,28 @@
+"""
+Full-text search over advisor notes (PostgreSQL).
+
+Adds a stored `search_vector` column computed from `content` and a GIN index
+on `(advisor_id, search_vector)` (needs the `btree_gin` extension for the
+integer column), used by `app.services.note_search`, which must use the same
+text search configuration. Other databases search notes with an in-process
+index and need no schema change.
+"""
+
+from sqlalchemy import inspect, text
+
+SEARCH_CONFIG = "english"
+
+
+def upgrade(connection):
+    if connection.dialect.name != "postgresql":
+        return
+    existing = {column["name"] for column in inspect(connection).get_columns("notes")}
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+    if "search_vector" not in existing:
+        connection.execute(text(
+            "ALTER TABLE notes ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(content, ''))) STORED"
+        ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_notes_advisor_search ON notes USING gin (advisor_id, search_vector)"
+    ))
@@ -0,0 +1,14 @@
+"""
+Index `user_skills` by skill.
+
+`refresh_job_matches()` reads only the students holding one of a job's
+skills; the primary key `(user_id, skill_id)` cannot serve that lookup.
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(connection):
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_user_skills_skill_user ON user_skills (skill_id, user_id)"
+    ))
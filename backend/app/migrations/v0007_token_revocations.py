@@ -0,0 +1,14 @@
+"""Persisted token revocations, so logouts survive worker restarts."""
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table
+
+token_revocations = Table(
+    "token_revocations",
+    MetaData(),
+    Column("digest", String(64), primary_key=True),
+    Column("expires_at", DateTime, nullable=False, index=True),
+)
+
+
+def upgrade(connection):
+    token_revocations.create(connection, checkfirst=True)
@@ -0,0 +1,21 @@
+"""Shared catalog version behind the catalog ETags (a `data_versions` row)."""
+
+import uuid
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+CATALOG_VERSION = "catalog"
+
+data_versions = Table(
+    "data_versions",
+    MetaData(),
+    Column("name", String(50), primary_key=True),
+    Column("epoch", String(32), nullable=False),
+    Column("version", Integer, nullable=False),
+)
+
+
+def upgrade(connection):
+    exists = connection.execute(select(data_versions.c.name).where(data_versions.c.name == CATALOG_VERSION)).first()
+    if not exists:
+        connection.execute(data_versions.insert().values(name=CATALOG_VERSION, epoch=uuid.uuid4().hex, version=1))
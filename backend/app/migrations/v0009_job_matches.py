@@ -0,0 +1,39 @@
+"""
+Stored student × job match scores (`job_matches`) and their indexes.
+
+Databases migrated before this version already have the table and indexes
+(they used to be part of 0001 and 0002), so both are created only if
+missing. `users` and `jobs` are declared with just their keys, for the
+foreign keys to resolve; they are never created here.
+"""
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, MetaData, Table, text
+
+metadata = MetaData()
+
+Table("users", metadata, Column("id", Integer, primary_key=True))
+Table("jobs", metadata, Column("id", Integer, primary_key=True))
+
+job_matches = Table(
+    "job_matches", metadata,
+    Column("student_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column("job_id", Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True),
+    Column("score", Float, nullable=False),
+    Column("matched_technical_count", Integer, nullable=False),
+    Column("matched_soft_count", Integer, nullable=False),
+    Column("missing_technical_count", Integer, nullable=False),
+    Column("missing_soft_count", Integer, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+# (name, columns)
+INDEXES = (
+    ("ix_job_matches_student_score_job", "student_id, score, job_id"),
+    ("ix_job_matches_job", "job_id"),
+)
+
+
+def upgrade(connection):
+    job_matches.create(connection, checkfirst=True)
+    for name, columns in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON job_matches ({columns})"))
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import Integer, String, Boolean, Text, DateTime, ForeignKey, Enum, Table, Column
+from sqlalchemy import Integer, String, Boolean, Float, Text, DateTime, ForeignKey, Enum, Table, Column, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
@@ -51,6 +51,22 @@ advisor_students = Table(
     Column("student_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
 )
 
+data_versions = Table(
+    "data_versions",
+    Base.metadata,
+    Column("name", String(50), primary_key=True),
+    Column("epoch", String(32), nullable=False),
+    Column("version", Integer, nullable=False, default=1),
+)
+
+# Logged-out tokens (SHA-256 hex digest) until they expire; see app.auth.
+token_revocations = Table(
+    "token_revocations",
+    Base.metadata,
+    Column("digest", String(64), primary_key=True),
+    Column("expires_at", DateTime, nullable=False, index=True),
+)
+
 
 class User(Base):
     __tablename__ = "users"
@@ -159,6 +175,19 @@ class Application(Base):
     applicant: Mapped["User"] = relationship("User", back_populates="applications", foreign_keys=[applicant_id])
 
 
+class JobMatch(Base):
+    __tablename__ = "job_matches"
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    job_id: Mapped[int] = mapped_column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    matched_technical_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    matched_soft_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    missing_technical_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    missing_soft_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Note(Base):
     __tablename__ = "notes"
 
@@ -182,11 +211,18 @@ class InterviewStatus(str, enum.Enum):
     RESCHEDULED = "rescheduled"
 
 
+# Longest bookable interview; conflict checks only look this far back.
+MAX_INTERVIEW_MINUTES = 8 * 60
+
+
 class Interview(Base):
     __tablename__ = "interviews"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     application_id: Mapped[int] = mapped_column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
+    # Copied from the application and its job, so both calendars are indexable.
+    employer_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    applicant_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     scheduled_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     duration_minutes: Mapped[int] = mapped_column(Integer, default=60, nullable=False)
     interview_type: Mapped[str] = mapped_column(String(50), default="video", nullable=False)
@@ -257,3 +293,23 @@ class LearningResource(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     skill: Mapped["Skill"] = relationship("Skill", backref="learning_resources")
+
+
+# Composite indexes backing keyset pagination: (filter, sort key, id).
+Index("ix_jobs_active_created_id", Job.is_active, Job.created_at, Job.id)
+Index("ix_jobs_employer_created_id", Job.employer_id, Job.created_at, Job.id)
+Index("ix_jobs_salary_max_id", func.coalesce(Job.salary_max, 0), Job.id)
+Index("ix_jobs_salary_min_id", func.coalesce(Job.salary_min, 0), Job.id)
+Index("ix_applications_applicant_created_id", Application.applicant_id, Application.created_at, Application.id)
+Index("ix_applications_job_score_id", Application.job_id, func.coalesce(Application.match_score, -1.0), Application.id)
+Index("ix_job_matches_student_score_job", JobMatch.student_id, JobMatch.score, JobMatch.job_id)
+Index("ix_job_matches_job", JobMatch.job_id)
+Index("ix_user_skills_skill_user", user_skills.c.skill_id, user_skills.c.user_id)
+Index("ix_notes_advisor_created_id", Note.advisor_id, Note.created_at, Note.id)
+Index("ix_notes_student_created_id", Note.student_id, Note.created_at, Note.id)
+Index("ix_interviews_application_scheduled_id", Interview.application_id, Interview.scheduled_at, Interview.id)
+Index("ix_interviews_scheduled_id", Interview.scheduled_at, Interview.id)
+Index("ix_interviews_employer_scheduled", Interview.employer_id, Interview.scheduled_at)
+Index("ix_interviews_applicant_scheduled", Interview.applicant_id, Interview.scheduled_at)
+Index("ix_notifications_user_created_id", Notification.user_id, Notification.created_at, Notification.id)
+Index("ix_career_details_title_id", CareerDetail.title, CareerDetail.id)
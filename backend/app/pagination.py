@@ -0,0 +1,133 @@
+"""
+Keyset (cursor) pagination shared by every list endpoint.
+
+A cursor is an opaque, URL-safe token encoding the sort key and id of the
+last row on the previous page, plus the name of the ordering it belongs to.
+The next page is fetched with a row-value comparison on `(sort_key, id)`,
+which a composite index answers directly, so deep pages cost the same as
+page one.
+
+List endpoints keep returning plain JSON arrays; when more rows exist the
+cursor for the next page is sent in the `X-Next-Cursor` response header.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import Select, tuple_
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+@dataclass
+class PageParams:
+    cursor: Optional[str]
+    limit: int
+
+
+def page_params(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(ordering: str, sort_value: Any, row_id: int) -> str:
+    payload = json.dumps([ordering, _encode_value(sort_value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, ordering: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_ordering, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_ordering != ordering or not isinstance(row_id, int):
+            raise ValueError("cursor does not belong to this ordering")
+        return _decode_value(sort_value), row_id
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def keyset_paginate(
+    query: Select,
+    ordering: str,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True
+) -> Select:
+    """
+    Order `query` by (sort_column, id_column), resume after `cursor`, and fetch
+    one extra row so `split_page` can tell whether another page exists.
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, ordering)
+        key = tuple_(sort_column, id_column)
+        bound = tuple_(sort_value, row_id)
+        query = query.where(key < bound if descending else key > bound)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    return query.limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[T],
+    limit: int,
+    ordering: str,
+    key: Callable[[T], Tuple[Any, int]]
+) -> Tuple[List[T], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    sort_value, row_id = key(page[-1])
+    return page, encode_cursor(ordering, sort_value, row_id)
+
+
+def paginate_sequence(
+    items: Sequence[T],
+    ordering: str,
+    key: Callable[[T], Tuple[Any, int]],
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[T], Optional[str]]:
+    """Keyset pagination over an in-memory list already sorted ascending by `key`."""
+    if cursor:
+        bound = decode_cursor(cursor, ordering)
+        items = [item for item in items if key(item) > bound]
+    return split_page(items[:limit + 1], limit, ordering, key)
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
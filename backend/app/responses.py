@@ -0,0 +1,86 @@
+"""
+Fast JSON responses for large list endpoints.
+
+FastAPI's default path validates a handler's return value against its
+`response_model` and then serializes it again. For list endpoints that
+already build their rows from trusted ORM data this doubles the work, so
+those handlers build plain dicts that mirror the response schemas and
+return them through `ORJSONResponse`, which FastAPI passes through untouched.
+
+The `response_model` on each route is kept so the OpenAPI schema is unchanged.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from starlette.responses import JSONResponse
+
+from app.schemas import (
+    SkillResponse,
+    ProfileResponse,
+    UserResponse,
+    JobResponse,
+    ApplicationResponse,
+)
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _scalar_fields(schema: Type[BaseModel], *nested: str) -> Tuple[str, ...]:
+    return tuple(name for name in schema.model_fields if name not in nested)
+
+
+SKILL_FIELDS = _scalar_fields(SkillResponse)
+PROFILE_FIELDS = _scalar_fields(ProfileResponse)
+USER_FIELDS = _scalar_fields(UserResponse, "profile", "skills")
+JOB_FIELDS = _scalar_fields(JobResponse, "required_skills", "is_expired")
+APPLICATION_FIELDS = _scalar_fields(ApplicationResponse, "job", "applicant")
+
+
+def _loaded(obj: Any, attr: str) -> Any:
+    """Return a relationship only if it is already loaded, never triggering lazy IO."""
+    if attr in inspect(obj).unloaded:
+        return None
+    return getattr(obj, attr)
+
+
+def skill_to_dict(skill) -> Dict[str, Any]:
+    return {name: getattr(skill, name) for name in SKILL_FIELDS}
+
+
+def profile_to_dict(profile) -> Optional[Dict[str, Any]]:
+    if profile is None:
+        return None
+    return {name: getattr(profile, name) for name in PROFILE_FIELDS}
+
+
+def user_to_dict(user) -> Optional[Dict[str, Any]]:
+    if user is None:
+        return None
+    data = {name: getattr(user, name) for name in USER_FIELDS}
+    data["profile"] = profile_to_dict(_loaded(user, "profile"))
+    data["skills"] = [skill_to_dict(s) for s in _loaded(user, "skills") or []]
+    return data
+
+
+def job_to_dict(job) -> Optional[Dict[str, Any]]:
+    if job is None:
+        return None
+    data = {name: getattr(job, name) for name in JOB_FIELDS}
+    data["required_skills"] = [skill_to_dict(s) for s in _loaded(job, "required_skills") or []]
+    data["is_expired"] = False
+    return data
+
+
+def application_to_dict(application, job=None, applicant=None) -> Dict[str, Any]:
+    data = {name: getattr(application, name) for name in APPLICATION_FIELDS}
+    data["job"] = job_to_dict(job if job is not None else _loaded(application, "job"))
+    data["applicant"] = user_to_dict(applicant if applicant is not None else _loaded(application, "applicant"))
+    return data
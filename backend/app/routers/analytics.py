@@ -207,18 +207,24 @@ async def get_student_performance(
     )
     students = students_result.scalars().all()
     
+    apps_result = await db.execute(
+        select(
+            Application.applicant_id,
+            func.count(Application.id).label('count'),
+            func.avg(Application.match_score).label('avg_score'),
+            Application.status
+        )
+        .where(Application.applicant_id.in_([student.id for student in students]))
+        .group_by(Application.applicant_id, Application.status)
+        .order_by(Application.applicant_id, Application.status)
+    )
+    apps_by_student: dict = {}
+    for applicant_id, *row in apps_result.all():
+        apps_by_student.setdefault(applicant_id, []).append(row)
+    
     performance_data = []
     for student in students:
-        apps_result = await db.execute(
-            select(
-                func.count(Application.id).label('count'),
-                func.avg(Application.match_score).label('avg_score'),
-                Application.status
-            )
-            .where(Application.applicant_id == student.id)
-            .group_by(Application.status)
-        )
-        apps = apps_result.fetchall()
+        apps = apps_by_student.get(student.id, [])
         
         total_apps = sum(int(row[0]) for row in apps)
         avg_score = 0.0
@@ -1,8 +1,8 @@
 from typing import List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 from app.database import get_db
 from app.models import User, Job, Application, Skill, UserRole, ApplicationStatus, advisor_students
@@ -13,9 +13,15 @@ from app.schemas import (
     BulkApplicationUpdate,
     BulkUpdateResult
 )
-from app.auth import get_current_user, require_student, require_employer
+from app.auth import Principal, get_current_user, require_student, require_student_principal, require_employer
+from app.responses import ORJSONResponse, application_to_dict
+from app.pagination import PageParams, page_params, keyset_paginate, split_page, set_next_cursor
 from app.services.ml_service import SkillData, calculate_weighted_match
-from app.services.notification_service import notify_application_submitted, notify_application_status_changed
+from app.services.notification_service import (
+    notify_application_submitted,
+    notify_application_status_changed,
+    notify_applications_status_changed
+)
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
@@ -27,24 +33,36 @@ def skill_to_skill_data(skill: Skill) -> SkillData:
 @router.get("/my-applications", response_model=List[ApplicationResponse])
 async def get_my_applications(
     current_user: User = Depends(require_student),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
+    ordering = "applications:created_at"
     result = await db.execute(
-        select(Application)
-        .options(
-            selectinload(Application.job).selectinload(Job.required_skills),
-            selectinload(Application.job).selectinload(Job.employer).selectinload(User.profile)
+        keyset_paginate(
+            select(Application)
+            .options(
+                selectinload(Application.job).selectinload(Job.required_skills),
+                selectinload(Application.job).selectinload(Job.employer).selectinload(User.profile)
+            )
+            .where(Application.applicant_id == current_user.id),
+            ordering, Application.created_at, Application.id, page.cursor, page.limit
         )
-        .where(Application.applicant_id == current_user.id)
-        .order_by(Application.created_at.desc())
     )
-    return result.scalars().all()
+    applications, next_cursor = split_page(
+        result.scalars().all(), page.limit, ordering, key=lambda a: (a.created_at, a.id)
+    )
+    response = ORJSONResponse([
+        application_to_dict(application, applicant=current_user)
+        for application in applications
+    ])
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def create_application(
     app_data: ApplicationCreate,
-    current_user: User = Depends(require_student),
+    current_user: Principal = Depends(require_student_principal),
     db: AsyncSession = Depends(get_db)
 ):
     job_result = await db.execute(
@@ -112,27 +130,43 @@ async def create_application(
 async def get_job_applications(
     job_id: int,
     current_user: User = Depends(require_employer),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
     job_result = await db.execute(
-        select(Job).where(Job.id == job_id, Job.employer_id == current_user.id)
+        select(Job)
+        .options(selectinload(Job.required_skills))
+        .where(Job.id == job_id, Job.employer_id == current_user.id)
     )
-    if not job_result.scalar_one_or_none():
+    job = job_result.scalar_one_or_none()
+    if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found or you don't have permission"
         )
     
+    ordering = "job-applications:match_score"
     result = await db.execute(
-        select(Application)
-        .options(
-            selectinload(Application.applicant).selectinload(User.profile),
-            selectinload(Application.applicant).selectinload(User.skills)
+        keyset_paginate(
+            select(Application)
+            .options(
+                selectinload(Application.applicant).selectinload(User.profile),
+                selectinload(Application.applicant).selectinload(User.skills)
+            )
+            .where(Application.job_id == job_id),
+            ordering, func.coalesce(Application.match_score, -1.0), Application.id, page.cursor, page.limit
         )
-        .where(Application.job_id == job_id)
-        .order_by(Application.match_score.desc().nullslast(), Application.created_at.desc())
     )
-    return result.scalars().all()
+    applications, next_cursor = split_page(
+        result.scalars().all(), page.limit, ordering,
+        key=lambda a: (a.match_score if a.match_score is not None else -1.0, a.id)
+    )
+    response = ORJSONResponse([
+        application_to_dict(application, job=job)
+        for application in applications
+    ])
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.put("/{application_id}/status", response_model=ApplicationResponse)
@@ -181,7 +215,8 @@ async def update_application_status(
         select(Application)
         .options(
             selectinload(Application.job).selectinload(Job.required_skills),
-            selectinload(Application.applicant).selectinload(User.profile)
+            selectinload(Application.applicant).selectinload(User.profile),
+            selectinload(Application.applicant).selectinload(User.skills)
         )
         .where(Application.id == application_id)
     )
@@ -192,8 +227,10 @@ async def update_application_status(
 async def get_student_applications(
     student_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
+    applicant = current_user
     if current_user.role == UserRole.ADVISOR:
         advisor_check = await db.execute(
             select(advisor_students).where(
@@ -206,22 +243,39 @@ async def get_student_applications(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="This student is not assigned to you"
             )
+        applicant_result = await db.execute(
+            select(User)
+            .options(selectinload(User.profile), selectinload(User.skills))
+            .where(User.id == student_id)
+        )
+        applicant = applicant_result.scalar_one()
     elif current_user.id != student_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only view your own applications"
         )
     
+    ordering = "applications:created_at"
     result = await db.execute(
-        select(Application)
-        .options(
-            selectinload(Application.job).selectinload(Job.required_skills),
-            selectinload(Application.job).selectinload(Job.employer).selectinload(User.profile)
+        keyset_paginate(
+            select(Application)
+            .options(
+                selectinload(Application.job).selectinload(Job.required_skills),
+                selectinload(Application.job).selectinload(Job.employer).selectinload(User.profile)
+            )
+            .where(Application.applicant_id == student_id),
+            ordering, Application.created_at, Application.id, page.cursor, page.limit
         )
-        .where(Application.applicant_id == student_id)
-        .order_by(Application.created_at.desc())
     )
-    return result.scalars().all()
+    applications, next_cursor = split_page(
+        result.scalars().all(), page.limit, ordering, key=lambda a: (a.created_at, a.id)
+    )
+    response = ORJSONResponse([
+        application_to_dict(application, applicant=applicant)
+        for application in applications
+    ])
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.put("/bulk-update", response_model=BulkUpdateResult)
@@ -239,16 +293,15 @@ async def bulk_update_applications(
     unauthorized_ids = []
     applications_to_update = []
     
+    result = await db.execute(
+        select(Application)
+        .options(selectinload(Application.job))
+        .where(Application.id.in_(update_data.application_ids))
+    )
+    applications_by_id = {application.id: application for application in result.scalars().all()}
+    
     for app_id in update_data.application_ids:
-        result = await db.execute(
-            select(Application)
-            .options(
-                selectinload(Application.job),
-                selectinload(Application.applicant)
-            )
-            .where(Application.id == app_id)
-        )
-        application = result.scalar_one_or_none()
+        application = applications_by_id.get(app_id)
         
         if not application:
             not_found_ids.append(app_id)
@@ -281,31 +334,19 @@ async def bulk_update_applications(
         )
     
     try:
-        notifications_to_send = []
-        
         for application in applications_to_update:
-            old_status = application.status.value
             application.status = update_data.status
             
             if update_data.feedback_notes:
                 application.feedback_notes = update_data.feedback_notes
                 application.feedback_by = current_user.id
                 application.feedback_at = datetime.utcnow()
-            
-            notifications_to_send.append((application, old_status))
         
+        await notify_applications_status_changed(
+            db, applications_to_update, update_data.status.value, update_data.feedback_notes
+        )
         await db.commit()
         
-        for application, old_status in notifications_to_send:
-            try:
-                await notify_application_status_changed(
-                    db, application, application.job,
-                    old_status, update_data.status.value,
-                    update_data.feedback_notes
-                )
-            except Exception:
-                pass
-        
         return BulkUpdateResult(
             updated_count=len(applications_to_update),
             failed_count=0,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -11,6 +11,8 @@ from app.auth import (
     create_access_token,
     set_auth_cookie,
     clear_auth_cookie,
+    revoke_token,
+    get_token_from_request,
     get_current_user
 )
 
@@ -90,7 +92,10 @@ async def login(
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    token = await get_token_from_request(request)
+    if token:
+        await revoke_token(db, token)
     clear_auth_cookie(response)
     return {"message": "Logged out successfully"}
 
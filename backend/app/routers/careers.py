@@ -1,32 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from typing import List
 from app.database import get_db
-from app.models import CareerDetail, LearningResource, Skill
-from app.schemas import CareerDetailResponse, LearningResourceResponse
+from app.schemas import CareerDetailResponse, LearningResourceResponse, LearningPlanResponse
 from app.auth import get_current_user
+from app.services.catalog_cache import catalog_conditional_get
+from app.services.reference_cache import ALL, all_careers_cache, career_cache, resource_index_cache
+from app.pagination import PageParams, page_params, paginate_sequence, set_next_cursor
 
 router = APIRouter(prefix="/careers", tags=["Career Details"])
 
 
-@router.get("", response_model=List[CareerDetailResponse])
+@router.get("", response_model=List[CareerDetailResponse], dependencies=[Depends(catalog_conditional_get)])
 async def get_all_careers(
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
-    result = await db.execute(select(CareerDetail).order_by(CareerDetail.title))
-    return result.scalars().all()
+    careers = await all_careers_cache.get(db, ALL)
+    careers, next_cursor = paginate_sequence(
+        careers, "careers:title", lambda c: (c.title, c.id), page.cursor, page.limit
+    )
+    set_next_cursor(response, next_cursor)
+    return careers
 
 
-@router.get("/{soc_code}", response_model=CareerDetailResponse)
+@router.get("/{soc_code}", response_model=CareerDetailResponse, dependencies=[Depends(catalog_conditional_get)])
 async def get_career_detail(
     soc_code: str,
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(
-        select(CareerDetail).where(CareerDetail.soc_code == soc_code)
-    )
-    career = result.scalar_one_or_none()
+    career = await career_cache.get(db, soc_code)
     
     if not career:
         raise HTTPException(
@@ -37,33 +41,38 @@ async def get_career_detail(
     return career
 
 
-@router.get("/resources/by-skill/{skill_id}", response_model=List[LearningResourceResponse])
+def parse_skill_ids(skill_ids: str) -> List[int]:
+    return [int(x.strip()) for x in skill_ids.split(",") if x.strip().isdigit()]
+
+
+@router.get("/resources/by-skill/{skill_id}", response_model=List[LearningResourceResponse], dependencies=[Depends(catalog_conditional_get)])
 async def get_resources_for_skill(
     skill_id: int,
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(
-        select(LearningResource)
-        .where(LearningResource.skill_id == skill_id)
-        .order_by(LearningResource.is_free.desc(), LearningResource.title)
-    )
-    return result.scalars().all()
+    index = await resource_index_cache.get(db, ALL)
+    return index.for_skill(skill_id)
 
 
-@router.get("/resources/for-missing-skills", response_model=List[LearningResourceResponse])
+@router.get("/resources/for-missing-skills", response_model=List[LearningResourceResponse], dependencies=[Depends(catalog_conditional_get)])
 async def get_resources_for_missing_skills(
     skill_ids: str,
+    limit: int = Query(10, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
-    ids = [int(x.strip()) for x in skill_ids.split(",") if x.strip().isdigit()]
+    ids = parse_skill_ids(skill_ids)
     
     if not ids:
         return []
     
-    result = await db.execute(
-        select(LearningResource)
-        .where(LearningResource.skill_id.in_(ids))
-        .order_by(LearningResource.is_free.desc(), LearningResource.title)
-        .limit(10)
-    )
-    return result.scalars().all()
+    index = await resource_index_cache.get(db, ALL)
+    return index.for_skills(ids, limit)
+
+
+@router.get("/resources/learning-plan", response_model=LearningPlanResponse, dependencies=[Depends(catalog_conditional_get)])
+async def get_learning_plan(
+    skill_ids: str,
+    db: AsyncSession = Depends(get_db)
+):
+    index = await resource_index_cache.get(db, ALL)
+    return index.learning_plan(parse_skill_ids(skill_ids))
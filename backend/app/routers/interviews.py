@@ -1,82 +1,172 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date, datetime, time, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy.orm import aliased, selectinload
+from typing import List, Optional
 from app.database import get_db
-from app.models import User, Application, Interview, Job, UserRole, ApplicationStatus, InterviewStatus
-from app.schemas import InterviewCreate, InterviewUpdate, InterviewResponse, InterviewWithDetails
+from app.models import User, Profile, Application, Interview, Job, UserRole, ApplicationStatus, InterviewStatus, MAX_INTERVIEW_MINUTES
+from app.schemas import InterviewCreate, InterviewUpdate, InterviewResponse, InterviewWithDetails, InterviewAvailability
 from app.auth import get_current_user
+from app.responses import ORJSONResponse
+from app.pagination import PageParams, page_params, keyset_paginate, split_page, set_next_cursor
+from app.services.interview_schedule import (
+    conflict_detail, find_availability, find_conflicts, is_conflict_error, round_up
+)
 
 router = APIRouter(prefix="/interviews", tags=["Interviews"])
 
+MAX_AVAILABILITY_DAYS = 31
+SLOT_GRANULARITY_MINUTES = 15
+
+
+async def commit_booking(db: AsyncSession):
+    try:
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
+        if not is_conflict_error(error):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An interview was just booked that overlaps this time"
+        )
+
+
+ApplicantUser = aliased(User)
+ApplicantProfile = aliased(Profile)
+EmployerProfile = aliased(Profile)
+
+INTERVIEW_DETAIL_COLUMNS = (
+    Interview.id,
+    Interview.application_id,
+    Interview.scheduled_at,
+    Interview.duration_minutes,
+    Interview.interview_type,
+    Interview.location,
+    Interview.meeting_link,
+    Interview.notes,
+    Interview.status,
+    Interview.created_at,
+    Interview.updated_at,
+    ApplicantUser.email.label("applicant_email"),
+    ApplicantProfile.id.label("applicant_profile_id"),
+    ApplicantProfile.first_name.label("applicant_first_name"),
+    ApplicantProfile.last_name.label("applicant_last_name"),
+    Job.title.label("job_title"),
+    EmployerProfile.company_name.label("company_name"),
+)
+
+
+def interview_details(row) -> dict:
+    details = dict(row._mapping)
+    profile_id = details.pop("applicant_profile_id")
+    first_name = details.pop("applicant_first_name")
+    last_name = details.pop("applicant_last_name")
+    details["applicant_name"] = f"{first_name} {last_name}" if profile_id is not None else details["applicant_email"]
+    details["company_name"] = details["company_name"] or "Unknown Company"
+    return details
+
 
 @router.get("", response_model=List[InterviewWithDetails])
 async def get_my_interviews(
+    start_date: Optional[date] = Query(None, description="Only interviews on or after this day"),
+    end_date: Optional[date] = Query(None, description="Only interviews on or before this day"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
     if current_user.role == UserRole.EMPLOYER:
-        result = await db.execute(
-            select(Interview)
-            .join(Application)
-            .join(Job)
-            .where(Job.employer_id == current_user.id)
-            .options(
-                selectinload(Interview.application)
-                .selectinload(Application.job),
-                selectinload(Interview.application)
-                .selectinload(Application.applicant)
-                .selectinload(User.profile)
-            )
-            .order_by(Interview.scheduled_at)
-        )
+        participant = Interview.employer_id
     elif current_user.role == UserRole.STUDENT:
-        result = await db.execute(
-            select(Interview)
-            .join(Application)
-            .where(Application.applicant_id == current_user.id)
-            .options(
-                selectinload(Interview.application)
-                .selectinload(Application.job)
-                .selectinload(Job.employer)
-                .selectinload(User.profile),
-                selectinload(Interview.application)
-                .selectinload(Application.applicant)
-                .selectinload(User.profile)
-            )
-            .order_by(Interview.scheduled_at)
-        )
+        participant = Interview.applicant_id
     else:
         return []
     
-    interviews = result.scalars().all()
-    response = []
-    for interview in interviews:
-        app = interview.application
-        applicant = app.applicant
-        job = app.job
-        employer = job.employer if hasattr(job, 'employer') else None
-        
-        response.append(InterviewWithDetails(
-            id=interview.id,
-            application_id=interview.application_id,
-            scheduled_at=interview.scheduled_at,
-            duration_minutes=interview.duration_minutes,
-            interview_type=interview.interview_type,
-            location=interview.location,
-            meeting_link=interview.meeting_link,
-            notes=interview.notes,
-            status=interview.status,
-            created_at=interview.created_at,
-            updated_at=interview.updated_at,
-            applicant_name=f"{applicant.profile.first_name} {applicant.profile.last_name}" if applicant.profile else applicant.email,
-            applicant_email=applicant.email,
-            job_title=job.title,
-            company_name=employer.profile.company_name if employer and employer.profile else "Unknown Company"
-        ))
-    
-    return response
+    ordering = "interviews:scheduled_at"
+    query = (
+        select(*INTERVIEW_DETAIL_COLUMNS)
+        .join(Application, Application.id == Interview.application_id)
+        .join(Job, Job.id == Application.job_id)
+        .join(ApplicantUser, ApplicantUser.id == Interview.applicant_id)
+        .outerjoin(ApplicantProfile, ApplicantProfile.user_id == Interview.applicant_id)
+        .outerjoin(EmployerProfile, EmployerProfile.user_id == Interview.employer_id)
+        .where(participant == current_user.id)
+    )
+    if start_date:
+        query = query.where(Interview.scheduled_at >= datetime.combine(start_date, time()))
+    if end_date:
+        query = query.where(Interview.scheduled_at < datetime.combine(end_date + timedelta(days=1), time()))
+    
+    result = await db.execute(
+        keyset_paginate(query, ordering, Interview.scheduled_at, Interview.id, page.cursor, page.limit, descending=False)
+    )
+    rows, next_cursor = split_page(
+        result.all(), page.limit, ordering, key=lambda row: (row.scheduled_at, row.id)
+    )
+    
+    json_response = ORJSONResponse([interview_details(row) for row in rows])
+    set_next_cursor(json_response, next_cursor)
+    return json_response
+
+
+@router.get("/availability", response_model=InterviewAvailability)
+async def get_availability(
+    application_id: int,
+    start_date: date = Query(..., description="First day to search"),
+    end_date: Optional[date] = Query(None, description="Last day to search (default: 13 days after start_date)"),
+    duration_minutes: int = Query(60, ge=5, le=MAX_INTERVIEW_MINUTES),
+    buffer_minutes: int = Query(15, ge=0, le=120, description="Free time kept before and after other interviews"),
+    day_start: time = Query(time(9, 0), description="Start of working hours"),
+    day_end: time = Query(time(17, 0), description="End of working hours"),
+    include_weekends: bool = Query(False),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if current_user.role != UserRole.EMPLOYER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only employers can search interview availability"
+        )
+    
+    end_date = end_date or start_date + timedelta(days=13)
+    if end_date < start_date or (end_date - start_date).days >= MAX_AVAILABILITY_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"end_date must be on or after start_date and within {MAX_AVAILABILITY_DAYS} days of it"
+        )
+    if day_end <= day_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="day_end must be after day_start"
+        )
+    
+    result = await db.execute(
+        select(Application.applicant_id)
+        .join(Job)
+        .where(Application.id == application_id)
+        .where(Job.employer_id == current_user.id)
+    )
+    applicant_id = result.scalar_one_or_none()
+    
+    if applicant_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found or you don't have permission"
+        )
+    
+    slots = await find_availability(
+        db, current_user.id, applicant_id, start_date, end_date, duration_minutes, buffer_minutes,
+        day_start, day_end, include_weekends,
+        not_before=round_up(datetime.utcnow(), SLOT_GRANULARITY_MINUTES)
+    )
+    return {
+        "application_id": application_id,
+        "duration_minutes": duration_minutes,
+        "buffer_minutes": buffer_minutes,
+        "slots": [{"start": start, "end": end} for start, end in slots]
+    }
 
 
 @router.post("", response_model=InterviewResponse, status_code=status.HTTP_201_CREATED)
@@ -106,27 +196,21 @@ async def schedule_interview(
             detail="Application not found or you don't have permission"
         )
     
-    from datetime import timedelta
-    start_time = interview_data.scheduled_at
-    end_time = start_time + timedelta(minutes=interview_data.duration_minutes)
-    
-    existing = await db.execute(
-        select(Interview)
-        .where(Interview.application_id == interview_data.application_id)
-        .where(Interview.status != InterviewStatus.CANCELLED)
-        .where(Interview.scheduled_at < end_time)
-        .where(Interview.scheduled_at + timedelta(minutes=60) > start_time)
+    conflicts = await find_conflicts(
+        db, current_user.id, application.applicant_id, interview_data.scheduled_at, interview_data.duration_minutes
     )
-    if existing.scalar_one_or_none():
+    if conflicts:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="An interview is already scheduled for this time"
+            detail=conflict_detail(conflicts, current_user.id, current_user.id)
         )
     
     application.status = ApplicationStatus.INTERVIEW
     
     interview = Interview(
         application_id=interview_data.application_id,
+        employer_id=current_user.id,
+        applicant_id=application.applicant_id,
         scheduled_at=interview_data.scheduled_at,
         duration_minutes=interview_data.duration_minutes,
         interview_type=interview_data.interview_type,
@@ -136,7 +220,7 @@ async def schedule_interview(
     )
     
     db.add(interview)
-    await db.commit()
+    await commit_booking(db)
     await db.refresh(interview)
     
     return interview
@@ -171,7 +255,19 @@ async def update_interview(
     for field, value in update_dict.items():
         setattr(interview, field, value)
     
-    await db.commit()
+    moved = {"scheduled_at", "duration_minutes", "status"} & update_dict.keys()
+    if moved and interview.status != InterviewStatus.CANCELLED:
+        conflicts = await find_conflicts(
+            db, interview.employer_id, interview.applicant_id, interview.scheduled_at,
+            interview.duration_minutes, exclude_id=interview.id
+        )
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=conflict_detail(conflicts, interview.employer_id, current_user.id)
+            )
+    
+    await commit_booking(db)
     await db.refresh(interview)
     
     return interview
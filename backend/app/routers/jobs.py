@@ -1,38 +1,156 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional, Set
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, literal
 from sqlalchemy.orm import selectinload
 from app.database import get_db
-from app.models import User, Job, Skill, Application, UserRole, advisor_students
+from app.models import User, Job, JobMatch, Skill, Application, UserRole, advisor_students, job_skills
 from app.schemas import (
     JobCreate,
     JobUpdate,
     JobResponse,
     JobWithMatch,
-    SkillGapAnalysis
+    SkillGapAnalysis,
+    SkillGapBatchRequest,
+    SkillGapBatchResponse
 )
-from app.auth import get_current_user, require_employer
+from app.auth import Principal, get_current_user, require_employer, require_employer_principal
+from app.responses import ORJSONResponse, JOB_FIELDS, job_to_dict, skill_to_dict
+from app.pagination import PageParams, page_params, decode_cursor, keyset_paginate, split_page, set_next_cursor
+from app.services.reference_cache import ALL, skill_index_cache
+from app.services.match_store import MATCH_SCORE_FLOOR, remove_job_matches
+from app.services.invalidation_bus import JOB_TOPIC, invalidation_bus
+from app.services.application_scores import enqueue_job_matches, enqueue_job_rescore
 from app.services.ml_service import (
     SkillData,
+    MatchResult,
     calculate_weighted_match,
     get_skill_gap_analysis
 )
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+LIST_FIELDS = tuple(JobWithMatch.model_fields)
+# Job.description is the one large column; it is only read when `fields` names it.
+DEFERRED_LIST_FIELDS = ("description",)
+DEFAULT_LIST_FIELDS = tuple(name for name in LIST_FIELDS if name not in DEFERRED_LIST_FIELDS)
+LIST_KEY_COLUMNS = ("id", "created_at", "salary_min", "salary_max")
+UNRANKED = -1.0
+
 
 def skill_to_skill_data(skill: Skill) -> SkillData:
     return SkillData(id=skill.id, name=skill.name, is_technical=skill.is_technical)
 
 
+def parse_list_fields(fields: Optional[str]) -> Set[str]:
+    if not fields:
+        return set(DEFAULT_LIST_FIELDS)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(LIST_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    requested.add("id")
+    return requested
+
+
+async def page_jobs_by_column(
+    db: AsyncSession,
+    query,
+    sort_by: Optional[str],
+    cursor: Optional[str],
+    limit: int,
+    descending: bool
+):
+    if sort_by == "salary":
+        salary_field = "salary_max" if descending else "salary_min"
+        order_col = func.coalesce(getattr(Job, salary_field), 0)
+        sort_value = lambda row: getattr(row, salary_field) or 0
+    else:
+        salary_field = None
+        order_col = Job.created_at
+        sort_value = lambda row: row.created_at
+    ordering = f"jobs:{salary_field or 'created_at'}:{'desc' if descending else 'asc'}"
+    
+    query = keyset_paginate(query, ordering, order_col, Job.id, cursor, limit, descending=descending)
+    result = await db.execute(query)
+    return split_page(result.all(), limit, ordering, key=lambda row: (sort_value(row), row.id))
+
+
+async def rank_jobs_by_match(
+    db: AsyncSession,
+    query,
+    student_id: int,
+    ordering: str,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool
+):
+    """
+    Page through jobs ordered by stored match score, then id.
+
+    Stored matches come from a range scan on job_matches. Jobs at or below the
+    match floor have no row; they rank as UNRANKED and are ordered by id alone,
+    after the stored matches when descending and before them when ascending.
+    """
+    stored = and_(JobMatch.student_id == student_id, JobMatch.job_id == Job.id)
+    ranked = query.join(JobMatch, stored).add_columns(JobMatch.score.label("match_rank"))
+    unranked = query.where(~select(JobMatch.job_id).where(stored).exists()).add_columns(
+        literal(UNRANKED).label("match_rank")
+    )
+    
+    bound = decode_cursor(cursor, ordering) if cursor else None
+    in_unranked = bound is not None and bound[0] == UNRANKED
+    ranked_rows = []
+    unranked_rows = []
+    
+    if descending:
+        if not in_unranked:
+            ranked_rows = (await db.execute(
+                keyset_paginate(ranked, ordering, JobMatch.score, Job.id, cursor, limit, descending=True)
+            )).all()
+        if len(ranked_rows) <= limit:
+            if in_unranked:
+                unranked = unranked.where(Job.id < bound[1])
+            unranked_rows = (await db.execute(
+                unranked.order_by(Job.id.desc()).limit(limit + 1 - len(ranked_rows))
+            )).all()
+        rows = ranked_rows + unranked_rows
+    else:
+        if bound is None or in_unranked:
+            if in_unranked:
+                unranked = unranked.where(Job.id > bound[1])
+            unranked_rows = (await db.execute(unranked.order_by(Job.id.asc()).limit(limit + 1))).all()
+        if len(unranked_rows) <= limit:
+            ranked_cursor = cursor if bound is not None and not in_unranked else None
+            ranked_rows = (await db.execute(
+                keyset_paginate(ranked, ordering, JobMatch.score, Job.id, ranked_cursor, limit - len(unranked_rows), descending=False)
+            )).all()
+        rows = unranked_rows + ranked_rows
+    
+    return split_page(rows, limit, ordering, key=lambda row: (row.match_rank, row.id))
+
+
+def job_with_match_to_dict(job: Job, match_result: MatchResult) -> dict:
+    data = job_to_dict(job)
+    data["match_score"] = round(match_result.score * 100, 1)
+    data["matched_technical"] = match_result.matched_technical
+    data["matched_soft"] = match_result.matched_soft
+    data["missing_technical"] = match_result.missing_technical
+    data["missing_soft"] = match_result.missing_soft
+    return data
+
+
 @router.get("", response_model=List[JobWithMatch])
 async def list_jobs(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     active_only: bool = Query(True),
-    limit: int = Query(50, le=100),
-    offset: int = Query(0),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return (default: all but description)"),
     search: Optional[str] = Query(None, description="Search in title and description"),
     location: Optional[str] = Query(None, description="Filter by location"),
     min_salary: Optional[int] = Query(None, description="Minimum salary"),
@@ -41,12 +159,11 @@ async def list_jobs(
     job_type: Optional[str] = Query(None, description="Job type: full-time, part-time, contract, internship"),
     min_match_score: Optional[int] = Query(None, description="Minimum match score (0-100)"),
     sort_by: Optional[str] = Query("created_at", description="Sort by: created_at, match_score, salary"),
-    sort_order: Optional[str] = Query("desc", description="Sort order: asc, desc")
+    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order: asc, desc")
 ):
-    query = select(Job).options(
-        selectinload(Job.required_skills),
-        selectinload(Job.employer).selectinload(User.profile)
-    )
+    field_set = parse_list_fields(fields)
+    columns = [name for name in JOB_FIELDS if name in field_set or name in LIST_KEY_COLUMNS]
+    query = select(*(getattr(Job, name) for name in columns))
     
     if active_only:
         query = query.where(Job.is_active == True)
@@ -72,78 +189,87 @@ async def list_jobs(
     if job_type:
         query = query.where(Job.job_type.ilike(f"%{job_type}%"))
     
-    if sort_by == "salary":
-        order_col = Job.salary_max if sort_order == "desc" else Job.salary_min
-    else:
-        order_col = Job.created_at
+    if min_match_score is not None and min_match_score > MATCH_SCORE_FLOOR:
+        query = query.where(
+            select(JobMatch.job_id).where(
+                JobMatch.student_id == current_user.id,
+                JobMatch.job_id == Job.id,
+                JobMatch.score >= min_match_score
+            ).exists()
+        )
     
-    if sort_order == "asc":
-        query = query.order_by(order_col.asc())
+    descending = sort_order == "desc"
+    if sort_by == "match_score":
+        ordering = f"jobs:match_score:{'desc' if descending else 'asc'}"
+        rows, next_cursor = await rank_jobs_by_match(db, query, current_user.id, ordering, cursor, limit, descending)
     else:
-        query = query.order_by(order_col.desc())
-    
-    query = query.limit(limit).offset(offset)
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+        rows, next_cursor = await page_jobs_by_column(db, query, sort_by, cursor, limit, descending)
+    
+    skill_ids_by_job = {row.id: [] for row in rows}
+    if skill_ids_by_job:
+        skill_result = await db.execute(
+            select(job_skills.c.job_id, job_skills.c.skill_id)
+            .where(job_skills.c.job_id.in_(list(skill_ids_by_job)))
+            .order_by(job_skills.c.job_id, job_skills.c.skill_id)
+        )
+        for job_id, skill_id in skill_result.all():
+            skill_ids_by_job[job_id].append(skill_id)
     
-    user_result = await db.execute(
-        select(User).options(selectinload(User.skills)).where(User.id == current_user.id)
-    )
-    user = user_result.scalar_one()
-    candidate_skills = [skill_to_skill_data(s) for s in user.skills]
+    skill_index = await skill_index_cache.get(db, ALL)
+    skill_data = {skill_id: skill_to_skill_data(skill) for skill_id, skill in skill_index.items()}
+    skill_dicts = {}
+    candidate_skills = [skill_to_skill_data(s) for s in current_user.skills]
     
     jobs_with_match = []
-    for job in jobs:
-        job_skills = [skill_to_skill_data(s) for s in job.required_skills]
-        match_result = calculate_weighted_match(candidate_skills, job_skills)
+    for row in rows:
+        skill_ids = [skill_id for skill_id in skill_ids_by_job[row.id] if skill_id in skill_index]
+        match_result = calculate_weighted_match(candidate_skills, [skill_data[skill_id] for skill_id in skill_ids])
+        match_score = round(match_result.score * 100, 1)
         
-        job_data = JobWithMatch(
-            id=job.id,
-            employer_id=job.employer_id,
-            title=job.title,
-            description=job.description,
-            location=job.location,
-            salary_min=job.salary_min,
-            salary_max=job.salary_max,
-            job_type=job.job_type,
-            experience_level=job.experience_level,
-            onet_soc_code=job.onet_soc_code,
-            deadline=job.deadline,
-            is_active=job.is_active,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            required_skills=job.required_skills,
-            match_score=round(match_result.score * 100, 1),
-            matched_technical=match_result.matched_technical,
-            matched_soft=match_result.matched_soft,
-            missing_technical=match_result.missing_technical,
-            missing_soft=match_result.missing_soft
-        )
-        if min_match_score is None or job_data.match_score >= min_match_score:
-            jobs_with_match.append(job_data)
-    
-    if sort_by == "match_score":
-        jobs_with_match.sort(key=lambda x: x.match_score, reverse=(sort_order == "desc"))
-    elif sort_by == "salary":
-        jobs_with_match.sort(key=lambda x: x.salary_max or 0, reverse=(sort_order == "desc"))
-    else:
-        jobs_with_match.sort(key=lambda x: x.match_score, reverse=True)
-    
-    return jobs_with_match
+        job_data = {name: getattr(row, name) for name in columns if name in field_set}
+        if "required_skills" in field_set:
+            for skill_id in skill_ids:
+                if skill_id not in skill_dicts:
+                    skill_dicts[skill_id] = skill_to_dict(skill_index[skill_id])
+            job_data["required_skills"] = [skill_dicts[skill_id] for skill_id in skill_ids]
+        if "is_expired" in field_set:
+            job_data["is_expired"] = False
+        match_data = {
+            "match_score": match_score,
+            "matched_technical": match_result.matched_technical,
+            "matched_soft": match_result.matched_soft,
+            "missing_technical": match_result.missing_technical,
+            "missing_soft": match_result.missing_soft
+        }
+        for name, value in match_data.items():
+            if name in field_set:
+                job_data[name] = value
+        jobs_with_match.append(job_data)
+    
+    response = ORJSONResponse(jobs_with_match)
+    set_next_cursor(response, next_cursor)
+    return response
 
 
 @router.get("/my-jobs", response_model=List[JobResponse])
 async def get_my_jobs(
-    current_user: User = Depends(require_employer),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(require_employer_principal),
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
+    ordering = "my-jobs:created_at"
     result = await db.execute(
-        select(Job)
-        .options(selectinload(Job.required_skills))
-        .where(Job.employer_id == current_user.id)
-        .order_by(Job.created_at.desc())
+        keyset_paginate(
+            select(Job)
+            .options(selectinload(Job.required_skills))
+            .where(Job.employer_id == current_user.id),
+            ordering, Job.created_at, Job.id, page.cursor, page.limit
+        )
     )
-    return result.scalars().all()
+    jobs, next_cursor = split_page(result.scalars().all(), page.limit, ordering, key=lambda job: (job.created_at, job.id))
+    set_next_cursor(response, next_cursor)
+    return jobs
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -170,7 +296,10 @@ async def create_job(
         required_skills=list(skills)
     )
     db.add(job)
+    await db.flush()
+    await invalidation_bus.publish(db, JOB_TOPIC, job.id)
     await db.commit()
+    enqueue_job_matches(job.id)
     await db.refresh(job)
     
     result = await db.execute(
@@ -206,28 +335,7 @@ async def get_job(
     job_skills = [skill_to_skill_data(s) for s in job.required_skills]
     match_result = calculate_weighted_match(candidate_skills, job_skills)
     
-    return JobWithMatch(
-        id=job.id,
-        employer_id=job.employer_id,
-        title=job.title,
-        description=job.description,
-        location=job.location,
-        salary_min=job.salary_min,
-        salary_max=job.salary_max,
-        job_type=job.job_type,
-        experience_level=job.experience_level,
-        onet_soc_code=job.onet_soc_code,
-        deadline=job.deadline,
-        is_active=job.is_active,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        required_skills=job.required_skills,
-        match_score=round(match_result.score * 100, 1),
-        matched_technical=match_result.matched_technical,
-        matched_soft=match_result.matched_soft,
-        missing_technical=match_result.missing_technical,
-        missing_soft=match_result.missing_soft
-    )
+    return job_with_match_to_dict(job, match_result)
 
 
 @router.put("/{job_id}", response_model=JobResponse)
@@ -251,6 +359,8 @@ async def update_job(
         )
     
     update_data = job_data.model_dump(exclude_unset=True)
+    skills_changed = "required_skill_ids" in update_data
+    matching_changed = skills_changed or "is_active" in update_data
     
     if "required_skill_ids" in update_data:
         skill_ids = update_data.pop("required_skill_ids")
@@ -260,7 +370,14 @@ async def update_job(
     for field, value in update_data.items():
         setattr(job, field, value)
     
+    if matching_changed and not job.is_active:
+        await remove_job_matches(db, job.id)
+    await invalidation_bus.publish(db, JOB_TOPIC, job.id)
     await db.commit()
+    if matching_changed and job.is_active:
+        enqueue_job_matches(job.id)
+    if skills_changed:
+        enqueue_job_rescore(job.id)
     await db.refresh(job)
     return job
 
@@ -282,29 +399,18 @@ async def delete_job(
             detail="Job not found or you don't have permission"
         )
     
+    await remove_job_matches(db, job.id)
     await db.delete(job)
+    await invalidation_bus.publish(db, JOB_TOPIC, job.id)
     await db.commit()
     return {"message": "Job deleted successfully"}
 
 
-@router.get("/{job_id}/skill-gap", response_model=SkillGapAnalysis)
-async def get_job_skill_gap(
-    job_id: int,
-    user_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    result = await db.execute(
-        select(Job).options(selectinload(Job.required_skills)).where(Job.id == job_id)
-    )
-    job = result.scalar_one_or_none()
-    
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
-    
+async def load_gap_candidate(
+    db: AsyncSession,
+    current_user: User,
+    user_id: Optional[int]
+) -> User:
     target_user_id = user_id if user_id and current_user.role in [UserRole.EMPLOYER, UserRole.ADVISOR] else current_user.id
     
     if user_id and current_user.role == UserRole.ADVISOR:
@@ -320,6 +426,9 @@ async def get_job_skill_gap(
                 detail="This student is not assigned to you"
             )
     
+    if target_user_id == current_user.id:
+        return current_user
+    
     user_result = await db.execute(
         select(User).options(selectinload(User.skills)).where(User.id == target_user_id)
     )
@@ -330,6 +439,90 @@ async def get_job_skill_gap(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    return user
+
+
+def skill_refs(names: List[str], job_skill_map: dict) -> List[dict]:
+    refs = []
+    for skill_name in names:
+        skill = job_skill_map.get(skill_name.lower())
+        if skill:
+            refs.append({"id": skill.id, "name": skill.name})
+    return refs
+
+
+@router.post("/skill-gap/batch", response_model=SkillGapBatchResponse)
+async def get_batch_skill_gap(
+    request: SkillGapBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    user = await load_gap_candidate(db, current_user, request.user_id)
+    candidate_skills = [skill_to_skill_data(s) for s in user.skills]
+    job_ids = list(dict.fromkeys(request.job_ids))
+    
+    title_result = await db.execute(select(Job.id, Job.title).where(Job.id.in_(job_ids)))
+    titles = dict(title_result.all())
+    skill_result = await db.execute(
+        select(job_skills.c.job_id, job_skills.c.skill_id)
+        .where(job_skills.c.job_id.in_(job_ids))
+        .order_by(job_skills.c.job_id, job_skills.c.skill_id)
+    )
+    skill_ids_by_job = {job_id: [] for job_id in titles}
+    for job_id, skill_id in skill_result.all():
+        skill_ids_by_job[job_id].append(skill_id)
+    
+    skill_index = await skill_index_cache.get(db, ALL)
+    gaps = []
+    missing_by_skill = {}
+    for job_id in job_ids:
+        if job_id not in titles:
+            continue
+        requirements = [skill_index[skill_id] for skill_id in skill_ids_by_job[job_id] if skill_id in skill_index]
+        analysis = get_skill_gap_analysis(candidate_skills, [skill_to_skill_data(s) for s in requirements])
+        
+        job_skill_map = {s.name.lower(): s for s in requirements}
+        analysis["missing_technical_skills"] = skill_refs(analysis["missing_technical"], job_skill_map)
+        analysis["missing_soft_skills"] = skill_refs(analysis["missing_soft"], job_skill_map)
+        gaps.append({"job_id": job_id, "job_title": titles[job_id], **analysis})
+        
+        for ref in analysis["missing_technical_skills"] + analysis["missing_soft_skills"]:
+            missing_by_skill.setdefault(ref["id"], []).append(job_id)
+    
+    most_missing = [
+        {
+            "id": skill_id,
+            "name": skill_index[skill_id].name,
+            "is_technical": skill_index[skill_id].is_technical,
+            "missing_count": len(missing_job_ids),
+            "job_ids": missing_job_ids
+        }
+        for skill_id, missing_job_ids in missing_by_skill.items()
+    ]
+    most_missing.sort(key=lambda item: (-item["missing_count"], not item["is_technical"], item["name"]))
+    
+    return {"gaps": gaps, "most_missing": most_missing}
+
+
+@router.get("/{job_id}/skill-gap", response_model=SkillGapAnalysis)
+async def get_job_skill_gap(
+    job_id: int,
+    user_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    result = await db.execute(
+        select(Job).options(selectinload(Job.required_skills)).where(Job.id == job_id)
+    )
+    job = result.scalar_one_or_none()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    user = await load_gap_candidate(db, current_user, user_id)
     
     candidate_skills = [skill_to_skill_data(s) for s in user.skills]
     job_skills = [skill_to_skill_data(s) for s in job.required_skills]
@@ -337,20 +530,7 @@ async def get_job_skill_gap(
     analysis = get_skill_gap_analysis(candidate_skills, job_skills)
     
     job_skill_map = {s.name.lower(): s for s in job.required_skills}
-    missing_technical_skills = []
-    missing_soft_skills = []
-    
-    for skill_name in analysis.get("missing_technical", []):
-        skill = job_skill_map.get(skill_name.lower())
-        if skill:
-            missing_technical_skills.append({"id": skill.id, "name": skill.name})
-    
-    for skill_name in analysis.get("missing_soft", []):
-        skill = job_skill_map.get(skill_name.lower())
-        if skill:
-            missing_soft_skills.append({"id": skill.id, "name": skill.name})
-    
-    analysis["missing_technical_skills"] = missing_technical_skills
-    analysis["missing_soft_skills"] = missing_soft_skills
+    analysis["missing_technical_skills"] = skill_refs(analysis.get("missing_technical", []), job_skill_map)
+    analysis["missing_soft_skills"] = skill_refs(analysis.get("missing_soft", []), job_skill_map)
     
     return SkillGapAnalysis(**analysis)
@@ -1,11 +1,15 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
-from app.models import User, Note, UserRole, advisor_students
-from app.schemas import NoteCreate, NoteUpdate, NoteResponse
-from app.auth import get_current_user, require_advisor
+from app.models import Note, UserRole, advisor_students
+from app.schemas import NoteCreate, NoteUpdate, NoteResponse, NoteSearchResult
+from app.auth import Principal, get_current_principal, require_advisor_principal
+from app.pagination import PageParams, page_params, keyset_paginate, split_page, set_next_cursor
+from app.services.invalidation_bus import NOTE_TOPIC, invalidation_bus
+from app.services.note_search import USE_POSTGRES_FTS, search_notes
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
@@ -13,8 +17,10 @@ router = APIRouter(prefix="/notes", tags=["Notes"])
 @router.get("/student/{student_id}", response_model=List[NoteResponse])
 async def get_student_notes(
     student_id: int,
-    current_user: User = Depends(require_advisor),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(require_advisor_principal),
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
     advisor_check = await db.execute(
         select(advisor_students).where(
@@ -28,18 +34,22 @@ async def get_student_notes(
             detail="This student is not assigned to you"
         )
     
+    ordering = "notes:created_at"
     result = await db.execute(
-        select(Note)
-        .where(Note.advisor_id == current_user.id, Note.student_id == student_id)
-        .order_by(Note.created_at.desc())
+        keyset_paginate(
+            select(Note).where(Note.advisor_id == current_user.id, Note.student_id == student_id),
+            ordering, Note.created_at, Note.id, page.cursor, page.limit
+        )
     )
-    return result.scalars().all()
+    notes, next_cursor = split_page(result.scalars().all(), page.limit, ordering, key=lambda n: (n.created_at, n.id))
+    set_next_cursor(response, next_cursor)
+    return notes
 
 
 @router.post("", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_note(
     note_data: NoteCreate,
-    current_user: User = Depends(require_advisor),
+    current_user: Principal = Depends(require_advisor_principal),
     db: AsyncSession = Depends(get_db)
 ):
     advisor_check = await db.execute(
@@ -61,6 +71,8 @@ async def create_note(
         note_type=note_data.note_type
     )
     db.add(note)
+    if not USE_POSTGRES_FTS:
+        await invalidation_bus.publish(db, NOTE_TOPIC, current_user.id)
     await db.commit()
     await db.refresh(note)
     return note
@@ -70,7 +82,7 @@ async def create_note(
 async def update_note(
     note_id: int,
     note_data: NoteUpdate,
-    current_user: User = Depends(require_advisor),
+    current_user: Principal = Depends(require_advisor_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -87,6 +99,8 @@ async def update_note(
     for field, value in note_data.model_dump(exclude_unset=True).items():
         setattr(note, field, value)
     
+    if not USE_POSTGRES_FTS:
+        await invalidation_bus.publish(db, NOTE_TOPIC, current_user.id)
     await db.commit()
     await db.refresh(note)
     return note
@@ -95,7 +109,7 @@ async def update_note(
 @router.delete("/{note_id}")
 async def delete_note(
     note_id: int,
-    current_user: User = Depends(require_advisor),
+    current_user: Principal = Depends(require_advisor_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -110,25 +124,49 @@ async def delete_note(
         )
     
     await db.delete(note)
+    if not USE_POSTGRES_FTS:
+        await invalidation_bus.publish(db, NOTE_TOPIC, current_user.id)
     await db.commit()
     return {"message": "Note deleted successfully"}
 
 
 @router.get("/my-notes", response_model=List[NoteResponse])
 async def get_my_notes(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
     if current_user.role == UserRole.STUDENT:
-        result = await db.execute(
-            select(Note)
-            .where(Note.student_id == current_user.id)
-            .order_by(Note.created_at.desc())
-        )
+        query = select(Note).where(Note.student_id == current_user.id)
     else:
-        result = await db.execute(
-            select(Note)
-            .where(Note.advisor_id == current_user.id)
-            .order_by(Note.created_at.desc())
-        )
-    return result.scalars().all()
+        query = select(Note).where(Note.advisor_id == current_user.id)
+    
+    ordering = "notes:created_at"
+    result = await db.execute(
+        keyset_paginate(query, ordering, Note.created_at, Note.id, page.cursor, page.limit)
+    )
+    notes, next_cursor = split_page(result.scalars().all(), page.limit, ordering, key=lambda n: (n.created_at, n.id))
+    set_next_cursor(response, next_cursor)
+    return notes
+
+
+@router.get("/search", response_model=List[NoteSearchResult])
+async def search_my_notes(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; -word excludes"),
+    note_type: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None, description="Only notes written on or after this day"),
+    end_date: Optional[date] = Query(None, description="Only notes written on or before this day"),
+    current_user: Principal = Depends(require_advisor_principal),
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
+):
+    hits, next_cursor = await search_notes(
+        db, current_user.id, q, note_type, start_date, end_date, page.cursor, page.limit
+    )
+    set_next_cursor(response, next_cursor)
+    return [
+        NoteSearchResult(**note.model_dump(), rank=rank, highlight=highlight)
+        for rank, note, highlight in hits
+    ]
@@ -1,20 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, func
-from typing import List
+from typing import List, Optional
 from app.database import get_db
-from app.models import User, Notification
+from app.models import Notification
 from app.schemas import NotificationResponse
-from app.auth import get_current_user
+from app.auth import Principal, get_current_principal
+from app.pagination import MAX_PAGE_SIZE, keyset_paginate, split_page, set_next_cursor
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 @router.get("", response_model=List[NotificationResponse])
 async def get_my_notifications(
-    limit: int = 20,
+    response: Response,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
     unread_only: bool = False,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     query = select(Notification).where(Notification.user_id == current_user.id)
@@ -22,15 +25,20 @@ async def get_my_notifications(
     if unread_only:
         query = query.where(Notification.is_read == False)
     
-    query = query.order_by(Notification.created_at.desc()).limit(limit)
-    
-    result = await db.execute(query)
-    return result.scalars().all()
+    ordering = "notifications:created_at"
+    result = await db.execute(
+        keyset_paginate(query, ordering, Notification.created_at, Notification.id, cursor, limit)
+    )
+    notifications, next_cursor = split_page(
+        result.scalars().all(), limit, ordering, key=lambda n: (n.created_at, n.id)
+    )
+    set_next_cursor(response, next_cursor)
+    return notifications
 
 
 @router.get("/unread-count")
 async def get_unread_count(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -45,7 +53,7 @@ async def get_unread_count(
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_as_read(
     notification_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -70,7 +78,7 @@ async def mark_as_read(
 
 @router.put("/read-all")
 async def mark_all_as_read(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     await db.execute(
@@ -2,7 +2,7 @@ import os
 import uuid
 from pathlib import Path
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, delete
@@ -19,12 +19,14 @@ from app.schemas import (
     UserSkillsUpdate,
     ProfileCompletionResponse
 )
-from app.auth import get_current_user, require_advisor
+from app.auth import Principal, get_current_user, require_advisor_principal
+from app.pagination import PageParams, page_params, keyset_paginate, split_page, set_next_cursor
+from app.services.match_store import refresh_student_matches
+from app.services.application_scores import enqueue_student_rescore
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 UPLOAD_DIR = Path(__file__).parent.parent.parent / "uploads"
-UPLOAD_DIR.mkdir(exist_ok=True)
 ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx'}
 
 
@@ -78,6 +80,7 @@ async def upload_resume(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
+    UPLOAD_DIR.mkdir(exist_ok=True)
     unique_filename = f"{current_user.id}_{uuid.uuid4().hex}{ext}"
     file_path = UPLOAD_DIR / unique_filename
     
@@ -174,7 +177,11 @@ async def update_my_skills(
     user = result.scalar_one()
     
     user.skills = list(skills)
+    if user.role == UserRole.STUDENT:
+        await refresh_student_matches(db, user.id)
     await db.commit()
+    if user.role == UserRole.STUDENT:
+        enqueue_student_rescore(user.id)
     
     return skills
 
@@ -205,7 +212,11 @@ async def update_my_skills_with_proficiency(
                 )
             )
     
+    if current_user.role == UserRole.STUDENT:
+        await refresh_student_matches(db, current_user.id)
     await db.commit()
+    if current_user.role == UserRole.STUDENT:
+        enqueue_student_rescore(current_user.id)
     
     result = await db.execute(
         select(Skill, user_skills.c.proficiency)
@@ -300,24 +311,34 @@ async def get_profile_completion(
 
 @router.get("/students", response_model=List[UserWithStats])
 async def get_assigned_students(
-    current_user: User = Depends(require_advisor),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: Principal = Depends(require_advisor_principal),
+    db: AsyncSession = Depends(get_db),
+    page: PageParams = Depends(page_params)
 ):
+    ordering = "students:id"
     result = await db.execute(
-        select(User)
-        .options(selectinload(User.profile), selectinload(User.skills))
-        .join(advisor_students, User.id == advisor_students.c.student_id)
-        .where(advisor_students.c.advisor_id == current_user.id)
+        keyset_paginate(
+            select(User)
+            .options(selectinload(User.profile), selectinload(User.skills))
+            .join(advisor_students, User.id == advisor_students.c.student_id)
+            .where(advisor_students.c.advisor_id == current_user.id),
+            ordering, advisor_students.c.student_id, User.id, page.cursor, page.limit, descending=False
+        )
     )
-    students = result.scalars().all()
+    students, next_cursor = split_page(result.scalars().all(), page.limit, ordering, key=lambda u: (u.id, u.id))
+    set_next_cursor(response, next_cursor)
+    
+    stats_result = await db.execute(
+        select(Application.applicant_id, func.count(Application.id), func.avg(Application.match_score))
+        .where(Application.applicant_id.in_([student.id for student in students]))
+        .group_by(Application.applicant_id)
+    )
+    stats_by_student = {applicant_id: (count, avg_score) for applicant_id, count, avg_score in stats_result.all()}
     
     student_stats = []
     for student in students:
-        app_result = await db.execute(
-            select(func.count(Application.id), func.avg(Application.match_score))
-            .where(Application.applicant_id == student.id)
-        )
-        count, avg_score = app_result.one()
+        count, avg_score = stats_by_student.get(student.id, (0, None))
         
         student_data = UserWithStats(
             id=student.id,
@@ -337,7 +358,7 @@ async def get_assigned_students(
 @router.post("/students/{student_id}/assign")
 async def assign_student(
     student_id: int,
-    current_user: User = Depends(require_advisor),
+    current_user: Principal = Depends(require_advisor_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
@@ -368,7 +389,7 @@ async def assign_student(
 @router.get("/students/{student_id}", response_model=UserWithStats)
 async def get_student_detail(
     student_id: int,
-    current_user: User = Depends(require_advisor),
+    current_user: Principal = Depends(require_advisor_principal),
     db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
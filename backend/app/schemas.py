@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field
-from app.models import UserRole, ApplicationStatus, InterviewStatus, NotificationType
+from app.models import UserRole, ApplicationStatus, InterviewStatus, NotificationType, MAX_INTERVIEW_MINUTES
 
 
 class SkillBase(BaseModel):
@@ -202,6 +202,11 @@ class NoteResponse(NoteBase):
         from_attributes = True
 
 
+class NoteSearchResult(NoteResponse):
+    rank: float
+    highlight: str
+
+
 class SkillGapData(BaseModel):
     skill: str
     skill_id: Optional[int] = None
@@ -229,6 +234,29 @@ class SkillGapAnalysis(BaseModel):
     radar_data: List[SkillGapData]
 
 
+class SkillGapBatchRequest(BaseModel):
+    job_ids: List[int] = Field(min_length=1, max_length=100)
+    user_id: Optional[int] = None
+
+
+class JobSkillGap(SkillGapAnalysis):
+    job_id: int
+    job_title: str
+
+
+class MissingSkillFrequency(BaseModel):
+    id: int
+    name: str
+    is_technical: bool
+    missing_count: int
+    job_ids: List[int]
+
+
+class SkillGapBatchResponse(BaseModel):
+    gaps: List[JobSkillGap]
+    most_missing: List[MissingSkillFrequency]
+
+
 class ONetOccupationResponse(BaseModel):
     id: int
     soc_code: str
@@ -250,11 +278,12 @@ class InterviewBase(BaseModel):
 
 class InterviewCreate(InterviewBase):
     application_id: int
+    duration_minutes: int = Field(default=60, ge=5, le=MAX_INTERVIEW_MINUTES)
 
 
 class InterviewUpdate(BaseModel):
     scheduled_at: Optional[datetime] = None
-    duration_minutes: Optional[int] = None
+    duration_minutes: Optional[int] = Field(default=None, ge=5, le=MAX_INTERVIEW_MINUTES)
     interview_type: Optional[str] = None
     location: Optional[str] = None
     meeting_link: Optional[str] = None
@@ -273,6 +302,18 @@ class InterviewResponse(InterviewBase):
         from_attributes = True
 
 
+class AvailabilitySlot(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class InterviewAvailability(BaseModel):
+    application_id: int
+    duration_minutes: int
+    buffer_minutes: int
+    slots: List[AvailabilitySlot]
+
+
 class InterviewWithDetails(InterviewResponse):
     applicant_name: str
     applicant_email: str
@@ -337,6 +378,17 @@ class LearningResourceResponse(BaseModel):
         from_attributes = True
 
 
+class LearningPlanStep(BaseModel):
+    resource: LearningResourceResponse
+    covers_skill_ids: List[int]
+
+
+class LearningPlanResponse(BaseModel):
+    steps: List[LearningPlanStep]
+    uncovered_skill_ids: List[int]
+    total_estimated_hours: int
+
+
 class CareerDetailResponse(BaseModel):
     id: int
     soc_code: str
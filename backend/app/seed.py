@@ -1,17 +1,27 @@
 from sqlalchemy import select, insert
 from app.database import AsyncSessionLocal
 from app.models import Skill, ONetOccupation, User, Profile, Job, UserRole, user_skills, job_skills, advisor_students, CareerDetail, LearningResource
-from app.services.onet_ingest import get_default_skills, get_default_it_occupations
 from app.auth import get_password_hash
+from app.migrations import get_seed_version, record_seed_version
+
+SEED_NAME = "initial"
+SEED_VERSION = 1
 
 
 async def seed_initial_data():
     async with AsyncSessionLocal() as db:
         try:
+            if await get_seed_version(db, SEED_NAME) >= SEED_VERSION:
+                return
+            
             result = await db.execute(select(Skill).limit(1))
             if result.scalar_one_or_none():
+                await record_seed_version(db, SEED_NAME, SEED_VERSION)
+                await db.commit()
                 return
             
+            from app.services.onet_ingest import get_default_skills, get_default_it_occupations
+            
             skills_data = get_default_skills()
             skill_map = {}
             for skill_data in skills_data:
@@ -229,6 +239,7 @@ async def seed_initial_data():
                 if resource.skill_id:
                     db.add(resource)
             
+            await record_seed_version(db, SEED_NAME, SEED_VERSION)
             await db.commit()
             print("Initial data seeded successfully!")
             
@@ -0,0 +1,242 @@
+"""
+Application Scores Service: Incremental Rescoring of Application.match_score
+
+`create_application` stores the applicant's match score at submit time, and
+employers rank applicants by it. When an employer edits a job's required
+skills, or a student changes their skills, those stored scores go stale.
+
+Change handlers call `enqueue_job_rescore()` / `enqueue_student_rescore()`
+after committing. A single background worker (started in the app lifespan)
+coalesces bursts of events, then rescores only the affected applications:
+
+- applications are read in id-ordered batches of `RESCORE_BATCH_SIZE`
+- each applicant is scored against all their jobs in one
+  `calculate_batch_matches` call
+- changed scores are written back with one bulk UPDATE per batch
+
+The same worker refreshes the stored job_matches rows of created or edited
+jobs (`enqueue_job_matches()`), which reads every student holding one of
+the job's skills and is too much work to do inside the request.
+
+`rescore_stats()` reports progress counters (also shown by /api/health).
+`python -m app.services.application_scores` rescores every application,
+e.g. after the matching weights change.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models import Application
+from app.services.ml_service import calculate_batch_matches
+from app.services.match_store import (
+    load_job_requirements, load_skill_data, load_student_skills, refresh_job_matches, resolve_skills
+)
+
+
+logger = logging.getLogger(__name__)
+
+RESCORE_BATCH_SIZE = 500
+COALESCE_SECONDS = 0.5
+
+_stats: Dict[str, Any] = {
+    "runs": 0,
+    "batches": 0,
+    "applications_scanned": 0,
+    "applications_updated": 0,
+    "job_matches_refreshed": 0,
+    "errors": 0,
+    "last_run_ms": None,
+    "last_run_at": None,
+}
+
+
+async def rescore_applications(
+    db: AsyncSession,
+    job_ids: Optional[Iterable[int]] = None,
+    student_ids: Optional[Iterable[int]] = None,
+    rescore_all: bool = False
+) -> int:
+    """
+    Recompute match_score for applications to `job_ids` or by `student_ids`
+    (or every application with `rescore_all`). Returns the number updated.
+    """
+    query = select(
+        Application.id, Application.job_id, Application.applicant_id, Application.match_score
+    ).order_by(Application.id)
+    if not rescore_all:
+        job_ids = list(job_ids or [])
+        student_ids = list(student_ids or [])
+        if not job_ids and not student_ids:
+            return 0
+        conditions = []
+        if job_ids:
+            conditions.append(Application.job_id.in_(job_ids))
+        if student_ids:
+            conditions.append(Application.applicant_id.in_(student_ids))
+        query = query.where(or_(*conditions))
+
+    skill_data = await load_skill_data(db)
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (await db.execute(query.where(Application.id > last_id).limit(RESCORE_BATCH_SIZE))).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        updated += await _rescore_batch(db, rows, skill_data)
+        _stats["batches"] += 1
+        _stats["applications_scanned"] += len(rows)
+        if len(rows) < RESCORE_BATCH_SIZE:
+            break
+
+    _stats["applications_updated"] += updated
+    return updated
+
+
+async def _rescore_batch(db: AsyncSession, rows, skill_data) -> int:
+    requirements = await load_job_requirements(db, list({row.job_id for row in rows}), active_only=False)
+    student_skills = await load_student_skills(db, list({row.applicant_id for row in rows}))
+
+    jobs_by_applicant: Dict[int, Set[int]] = defaultdict(set)
+    for row in rows:
+        jobs_by_applicant[row.applicant_id].add(row.job_id)
+
+    scores: Dict[tuple, float] = {}
+    for applicant_id, job_ids in jobs_by_applicant.items():
+        results = calculate_batch_matches(
+            resolve_skills(student_skills.get(applicant_id, ()), skill_data),
+            [(job_id, resolve_skills(requirements.get(job_id, ()), skill_data)) for job_id in job_ids]
+        )
+        for job_id, match_result in results.items():
+            scores[(applicant_id, job_id)] = round(match_result.score * 100, 1)
+
+    changes = []
+    for row in rows:
+        score = scores[(row.applicant_id, row.job_id)]
+        if row.match_score != score:
+            changes.append({"id": row.id, "match_score": score})
+    if changes:
+        await db.execute(update(Application), changes)
+    return len(changes)
+
+
+class ApplicationRescorer:
+    """Background worker that coalesces rescoring requests into batched runs."""
+
+    def __init__(self):
+        self._jobs: Set[int] = set()
+        self._students: Set[int] = set()
+        self._match_jobs: Set[int] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._jobs) + len(self._students) + len(self._match_jobs)
+
+    def enqueue(
+        self,
+        job_ids: Iterable[int] = (),
+        student_ids: Iterable[int] = (),
+        match_job_ids: Iterable[int] = ()
+    ):
+        self._jobs.update(job_ids)
+        self._students.update(student_ids)
+        self._match_jobs.update(match_job_ids)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self):
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            if self.pending:
+                self._wakeup.set()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+
+    async def run_pending(self) -> int:
+        job_ids, self._jobs = self._jobs, set()
+        student_ids, self._students = self._students, set()
+        match_job_ids, self._match_jobs = self._match_jobs, set()
+        if not job_ids and not student_ids and not match_job_ids:
+            return 0
+
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                for job_id in sorted(match_job_ids):
+                    await refresh_job_matches(db, job_id)
+                updated = 0
+                if job_ids or student_ids:
+                    updated = await rescore_applications(db, job_ids=job_ids, student_ids=student_ids)
+                await db.commit()
+            _stats["job_matches_refreshed"] += len(match_job_ids)
+        except Exception:
+            _stats["errors"] += 1
+            self._jobs.update(job_ids)
+            self._students.update(student_ids)
+            self._match_jobs.update(match_job_ids)
+            logger.exception("Application rescoring failed")
+            return 0
+        finally:
+            _stats["runs"] += 1
+            _stats["last_run_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            _stats["last_run_at"] = time.time()
+        return updated
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(COALESCE_SECONDS)
+            self._wakeup.clear()
+            await self.run_pending()
+
+
+rescorer = ApplicationRescorer()
+
+
+def enqueue_job_rescore(job_id: int):
+    rescorer.enqueue(job_ids=[job_id])
+
+
+def enqueue_job_matches(job_id: int):
+    rescorer.enqueue(match_job_ids=[job_id])
+
+
+def enqueue_student_rescore(student_id: int):
+    rescorer.enqueue(student_ids=[student_id])
+
+
+def rescore_stats() -> Dict[str, Any]:
+    return {**_stats, "pending": rescorer.pending}
+
+
+async def _main():
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        updated = await rescore_applications(db, rescore_all=True)
+        await db.commit()
+    print(
+        f"Rescored {_stats['applications_scanned']} applications in {_stats['batches']} batches: "
+        f"{updated} updated ({time.perf_counter() - started:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
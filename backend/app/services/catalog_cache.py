@@ -0,0 +1,170 @@
+"""
+Catalog Cache Service: Versioned Conditional GET
+
+Reference data (skills, careers, learning resources, O*NET occupations) only
+changes on seed or admin edits, yet every page view requests it. This module
+keeps the catalog version in process memory so catalog endpoints can answer
+`If-None-Match` with 304 before any database work.
+
+The version lives in the `data_versions` row `catalog`, so every worker
+derives the same ETags. It is bumped automatically, as the last statement
+before COMMIT, whenever a session commits a change to a catalog model; call
+`bump_catalog_version(db)` after bulk Core writes that bypass the ORM unit of
+work. The new version is broadcast on the invalidation bus and every worker
+adopts it; `load_catalog_version()` reads it at startup. In-memory caches of
+catalog data subscribe with `on_catalog_change()` to be invalidated when the
+version moves.
+
+ETags combine the row's epoch, the catalog version and a digest of the
+request path and query, so they can never collide across database resets or
+filters.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+from typing import Callable, List, Optional, Set
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import AsyncSessionLocal
+from app.models import Skill, CareerDetail, LearningResource, ONetOccupation, data_versions
+from app.services.static_assets import etag_matches
+from app.services.invalidation_bus import invalidation_bus
+from app.services.shared_snapshot import get_data_version
+
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MODELS = (Skill, CareerDetail, LearningResource, ONetOccupation)
+CATALOG_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+CATALOG_TOPIC = "catalog"
+CATALOG_VERSION = "catalog"
+
+_catalog_epoch = ""
+_catalog_version = 0
+_SESSION_FLAG = "catalog_changed"
+_change_listeners: List[Callable[[int], None]] = []
+_reload_tasks: Set[asyncio.Task] = set()
+
+
+def get_catalog_version() -> int:
+    return _catalog_version
+
+
+def on_catalog_change(listener: Callable[[int], None]) -> Callable[[int], None]:
+    """Register a callback invoked with the new version whenever it moves."""
+    _change_listeners.append(listener)
+    return listener
+
+
+def _adopt_version(epoch: str, version: int):
+    global _catalog_epoch, _catalog_version
+    if epoch == _catalog_epoch and version <= _catalog_version:
+        return
+    _catalog_epoch, _catalog_version = epoch, version
+    for listener in _change_listeners:
+        listener(version)
+
+
+async def load_catalog_version():
+    """Adopt the version stored in the database (at startup)."""
+    async with AsyncSessionLocal() as db:
+        stored = await get_data_version(db, CATALOG_VERSION)
+    if stored:
+        _adopt_version(*stored)
+
+
+async def bump_catalog_version(db: AsyncSession):
+    """Bump the version when `db` commits, e.g. after bulk Core writes."""
+    await db.run_sync(lambda session: session.info.__setitem__(_SESSION_FLAG, True))
+
+
+def catalog_etag(request: Request, version: Optional[int] = None) -> str:
+    """Strong ETag for a catalog response at the given (or current) version."""
+    if version is None:
+        version = _catalog_version
+    variant = request.url.path + "?" + "&".join(sorted(request.url.query.split("&")))
+    digest = hashlib.sha1(variant.encode("utf-8")).hexdigest()[:16]
+    return f'"catalog-{_catalog_epoch}-{version}-{digest}"'
+
+
+async def catalog_conditional_get(request: Request, response: Response) -> None:
+    """
+    Route dependency for catalog endpoints.
+
+    Raises a 304 when the client already holds the current representation,
+    otherwise stamps the outgoing response with ETag and Cache-Control.
+    """
+    etag = catalog_etag(request)
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+async def _reload_catalog_version():
+    try:
+        await load_catalog_version()
+    except Exception:
+        logger.exception("Reloading the catalog version failed")
+
+
+@invalidation_bus.subscribe(CATALOG_TOPIC)
+def _adopt_version_from_event(keys):
+    # Keys are "epoch:version"; coalesced events may carry several.
+    versions = []
+    for key in keys:
+        epoch, _, version = key.partition(":")
+        if not version.isdigit():
+            # No version attached (e.g. the row is missing): ask the database.
+            task = asyncio.get_running_loop().create_task(_reload_catalog_version(), context=contextvars.Context())
+            _reload_tasks.add(task)
+            task.add_done_callback(_reload_tasks.discard)
+            return
+        versions.append((epoch, int(version)))
+    for epoch, version in sorted(versions, key=lambda item: item[1]):
+        _adopt_version(epoch, version)
+
+
+def _changes_catalog(session: Session) -> bool:
+    # Dirty only through a backref collection (e.g. Skill.users when a student
+    # edits their skills) is not a catalog change.
+    dirty = (obj for obj in session.dirty if session.is_modified(obj, include_collections=False))
+    return any(isinstance(obj, CATALOG_MODELS) for obj in (*session.new, *dirty, *session.deleted))
+
+
+@event.listens_for(Session, "after_flush")
+def _track_catalog_changes(session, flush_context):
+    if not session.info.get(_SESSION_FLAG) and _changes_catalog(session):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_catalog_version(session):
+    if not session.info.get(_SESSION_FLAG) and not _changes_catalog(session):
+        return
+    # Commit's own flush runs after before_commit; flush the pending catalog
+    # changes now so the bump follows them.
+    session.flush()
+    if not session.info.pop(_SESSION_FLAG, None):
+        return
+    bumped = session.connection().execute(
+        update(data_versions)
+        .where(data_versions.c.name == CATALOG_VERSION)
+        .values(version=data_versions.c.version + 1)
+        .returning(data_versions.c.epoch, data_versions.c.version)
+    ).first()
+    invalidation_bus.stage(session, CATALOG_TOPIC, [f"{bumped.epoch}:{bumped.version}"] if bumped else [])
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_catalog_flag(session):
+    session.info.pop(_SESSION_FLAG, None)
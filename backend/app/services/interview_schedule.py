@@ -0,0 +1,239 @@
+"""
+Interview Schedule Service: Double-Booking Detection
+
+An interview occupies [scheduled_at, scheduled_at + duration_minutes) on two
+calendars: the employer's and the candidate's. Every interview row carries
+`employer_id` and `applicant_id`, so each calendar is an index range scan:
+
+- `find_conflicts()` reads the non-cancelled interviews of either
+  participant starting within `MAX_INTERVIEW_MINUTES` before the new end
+  (`ix_interviews_employer_scheduled` / `ix_interviews_applicant_scheduled`),
+  i.e. O(log n + k) however long a recruiter's history is, and keeps those
+  whose real duration overlaps the new slot.
+- On PostgreSQL, migration 0004 also adds GiST exclusion constraints on
+  `tsrange(start, end)` per participant (see `EXCLUSION_CONSTRAINTS`), so
+  two workers booking the same slot concurrently cannot both commit; the
+  loser's `IntegrityError` is recognized by `is_conflict_error()`.
+
+`find_availability()` answers "when can both meet?": it reads both
+calendars over a date range with the same range scan, pads each interview
+with a buffer, and sweeps the merged busy intervals against the working
+hours once (`free_windows()`), returning the gaps long enough for the
+interview.
+
+`IntervalIndex` is the in-memory equivalent, for code that books many
+interviews without the database (the synthetic dataset generator).
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MAX_INTERVIEW_MINUTES, Interview, InterviewStatus
+
+
+EMPLOYER_CONSTRAINT = "interviews_employer_no_overlap"
+APPLICANT_CONSTRAINT = "interviews_applicant_no_overlap"
+EXCLUSION_CONSTRAINTS = {
+    EMPLOYER_CONSTRAINT: "employer_id",
+    APPLICANT_CONSTRAINT: "applicant_id",
+}
+MAX_DURATION = timedelta(minutes=MAX_INTERVIEW_MINUTES)
+
+
+@dataclass
+class Conflict:
+    interview_id: int
+    employer_id: int
+    applicant_id: int
+    scheduled_at: datetime
+    ends_at: datetime
+
+
+def interview_end(scheduled_at: datetime, duration_minutes: int) -> datetime:
+    return scheduled_at + timedelta(minutes=duration_minutes)
+
+
+async def find_conflicts(
+    db: AsyncSession,
+    employer_id: int,
+    applicant_id: int,
+    scheduled_at: datetime,
+    duration_minutes: int,
+    exclude_id: Optional[int] = None
+) -> List[Conflict]:
+    """Active interviews of either participant overlapping the given slot."""
+    ends_at = interview_end(scheduled_at, duration_minutes)
+    query = (
+        select(Interview.id, Interview.employer_id, Interview.applicant_id,
+               Interview.scheduled_at, Interview.duration_minutes)
+        .where(or_(Interview.employer_id == employer_id, Interview.applicant_id == applicant_id))
+        .where(Interview.scheduled_at > scheduled_at - MAX_DURATION)
+        .where(Interview.scheduled_at < ends_at)
+        .where(Interview.status != InterviewStatus.CANCELLED)
+        .order_by(Interview.scheduled_at)
+    )
+    if exclude_id is not None:
+        query = query.where(Interview.id != exclude_id)
+
+    conflicts = []
+    for row in (await db.execute(query)).all():
+        row_end = interview_end(row.scheduled_at, row.duration_minutes)
+        if row_end > scheduled_at:
+            conflicts.append(Conflict(row.id, row.employer_id, row.applicant_id, row.scheduled_at, row_end))
+    return conflicts
+
+
+async def load_busy(
+    db: AsyncSession,
+    employer_id: int,
+    applicant_id: int,
+    start: datetime,
+    end: datetime
+) -> List[Tuple[datetime, datetime]]:
+    """Both participants' active interviews touching [start, end), sorted by start."""
+    rows = (await db.execute(
+        select(Interview.scheduled_at, Interview.duration_minutes)
+        .where(or_(Interview.employer_id == employer_id, Interview.applicant_id == applicant_id))
+        .where(Interview.scheduled_at > start - MAX_DURATION)
+        .where(Interview.scheduled_at < end)
+        .where(Interview.status != InterviewStatus.CANCELLED)
+        .order_by(Interview.scheduled_at)
+    )).all()
+    return [(row.scheduled_at, interview_end(row.scheduled_at, row.duration_minutes)) for row in rows]
+
+
+def round_up(moment: datetime, minutes: int) -> datetime:
+    """The next multiple of `minutes` past midnight at or after `moment`."""
+    step = timedelta(minutes=minutes)
+    midnight = datetime.combine(moment.date(), time())
+    return midnight + -((midnight - moment) // step) * step
+
+
+def working_windows(
+    first_day: date,
+    last_day: date,
+    day_start: time,
+    day_end: time,
+    include_weekends: bool = False
+) -> Iterator[Tuple[datetime, datetime]]:
+    day = first_day
+    while day <= last_day:
+        if include_weekends or day.weekday() < 5:
+            yield datetime.combine(day, day_start), datetime.combine(day, day_end)
+        day += timedelta(days=1)
+
+
+def free_windows(
+    windows: Iterable[Tuple[datetime, datetime]],
+    busy: List[Tuple[datetime, datetime]],
+    min_length: timedelta,
+    buffer: timedelta = timedelta(0),
+    not_before: Optional[datetime] = None
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Gaps of at least `min_length` inside `windows` (sorted, disjoint) not
+    covered by `busy` (sorted by start; may overlap) padded by `buffer` on
+    both sides. One pass over both lists: O(windows + busy).
+    """
+    free = []
+    position = 0
+    busy_end = None  # end of the merged busy run reaching into the current window
+    for window_start, window_end in windows:
+        cursor = window_start if not_before is None else max(window_start, not_before)
+        if busy_end is not None and busy_end > cursor:
+            cursor = busy_end
+        while cursor < window_end and position < len(busy):
+            start, end = busy[position][0] - buffer, busy[position][1] + buffer
+            if start >= window_end:
+                break
+            position += 1
+            if start - cursor >= min_length:
+                free.append((cursor, start))
+            if end > cursor:
+                cursor = end
+                busy_end = end
+        if window_end - cursor >= min_length:
+            free.append((cursor, window_end))
+    return free
+
+
+async def find_availability(
+    db: AsyncSession,
+    employer_id: int,
+    applicant_id: int,
+    first_day: date,
+    last_day: date,
+    duration_minutes: int,
+    buffer_minutes: int = 0,
+    day_start: time = time(9, 0),
+    day_end: time = time(17, 0),
+    include_weekends: bool = False,
+    not_before: Optional[datetime] = None
+) -> List[Tuple[datetime, datetime]]:
+    """Windows in which both participants are free for `duration_minutes` (plus buffers)."""
+    range_start = datetime.combine(first_day, day_start)
+    range_end = datetime.combine(last_day, day_end)
+    buffer = timedelta(minutes=buffer_minutes)
+    busy = await load_busy(db, employer_id, applicant_id, range_start - buffer, range_end + buffer)
+    return free_windows(
+        working_windows(first_day, last_day, day_start, day_end, include_weekends),
+        busy,
+        timedelta(minutes=duration_minutes),
+        buffer,
+        not_before
+    )
+
+
+def conflict_detail(conflicts: List[Conflict], employer_id: int, viewer_id: int) -> str:
+    """Describe the first conflict from the point of view of `viewer_id` (employer or candidate)."""
+    conflict = conflicts[0]
+    on_employer_calendar = conflict.employer_id == employer_id
+    if on_employer_calendar == (viewer_id == employer_id):
+        who = "You already have"
+    else:
+        who = "The employer already has" if on_employer_calendar else "The candidate already has"
+    return (
+        f"{who} an interview from {conflict.scheduled_at:%Y-%m-%d %H:%M} "
+        f"to {conflict.ends_at:%H:%M} that overlaps this time"
+    )
+
+
+def is_conflict_error(error: IntegrityError) -> bool:
+    """True when an insert/update lost a race to an overlapping booking (PostgreSQL)."""
+    message = str(error.orig)
+    return any(name in message for name in EXCLUSION_CONSTRAINTS)
+
+
+class IntervalIndex:
+    """
+    Per-key half-open intervals sorted by start. Intervals are at most
+    `max_length` long, so an overlap query only scans starts within
+    (start - max_length, end): O(log n + k) per lookup.
+    """
+
+    def __init__(self, max_length: timedelta = MAX_DURATION):
+        self.max_length = max_length
+        self._intervals: Dict[Hashable, List[Tuple[datetime, datetime]]] = defaultdict(list)
+
+    def overlaps(self, key: Hashable, start: datetime, end: datetime) -> bool:
+        intervals = self._intervals.get(key)
+        if not intervals:
+            return False
+        position = bisect_left(intervals, (start - self.max_length,))
+        while position < len(intervals) and intervals[position][0] < end:
+            if intervals[position][1] > start:
+                return True
+            position += 1
+        return False
+
+    def add(self, key: Hashable, start: datetime, end: datetime):
+        if end - start > self.max_length:
+            raise ValueError(f"Interval longer than {self.max_length}")
+        insort(self._intervals[key], (start, end))
@@ -0,0 +1,361 @@
+"""
+Invalidation Bus Service: Cross-Worker Cache Invalidation Events
+
+In-process caches (reference catalogs, the catalog version behind ETags,
+revoked tokens) only see writes made by their own worker. This bus
+broadcasts entity-change events so every worker can invalidate them:
+
+- `publish(db, topic, *keys)` stages an event in the caller's transaction.
+  It is delivered only if the transaction commits and dropped on rollback.
+  `publish_now()` sends immediately for non-transactional changes.
+- `subscribe(topic, callback)` registers a cache; the callback receives the
+  set of changed keys (`ALL_KEYS` when too many keys changed to list).
+- Every worker, including the one that made the change, dispatches each
+  committed event to its subscribers. The origin dispatches synchronously on
+  commit; other workers coalesce events arriving within `COALESCE_SECONDS`
+  into one callback per topic.
+- `stats()` reports published/received counts, coalescing and propagation
+  delay (receive time minus publish time), shown by /api/health.
+
+Transports (`INVALIDATION_BUS`):
+
+- "postgres": `pg_notify` inside the writing transaction, so Postgres itself
+  delivers at commit; each worker LISTENs on one pooled connection.
+- "unix": node-local stand-in for development and tests; each worker binds a
+  datagram socket in `INVALIDATION_BUS_DIR` and senders fan out to every
+  socket there after commit.
+- "local": in-process only.
+
+The default is "postgres" on PostgreSQL, otherwise "unix" where available.
+
+Topics and their subscribers:
+
+- `CATALOG_TOPIC` (`app.services.catalog_cache`), `TOKEN_TOPIC`
+  (`app.auth`) and `NOTE_TOPIC` (`app.services.note_search`) drop the
+  matching in-process caches.
+- `JOB_TOPIC` makes every worker republish the shared job matrix snapshot
+  (`app.services.shared_snapshot`) ahead of the next read. The job_matches
+  table needs no subscriber: it lives in the database and is refreshed by
+  the worker that made the change.
+
+Add a topic together with the cache that subscribes to it: on PostgreSQL
+every publish is a `pg_notify` in the writing transaction that every worker
+receives.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import socket
+import tempfile
+import time
+import uuid
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import engine
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pathfinder_invalidation"
+ALL_KEYS = "*"
+MAX_KEYS_PER_EVENT = 100
+COALESCE_SECONDS = 0.05
+RECONNECT_SECONDS = 2.0
+DELAY_SAMPLES = 1000
+BUS_DIR = os.environ.get("INVALIDATION_BUS_DIR") or os.path.join(tempfile.gettempdir(), "pathfinder-bus")
+_SESSION_EVENTS = "invalidation_events"
+
+JOB_TOPIC = "job"
+NOTE_TOPIC = "note"
+
+Subscriber = Callable[[Set[str]], None]
+
+
+class LocalTransport:
+    """Delivers nothing across processes."""
+
+    name = "local"
+    transactional = False
+
+    async def start(self, on_message: Callable[[bytes], None]):
+        pass
+
+    async def stop(self):
+        pass
+
+    def send(self, payload: bytes):
+        pass
+
+
+class UnixSocketTransport:
+    """One datagram socket per worker in a shared directory; senders fan out."""
+
+    name = "unix"
+    transactional = False
+
+    def __init__(self, directory: str = BUS_DIR):
+        self.directory = directory
+        self.path: Optional[str] = None
+        self._endpoint: Optional[asyncio.DatagramTransport] = None
+        self._sender: Optional[socket.socket] = None
+        self.dropped = 0
+
+    async def start(self, on_message: Callable[[bytes], None]):
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+
+        class Receiver(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                on_message(data)
+
+        self._endpoint, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            Receiver, local_addr=self.path, family=socket.AF_UNIX
+        )
+
+    async def stop(self):
+        if self._endpoint is not None:
+            self._endpoint.close()
+            self._endpoint = None
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def send(self, payload: bytes):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        if self._sender is None:
+            self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._sender.setblocking(False)
+        for name in names:
+            peer = os.path.join(self.directory, name)
+            if not name.endswith(".sock") or peer == self.path:
+                continue
+            try:
+                self._sender.sendto(payload, peer)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # The worker that bound it is gone.
+                try:
+                    os.unlink(peer)
+                except FileNotFoundError:
+                    pass
+            except (BlockingIOError, OSError):
+                self.dropped += 1
+
+
+class PostgresTransport:
+    """NOTIFY inside the writing transaction, LISTEN on a dedicated connection."""
+
+    name = "postgres"
+    transactional = True
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        # The event loop only keeps weak references to tasks.
+        self._sends: Set[asyncio.Task] = set()
+
+    def statement(self, payload: bytes):
+        return select(func.pg_notify(CHANNEL, payload.decode("utf-8")))
+
+    async def start(self, on_message: Callable[[bytes], None]):
+        self._task = asyncio.create_task(self._listen(on_message))
+
+    async def _listen(self, on_message: Callable[[bytes], None]):
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    lost = asyncio.Event()
+                    driver.add_termination_listener(lambda _conn: lost.set())
+                    await driver.add_listener(
+                        CHANNEL, lambda _conn, _pid, _channel, payload: on_message(payload.encode("utf-8"))
+                    )
+                    await lost.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener lost its connection")
+            await asyncio.sleep(RECONNECT_SECONDS)
+
+    async def stop(self):
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def send(self, payload: bytes):
+        task = asyncio.get_running_loop().create_task(self._notify(payload), context=contextvars.Context())
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _notify(self, payload: bytes):
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(self.statement(payload))
+        except Exception:
+            logger.exception("Sending invalidation event failed")
+
+
+def default_transport():
+    choice = os.environ.get("INVALIDATION_BUS")
+    if choice is None:
+        if engine.dialect.name == "postgresql":
+            choice = "postgres"
+        else:
+            choice = "unix" if hasattr(socket, "AF_UNIX") else "local"
+    if choice == "postgres":
+        return PostgresTransport()
+    if choice == "unix":
+        return UnixSocketTransport()
+    return LocalTransport()
+
+
+class InvalidationBus:
+    def __init__(self, transport=None):
+        self.transport = transport or default_transport()
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._subscribers: Dict[str, List[Subscriber]] = defaultdict(list)
+        self._pending: Dict[str, Set[str]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._delays: deque = deque(maxlen=DELAY_SAMPLES)
+        self.published = 0
+        self.received = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.errors = 0
+
+    def subscribe(self, topic: str, callback: Optional[Subscriber] = None):
+        """Register `callback` for `topic`; usable as a decorator."""
+        def register(fn: Subscriber) -> Subscriber:
+            self._subscribers[topic].append(fn)
+            return fn
+        return register(callback) if callback is not None else register
+
+    def _encode(self, topic: str, keys: Iterable[Any]) -> bytes:
+        keys = [str(key) for key in dict.fromkeys(keys)]
+        if not keys or len(keys) > MAX_KEYS_PER_EVENT:
+            keys = [ALL_KEYS]
+        return json.dumps({"t": topic, "k": keys, "o": self.origin, "at": time.time()}).encode("utf-8")
+
+    def stage(self, session: Session, topic: str, keys: Iterable[Any] = ()):
+        """Attach an event to the session's transaction (sync; usable in flush hooks)."""
+        payload = self._encode(topic, keys)
+        session.info.setdefault(_SESSION_EVENTS, []).append(payload)
+        if self.transport.transactional:
+            session.connection().execute(self.transport.statement(payload))
+
+    async def publish(self, db: AsyncSession, topic: str, *keys: Any):
+        await db.run_sync(lambda session: self.stage(session, topic, keys))
+
+    def publish_now(self, topic: str, *keys: Any):
+        payload = self._encode(topic, keys)
+        self._deliver_committed([payload])
+        self.transport.send(payload)
+
+    def _deliver_committed(self, payloads: List[bytes]):
+        self.published += len(payloads)
+        by_topic: Dict[str, Set[str]] = defaultdict(set)
+        for payload in payloads:
+            message = json.loads(payload)
+            by_topic[message["t"]].update(message["k"])
+        for topic, keys in by_topic.items():
+            self._dispatch(topic, keys)
+
+    def _on_commit(self, session: Session):
+        payloads = session.info.pop(_SESSION_EVENTS, None)
+        if not payloads:
+            return
+        self._deliver_committed(payloads)
+        if not self.transport.transactional:
+            for payload in payloads:
+                self.transport.send(payload)
+
+    def _on_message(self, payload: bytes):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            self.errors += 1
+            return
+        if message.get("o") == self.origin:
+            return
+        self.received += 1
+        self._delays.append(max(0.0, time.time() - message["at"]))
+        if message["t"] in self._pending:
+            self.coalesced += 1
+        self._pending.setdefault(message["t"], set()).update(message["k"])
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(COALESCE_SECONDS, self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for topic, keys in pending.items():
+            self._dispatch(topic, keys)
+
+    def _dispatch(self, topic: str, keys: Set[str]):
+        if ALL_KEYS in keys:
+            keys = {ALL_KEYS}
+        self.batches += 1
+        for callback in self._subscribers.get(topic, ()):
+            try:
+                callback(keys)
+            except Exception:
+                self.errors += 1
+                logger.exception("Invalidation subscriber for %s failed", topic)
+
+    async def start(self):
+        await self.transport.start(self._on_message)
+
+    async def stop(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+        await self.transport.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        delays = sorted(self._delays)
+        delay_ms = None
+        if delays:
+            delay_ms = {
+                "last": round(self._delays[-1] * 1000, 2),
+                "mean": round(sum(delays) / len(delays) * 1000, 2),
+                "p95": round(delays[min(len(delays) - 1, int(len(delays) * 0.95))] * 1000, 2),
+                "max": round(delays[-1] * 1000, 2),
+            }
+        return {
+            "transport": self.transport.name,
+            "published": self.published,
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "dispatched_batches": self.batches,
+            "errors": self.errors,
+            "propagation_delay_ms": delay_ms,
+            "subscriptions": {topic: len(callbacks) for topic, callbacks in self._subscribers.items()},
+        }
+
+
+invalidation_bus = InvalidationBus()
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_on_commit(session):
+    invalidation_bus._on_commit(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(_SESSION_EVENTS, None)
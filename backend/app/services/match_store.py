@@ -0,0 +1,258 @@
+"""
+Match Store Service: Materialized Student × Job Match Scores
+
+`calculate_weighted_match` only depends on a student's skills and a job's
+required skills, so its result can be stored and kept current by
+recomputing it whenever one of those inputs changes:
+
+- a student's skill set changes -> `refresh_student_matches()`
+- a job is created, edited or (de)activated -> `refresh_job_matches()`, run
+  by the background rescorer (`app.services.application_scores`) after the
+  request commits. Only students holding at least one of the job's skills
+  are read (`ix_user_skills_skill_user`); everyone else scores 0.
+- a job is deleted -> `remove_job_matches()`
+
+Only pairs scoring above `MATCH_SCORE_FLOOR` (percent, default 0) against
+active jobs are stored, so the table grows with real matches rather than
+with students × jobs. Ranking jobs for a student is then a range scan over
+`ix_job_matches_student_score_job`; jobs without a row score at or below
+the floor.
+
+All refresh helpers run inside the caller's transaction and flush first,
+so they see pending ORM changes and commit together with them. Rows are
+written with an upsert and only rows that no longer qualify are deleted, so
+two concurrent refreshes of the same student or job cannot collide on the
+primary key. The full active job matrix is read from the shared snapshot
+(`app.services.shared_snapshot`) when its version is current.
+`rebuild_job_matches()` recomputes everything (run with
+`python -m app.services.match_store`).
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal, engine
+from app.models import Job, JobMatch, User, UserRole, job_skills, user_skills
+from app.services.ml_service import MatchResult, SkillData, calculate_batch_matches, calculate_weighted_match
+from app.services.reference_cache import ALL, skill_index_cache
+from app.services.shared_snapshot import job_matrix
+
+
+MATCH_SCORE_FLOOR = float(os.environ.get("MATCH_SCORE_FLOOR", "0"))
+INSERT_BATCH_SIZE = 1000
+DELETE_BATCH_SIZE = 1000
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+SCORE_COLUMNS = (
+    "score", "matched_technical_count", "matched_soft_count",
+    "missing_technical_count", "missing_soft_count", "updated_at",
+)
+
+
+def _match_row(student_id: int, job_id: int, match_result: MatchResult) -> Optional[dict]:
+    score = round(match_result.score * 100, 1)
+    if score <= MATCH_SCORE_FLOOR:
+        return None
+    return {
+        "student_id": student_id,
+        "job_id": job_id,
+        "score": score,
+        "matched_technical_count": len(match_result.matched_technical),
+        "matched_soft_count": len(match_result.matched_soft),
+        "missing_technical_count": len(match_result.missing_technical),
+        "missing_soft_count": len(match_result.missing_soft),
+    }
+
+
+def _match_rows(student_id: int, results: Dict[int, MatchResult]) -> List[dict]:
+    rows = []
+    for job_id, match_result in results.items():
+        row = _match_row(student_id, job_id, match_result)
+        if row:
+            rows.append(row)
+    return rows
+
+
+async def load_skill_data(db: AsyncSession) -> Dict[int, SkillData]:
+    skill_index = await skill_index_cache.get(db, ALL)
+    return {
+        skill_id: SkillData(id=skill.id, name=skill.name, is_technical=skill.is_technical)
+        for skill_id, skill in skill_index.items()
+    }
+
+
+def resolve_skills(skill_ids: Iterable[int], skill_data: Dict[int, SkillData]) -> List[SkillData]:
+    return [skill_data[skill_id] for skill_id in skill_ids if skill_id in skill_data]
+
+
+def _upsert_statement():
+    dialect_insert = UPSERT_INSERTS.get(engine.dialect.name)
+    if dialect_insert is None:
+        return insert(JobMatch)
+    statement = dialect_insert(JobMatch)
+    return statement.on_conflict_do_update(
+        index_elements=[JobMatch.student_id, JobMatch.job_id],
+        set_={column: statement.excluded[column] for column in SCORE_COLUMNS}
+    )
+
+
+async def _upsert_rows(db: AsyncSession, rows: List[dict]):
+    if not rows:
+        return
+    statement = _upsert_statement()
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        await db.execute(statement, rows[start:start + INSERT_BATCH_SIZE])
+
+
+async def _replace_rows(db: AsyncSession, key_column, key: int, other_column, rows: List[dict]):
+    """Make the rows for `key_column == key` exactly `rows`: delete the stale ones, upsert the rest."""
+    keep = {row[other_column.key] for row in rows}
+    existing = (await db.execute(select(other_column).where(key_column == key))).scalars().all()
+    stale = [other for other in existing if other not in keep]
+    for start in range(0, len(stale), DELETE_BATCH_SIZE):
+        await db.execute(
+            delete(JobMatch).where(key_column == key, other_column.in_(stale[start:start + DELETE_BATCH_SIZE]))
+        )
+    await _upsert_rows(db, rows)
+
+
+async def load_job_requirements(
+    db: AsyncSession,
+    job_ids: Optional[List[int]] = None,
+    active_only: bool = True
+) -> Dict[int, Sequence[int]]:
+    """
+    Required skill ids per job (all jobs when `job_ids` is None).
+
+    All active jobs come from the shared snapshot when it is current.
+    """
+    if job_ids is None and active_only:
+        snapshot = await job_matrix.current(db)
+        if snapshot is not None:
+            return snapshot.requirements()
+    query = (
+        select(job_skills.c.job_id, job_skills.c.skill_id)
+        .join(Job, Job.id == job_skills.c.job_id)
+        .order_by(job_skills.c.job_id, job_skills.c.skill_id)
+    )
+    if active_only:
+        query = query.where(Job.is_active == True)
+    if job_ids is not None:
+        query = query.where(job_skills.c.job_id.in_(job_ids))
+    requirements: Dict[int, List[int]] = defaultdict(list)
+    for job_id, skill_id in (await db.execute(query)).all():
+        requirements[job_id].append(skill_id)
+    return requirements
+
+
+async def load_student_skills(
+    db: AsyncSession,
+    student_ids: Optional[List[int]] = None,
+    skill_ids: Optional[Iterable[int]] = None
+) -> Dict[int, Set[int]]:
+    """
+    Skill ids per student (all students when `student_ids` is None). With
+    `skill_ids`, only those skills are read and students holding none of them
+    are left out.
+    """
+    query = (
+        select(user_skills.c.user_id, user_skills.c.skill_id)
+        .join(User, User.id == user_skills.c.user_id)
+        .where(User.role == UserRole.STUDENT)
+    )
+    if student_ids is not None:
+        query = query.where(user_skills.c.user_id.in_(student_ids))
+    if skill_ids is not None:
+        query = query.where(user_skills.c.skill_id.in_(list(skill_ids)))
+    skills: Dict[int, Set[int]] = defaultdict(set)
+    for user_id, skill_id in (await db.execute(query)).all():
+        skills[user_id].add(skill_id)
+    return skills
+
+
+async def refresh_student_matches(db: AsyncSession, student_id: int) -> int:
+    """Recompute one student's matches against every active job."""
+    await db.flush()
+    student_skills = (await load_student_skills(db, [student_id])).get(student_id)
+    if not student_skills:
+        await db.execute(delete(JobMatch).where(JobMatch.student_id == student_id))
+        return 0
+
+    skill_data = await load_skill_data(db)
+    requirements = await load_job_requirements(db)
+    results = calculate_batch_matches(
+        resolve_skills(student_skills, skill_data),
+        [(job_id, resolve_skills(skill_ids, skill_data)) for job_id, skill_ids in requirements.items()]
+    )
+    rows = _match_rows(student_id, results)
+    await _replace_rows(db, JobMatch.student_id, student_id, JobMatch.job_id, rows)
+    return len(rows)
+
+
+async def refresh_job_matches(db: AsyncSession, job_id: int) -> int:
+    """Recompute every student's match against one job (clears it if inactive)."""
+    await db.flush()
+    requirements = (await load_job_requirements(db, [job_id])).get(job_id)
+    if not requirements:
+        await remove_job_matches(db, job_id)
+        return 0
+
+    skill_data = await load_skill_data(db)
+    job_requirements = resolve_skills(requirements, skill_data)
+    rows = []
+    # A match only depends on the student's skills the job requires.
+    for student_id, skill_ids in (await load_student_skills(db, skill_ids=requirements)).items():
+        row = _match_row(student_id, job_id, calculate_weighted_match(resolve_skills(skill_ids, skill_data), job_requirements))
+        if row:
+            rows.append(row)
+    await _replace_rows(db, JobMatch.job_id, job_id, JobMatch.student_id, rows)
+    return len(rows)
+
+
+async def remove_job_matches(db: AsyncSession, job_id: int):
+    await db.execute(delete(JobMatch).where(JobMatch.job_id == job_id))
+
+
+async def rebuild_job_matches(db: AsyncSession) -> int:
+    """Recompute the whole table, e.g. after a weight or floor change."""
+    await db.execute(delete(JobMatch))
+
+    skill_data = await load_skill_data(db)
+    jobs = [
+        (job_id, resolve_skills(skill_ids, skill_data))
+        for job_id, skill_ids in (await load_job_requirements(db)).items()
+    ]
+    total = 0
+    for student_id, skill_ids in (await load_student_skills(db)).items():
+        results = calculate_batch_matches(resolve_skills(skill_ids, skill_data), jobs)
+        rows = _match_rows(student_id, results)
+        await _upsert_rows(db, rows)
+        total += len(rows)
+    return total
+
+
+async def ensure_job_matches():
+    """Build the table on startup when it is empty but there are jobs to rank."""
+    async with AsyncSessionLocal() as db:
+        has_matches = (await db.execute(select(JobMatch.job_id).limit(1))).first()
+        has_jobs = (await db.execute(select(Job.id).where(Job.is_active == True).limit(1))).first()
+        if has_matches or not has_jobs:
+            return
+        await rebuild_job_matches(db)
+        await db.commit()
+
+
+async def _main():
+    async with AsyncSessionLocal() as db:
+        total = await rebuild_job_matches(db)
+        await db.commit()
+    print(f"Rebuilt job_matches: {total} rows above floor {MATCH_SCORE_FLOOR}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
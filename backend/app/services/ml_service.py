@@ -39,61 +39,44 @@ TECHNICAL_WEIGHT = 2.0
 SOFT_WEIGHT = 1.0
 
 
-def calculate_weighted_match(
-    candidate_skills: List[SkillData],
+def _empty_match() -> MatchResult:
+    return MatchResult(
+        score=0.0,
+        matched_technical=[],
+        matched_soft=[],
+        missing_technical=[],
+        missing_soft=[],
+        technical_score=0.0,
+        soft_score=0.0
+    )
+
+
+def _match_against(
+    candidate_skill_names: Set[str],
     job_requirements: List[SkillData]
 ) -> MatchResult:
-    """
-    Calculate weighted Jaccard similarity between candidate skills and job requirements.
-    
-    Technical skills receive 2x weight compared to soft skills.
-    This ensures IT-focused candidates get appropriately high scores.
-    
-    Args:
-        candidate_skills: List of skills the candidate possesses
-        job_requirements: List of skills required for the job
-    
-    Returns:
-        MatchResult with detailed breakdown of match score
-    """
+    """Score one job against an already-lowercased set of candidate skill names."""
     if not job_requirements:
-        return MatchResult(
-            score=0.0,
-            matched_technical=[],
-            matched_soft=[],
-            missing_technical=[],
-            missing_soft=[],
-            technical_score=0.0,
-            soft_score=0.0
-        )
-    
-    candidate_skill_names = {s.name.lower() for s in candidate_skills}
-    
-    tech_requirements = [s for s in job_requirements if s.is_technical]
-    soft_requirements = [s for s in job_requirements if not s.is_technical]
+        return _empty_match()
     
     matched_technical = []
     missing_technical = []
-    for skill in tech_requirements:
-        if skill.name.lower() in candidate_skill_names:
-            matched_technical.append(skill.name)
-        else:
-            missing_technical.append(skill.name)
-    
     matched_soft = []
     missing_soft = []
-    for skill in soft_requirements:
-        if skill.name.lower() in candidate_skill_names:
-            matched_soft.append(skill.name)
+    for skill in job_requirements:
+        has_skill = skill.name.lower() in candidate_skill_names
+        if skill.is_technical:
+            (matched_technical if has_skill else missing_technical).append(skill.name)
         else:
-            missing_soft.append(skill.name)
+            (matched_soft if has_skill else missing_soft).append(skill.name)
+    
+    tech_required = len(matched_technical) + len(missing_technical)
+    soft_required = len(matched_soft) + len(missing_soft)
     
     tech_matches_weighted = len(matched_technical) * TECHNICAL_WEIGHT
     soft_matches_weighted = len(matched_soft) * SOFT_WEIGHT
     
-    total_tech_required = len(tech_requirements) * TECHNICAL_WEIGHT
-    total_soft_required = len(soft_requirements) * SOFT_WEIGHT
-    total_weighted_requirements = total_tech_required + total_soft_required
+    total_weighted_requirements = tech_required * TECHNICAL_WEIGHT + soft_required * SOFT_WEIGHT
     
     if total_weighted_requirements == 0:
         score = 0.0
@@ -101,12 +84,12 @@ def calculate_weighted_match(
         score = (tech_matches_weighted + soft_matches_weighted) / total_weighted_requirements
     
     technical_score = 0.0
-    if len(tech_requirements) > 0:
-        technical_score = len(matched_technical) / len(tech_requirements)
+    if tech_required > 0:
+        technical_score = len(matched_technical) / tech_required
     
     soft_score = 0.0
-    if len(soft_requirements) > 0:
-        soft_score = len(matched_soft) / len(soft_requirements)
+    if soft_required > 0:
+        soft_score = len(matched_soft) / soft_required
     
     return MatchResult(
         score=min(score, 1.0),
@@ -119,6 +102,28 @@ def calculate_weighted_match(
     )
 
 
+def calculate_weighted_match(
+    candidate_skills: List[SkillData],
+    job_requirements: List[SkillData]
+) -> MatchResult:
+    """
+    Calculate weighted Jaccard similarity between candidate skills and job requirements.
+    
+    Technical skills receive 2x weight compared to soft skills.
+    This ensures IT-focused candidates get appropriately high scores.
+    
+    Args:
+        candidate_skills: List of skills the candidate possesses
+        job_requirements: List of skills required for the job
+    
+    Returns:
+        MatchResult with detailed breakdown of match score
+    """
+    if not job_requirements:
+        return _empty_match()
+    return _match_against({s.name.lower() for s in candidate_skills}, job_requirements)
+
+
 def calculate_batch_matches(
     candidate_skills: List[SkillData],
     jobs: List[Tuple[int, List[SkillData]]]
@@ -126,6 +131,10 @@ def calculate_batch_matches(
     """
     Calculate match scores for a candidate against multiple jobs.
     
+    The candidate's skill names are normalized once for the whole batch
+    rather than once per job; results are identical to calling
+    `calculate_weighted_match` per job (checked by `benchmarks.matching`).
+    
     Args:
         candidate_skills: List of skills the candidate possesses
         jobs: List of tuples (job_id, job_requirements)
@@ -133,10 +142,11 @@ def calculate_batch_matches(
     Returns:
         Dictionary mapping job_id to MatchResult
     """
-    results = {}
-    for job_id, requirements in jobs:
-        results[job_id] = calculate_weighted_match(candidate_skills, requirements)
-    return results
+    candidate_skill_names = {s.name.lower() for s in candidate_skills}
+    return {
+        job_id: _match_against(candidate_skill_names, requirements)
+        for job_id, requirements in jobs
+    }
 
 
 def get_skill_gap_analysis(
@@ -164,8 +174,8 @@ def get_skill_gap_analysis(
         
         has_skill = 1 if candidate_skill else 0
         required = 1 if job_skill else 0
-        is_technical = (candidate_skill and candidate_skill.is_technical) or \
-                       (job_skill and job_skill.is_technical)
+        is_technical = bool(candidate_skill and candidate_skill.is_technical) or \
+                       bool(job_skill and job_skill.is_technical)
         
         display_name = skill_name.title()
         if candidate_skill:
@@ -0,0 +1,337 @@
+"""
+Note Search Service: Full-Text Search over an Advisor's Notes
+
+Advisors search their own notes by content, optionally narrowed by
+`note_type` and creation date. Results are ranked by relevance, each with a
+short highlighted excerpt, and keyset-paginated on (rank, id).
+
+Two backends, picked by database dialect:
+
+- PostgreSQL: migration 0005 adds a stored `search_vector` column
+  (`to_tsvector('english', content)`) with a GIN index on
+  `(advisor_id, search_vector)`, so the advisor filter and the text match are
+  one index scan. Queries use `websearch_to_tsquery` (words, "quoted
+  phrases", `or`, `-excluded`), ranked by `ts_rank_cd`; `ts_headline` runs
+  only for the rows on the returned page.
+- Anything else: an in-process inverted index per advisor (`NoteIndex`),
+  built on first search from one query and kept in a `ReadThroughCache`.
+  Note writes publish `NOTE_TOPIC` with the advisor id, which drops that
+  advisor's index on every worker. Words are lower-cased, stop words dropped
+  and plurals/-ing/-ed stripped; every remaining word must match (`-word`
+  excludes) and matches are ranked by BM25, with per-note term impacts
+  precomputed so a page of the best matches rarely scores every match.
+
+Rank values are comparable within one backend only. Excerpts are
+HTML-escaped with matches wrapped in `<mark>`.
+"""
+
+import heapq
+import html
+import math
+import re
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import filterfalse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import Float, Row, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.models import Note
+from app.pagination import decode_cursor, keyset_paginate, split_page
+from app.schemas import NoteResponse
+from app.services.invalidation_bus import ALL_KEYS, NOTE_TOPIC, invalidation_bus
+from app.services.reference_cache import ReadThroughCache
+
+
+USE_POSTGRES_FTS = engine.dialect.name == "postgresql"
+SEARCH_CONFIG = "english"  # as in migration 0005
+ORDERING = "notes:search"
+MARK_START, MARK_END = "\ue000", "\ue001"  # private-use code points, swapped for <mark> after escaping
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=30, MinWords=12, "
+    'ShortWord=2, MaxFragments=2, FragmentDelimiter=" … "'
+)
+MAX_CACHED_INDEXES = 64
+SNIPPET_WORDS_BEFORE = 6
+SNIPPET_WORDS = 30
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from had has have he her his i in into is it its me my no not of on "
+    "or our she so that the their them then there these they this to was we were what when which who will "
+    "with you your".split()
+)
+
+SearchHit = Tuple[float, NoteResponse, str]
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Strip common English inflections so "certs"/"cert", "meeting"/"meet" match."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    for suffix in ("ing", "ed"):
+        if len(word) - len(suffix) >= 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def terms(text: str) -> Iterator[str]:
+    return map(stem, filterfalse(STOP_WORDS.__contains__, TOKEN_RE.findall(text.lower())))
+
+
+def parse_query(q: str) -> Tuple[Set[str], Set[str]]:
+    """(required, excluded) terms; quotes are ignored and `-word` excludes."""
+    required, excluded = set(), set()
+    for word in q.replace('"', " ").split():
+        target = excluded if word.startswith("-") and len(word) > 1 else required
+        target.update(terms(word.lstrip("-") if target is excluded else word))
+    return required, excluded - required
+
+
+def mark(text: str) -> str:
+    return html.escape(text).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+def highlight(content: str, matched: Set[str]) -> str:
+    """Escaped excerpt of about `SNIPPET_WORDS` words around the first match."""
+    tokens = list(TOKEN_RE.finditer(content.lower()))
+    hits = [i for i, token in enumerate(tokens) if stem(token.group()) in matched]
+    if not tokens:
+        return html.escape(content)
+    first = max(hits[0] - SNIPPET_WORDS_BEFORE, 0) if hits else 0
+    last = min(first + SNIPPET_WORDS, len(tokens)) - 1
+    start = tokens[first].start() if first else 0
+    end = tokens[last].end() if last < len(tokens) - 1 else len(content)
+
+    parts, position = [], start
+    for i in hits:
+        if first <= i <= last:
+            token = tokens[i]
+            parts.append(content[position:token.start()] + MARK_START + content[token.start():token.end()] + MARK_END)
+            position = token.end()
+    parts.append(content[position:end])
+    excerpt = mark("".join(parts))
+    return ("… " if start else "") + excerpt + (" …" if end < len(content) else "")
+
+
+class NoteIndex:
+    """
+    Inverted index over one advisor's notes: term -> note id -> BM25 term
+    impact, i.e. the term-frequency part of the score with the note's length
+    normalization already applied, so a query only multiplies by idf and sums.
+    Notes are kept as plain rows; `note()` builds the response model for hits.
+    """
+
+    def __init__(self, rows: Iterable[Row]):
+        self.rows: Dict[int, Row] = {}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        self.by_type: Dict[str, Set[int]] = {}
+        self._ranked: Dict[str, List[Tuple[float, int]]] = {}
+        counted = []
+        for row in rows:
+            self.rows[row.id] = row
+            self.by_type.setdefault(row.note_type, set()).add(row.id)
+            counts = Counter(terms(row.content))
+            counted.append((row.id, sum(counts.values()), counts))
+
+        average_length = sum(length for _, length, _ in counted) / len(counted) if counted else 0.0
+        postings = self.postings
+        for note_id, length, counts in counted:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length) if average_length else BM25_K1
+            for term, frequency in counts.items():
+                impacts = postings.get(term)
+                if impacts is None:
+                    impacts = postings[term] = {}
+                impacts[note_id] = frequency * (BM25_K1 + 1) / (frequency + norm)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def note(self, note_id: int) -> NoteResponse:
+        return NoteResponse.model_validate(self.rows[note_id])
+
+    def ranked(self, term: str) -> List[Tuple[float, int]]:
+        """The term's postings as (impact, note id), highest impact first (sorted on first use)."""
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            ranked = self._ranked[term] = sorted(
+                ((impact, note_id) for note_id, impact in self.postings[term].items()), reverse=True
+            )
+        return ranked
+
+    def search(
+        self,
+        required: Set[str],
+        excluded: Set[str],
+        limit: int,
+        note_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[float, int]]:
+        """
+        Top `limit` (score, note id) of notes containing every required term
+        and no excluded one, ranked below `after`, best BM25 score first.
+
+        Walks the rarest term's postings by descending impact and probes the
+        others; it stops as soon as no remaining note can beat the current
+        top `limit` (MaxScore), so page one rarely reads a whole posting list.
+        """
+        if any(term not in self.postings for term in required):
+            return []
+        # Fixed term order keeps the float sums, and so cursors, identical across workers.
+        ordered = sorted(required, key=lambda term: (len(self.postings[term]), term))
+        idfs = [
+            math.log(1 + (len(self.rows) - len(self.postings[term]) + 0.5) / (len(self.postings[term]) + 0.5))
+            for term in ordered
+        ]
+        others = [(self.postings[term], idf) for term, idf in zip(ordered[1:], idfs[1:])]
+        others_bound = sum(idf * self.ranked(term)[0][0] for term, idf in zip(ordered[1:], idfs[1:]))
+        excluded_impacts = [self.postings[term] for term in excluded if term in self.postings]
+        of_type = self.by_type.get(note_type, set()) if note_type is not None else None
+        rows = self.rows
+
+        top: List[Tuple[float, int]] = []
+        for impact, note_id in self.ranked(ordered[0]):
+            score = idfs[0] * impact
+            if len(top) == limit and top[0][0] > score + others_bound:
+                break
+            if of_type is not None and note_id not in of_type:
+                continue
+            if any(note_id not in impacts for impacts, _ in others):
+                continue
+            if any(note_id in impacts for impacts in excluded_impacts):
+                continue
+            if since is not None or until is not None:
+                created_at = rows[note_id].created_at
+                if (since is not None and created_at < since) or (until is not None and created_at >= until):
+                    continue
+            for impacts, idf in others:
+                score += idf * impacts[note_id]
+            hit = (score, note_id)
+            if after is not None and not hit < after:
+                continue
+            if len(top) < limit:
+                heapq.heappush(top, hit)
+            elif hit > top[0]:
+                heapq.heapreplace(top, hit)
+        return sorted(top, reverse=True)
+
+
+async def _load_note_index(db: AsyncSession, advisor_id: int) -> NoteIndex:
+    result = await db.execute(
+        select(Note.id, Note.advisor_id, Note.student_id, Note.content, Note.note_type, Note.created_at, Note.updated_at)
+        .where(Note.advisor_id == advisor_id)
+    )
+    return NoteIndex(result.all())
+
+
+note_index_cache: ReadThroughCache[int, NoteIndex] = ReadThroughCache(
+    "note_index", _load_note_index, max_size=MAX_CACHED_INDEXES
+)
+
+
+@invalidation_bus.subscribe(NOTE_TOPIC)
+def _drop_note_indexes(keys):
+    if ALL_KEYS in keys:
+        note_index_cache.invalidate()
+        return
+    for key in keys:
+        note_index_cache.invalidate(int(key))
+
+
+def day_bounds(start_date: Optional[date], end_date: Optional[date]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """[start of start_date, start of the day after end_date)."""
+    since = datetime.combine(start_date, time()) if start_date else None
+    until = datetime.combine(end_date + timedelta(days=1), time()) if end_date else None
+    return since, until
+
+
+async def _search_postgres(
+    db: AsyncSession,
+    advisor_id: int,
+    q: str,
+    note_type: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[SearchHit], Optional[str]]:
+    query_ts = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    search_vector = literal_column("notes.search_vector")
+    rank = func.ts_rank_cd(search_vector, query_ts, type_=Float)
+
+    matches = (
+        select(Note.id, rank.label("rank"))
+        .where(Note.advisor_id == advisor_id)
+        .where(search_vector.op("@@")(query_ts))
+    )
+    if note_type is not None:
+        matches = matches.where(Note.note_type == note_type)
+    if since is not None:
+        matches = matches.where(Note.created_at >= since)
+    if until is not None:
+        matches = matches.where(Note.created_at < until)
+    page = keyset_paginate(matches, ORDERING, rank, Note.id, cursor, limit).subquery()
+
+    result = await db.execute(
+        select(Note, page.c.rank, func.ts_headline(SEARCH_CONFIG, Note.content, query_ts, HEADLINE_OPTIONS))
+        .join(page, page.c.id == Note.id)
+        .order_by(page.c.rank.desc(), Note.id.desc())
+    )
+    hits = [(rank_value, NoteResponse.model_validate(note), mark(headline)) for note, rank_value, headline in result.all()]
+    return split_page(hits, limit, ORDERING, key=lambda hit: (hit[0], hit[1].id))
+
+
+async def _search_index(
+    db: AsyncSession,
+    advisor_id: int,
+    q: str,
+    note_type: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[SearchHit], Optional[str]]:
+    required, excluded = parse_query(q)
+    if not required:
+        return [], None
+    index = await note_index_cache.get(db, advisor_id)
+    after = decode_cursor(cursor, ORDERING) if cursor else None
+    hits, next_cursor = split_page(
+        index.search(required, excluded, limit + 1, note_type, since, until, after),
+        limit, ORDERING, key=lambda hit: hit
+    )
+    results = []
+    for score, note_id in hits:
+        note = index.note(note_id)
+        results.append((score, note, highlight(note.content, required)))
+    return results, next_cursor
+
+
+async def search_notes(
+    db: AsyncSession,
+    advisor_id: int,
+    q: str,
+    note_type: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20
+) -> Tuple[List[SearchHit], Optional[str]]:
+    """One page of (rank, note, highlighted excerpt), best match first, and the next cursor."""
+    since, until = day_bounds(start_date, end_date)
+    search = _search_postgres if USE_POSTGRES_FTS else _search_index
+    return await search(db, advisor_id, q, note_type, since, until, cursor, limit)
+
+
+def note_search_stats() -> Dict[str, Any]:
+    return {"backend": "postgres" if USE_POSTGRES_FTS else "inverted_index", "indexes": note_index_cache.stats()}
@@ -1,8 +1,8 @@
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from app.models import Notification, NotificationType, User, Application, Job
-from typing import Optional
+from typing import List, Optional
 
 
 async def create_notification(
@@ -37,14 +37,7 @@ async def notify_application_submitted(db: AsyncSession, application: Applicatio
     )
 
 
-async def notify_application_status_changed(
-    db: AsyncSession,
-    application: Application,
-    job: Job,
-    old_status: str,
-    new_status: str,
-    feedback_notes: Optional[str] = None
-):
+def _status_changed_content(job: Job, new_status: str, feedback_notes: Optional[str] = None) -> dict:
     status_messages = {
         "reviewed": "Your application is being reviewed",
         "interview": "Congratulations! You've been selected for an interview",
@@ -58,16 +51,48 @@ async def notify_application_status_changed(
     if feedback_notes:
         message += f" Employer notes: {feedback_notes}"
     
+    return {
+        "notification_type": NotificationType.APPLICATION_STATUS_CHANGED,
+        "title": f"Application Update: {new_status.title()}",
+        "message": message,
+        "link": f"/applications"
+    }
+
+
+async def notify_application_status_changed(
+    db: AsyncSession,
+    application: Application,
+    job: Job,
+    old_status: str,
+    new_status: str,
+    feedback_notes: Optional[str] = None
+):
     await create_notification(
         db=db,
         user_id=application.applicant_id,
-        notification_type=NotificationType.APPLICATION_STATUS_CHANGED,
-        title=f"Application Update: {new_status.title()}",
-        message=message,
-        link=f"/applications"
+        **_status_changed_content(job, new_status, feedback_notes)
     )
 
 
+async def notify_applications_status_changed(
+    db: AsyncSession,
+    applications: List[Application],
+    new_status: str,
+    feedback_notes: Optional[str] = None
+):
+    """One status notification per application, inserted in a single statement
+    inside the caller's transaction (the caller commits)."""
+    if not applications:
+        return
+    await db.execute(insert(Notification), [
+        {
+            "user_id": application.applicant_id,
+            **_status_changed_content(application.job, new_status, feedback_notes)
+        }
+        for application in applications
+    ])
+
+
 async def notify_interview_scheduled(
     db: AsyncSession,
     user_id: int,
@@ -0,0 +1,160 @@
+"""
+Reference Cache Service: Process-Local Read-Through Cache
+
+CareerDetail, LearningResource and Skill rows only change on seed or admin
+edits. This module keeps validated response models for them in size-bounded
+LRU caches with a TTL, so catalog lookups become dictionary reads.
+Learning resources are held as a pre-ranked `ResourceIndex`.
+
+- Misses fall through to an async loader that queries the database.
+- Every cache is cleared when the catalog version is bumped
+  (see `app.services.catalog_cache`), or explicitly via `invalidate()`.
+- `warm_reference_caches()` preloads everything during application startup.
+- `reference_cache_stats()` reports hits, misses and hit ratio per cache.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models import CareerDetail, LearningResource, Skill
+from app.schemas import CareerDetailResponse, LearningResourceResponse, SkillResponse
+from app.services.catalog_cache import on_catalog_change
+from app.services.resource_index import ResourceIndex
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_SIZE = 4096
+ALL = "__all__"
+
+
+class ReadThroughCache(Generic[K, V]):
+    """LRU + TTL cache that loads missing keys through an async loader."""
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[AsyncSession, K], Awaitable[V]],
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ):
+        self.name = name
+        self.loader = loader
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def peek(self, key: K) -> Tuple[bool, Optional[V]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def get(self, db: AsyncSession, key: K) -> V:
+        found, value = self.peek(key)
+        if found:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = await self.loader(db, key)
+        self.put(key, value)
+        return value
+
+    def put(self, key: K, value: V):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[K] = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+async def _load_all_careers(db: AsyncSession, _key: str) -> List[CareerDetailResponse]:
+    result = await db.execute(select(CareerDetail))
+    careers = [CareerDetailResponse.model_validate(c) for c in result.scalars().all()]
+    careers.sort(key=lambda c: (c.title, c.id))
+    return careers
+
+
+async def _load_career(db: AsyncSession, soc_code: str) -> Optional[CareerDetailResponse]:
+    result = await db.execute(select(CareerDetail).where(CareerDetail.soc_code == soc_code))
+    career = result.scalar_one_or_none()
+    return CareerDetailResponse.model_validate(career) if career else None
+
+
+async def _load_resource_index(db: AsyncSession, _key: str) -> ResourceIndex:
+    result = await db.execute(select(LearningResource))
+    return ResourceIndex(LearningResourceResponse.model_validate(r) for r in result.scalars().all())
+
+
+async def _load_all_skills(db: AsyncSession, _key: str) -> List[SkillResponse]:
+    result = await db.execute(select(Skill).order_by(Skill.is_technical.desc(), Skill.name))
+    return [SkillResponse.model_validate(s) for s in result.scalars().all()]
+
+
+async def _load_skill_index(db: AsyncSession, _key: str) -> Dict[int, SkillResponse]:
+    return {s.id: s for s in await all_skills_cache.get(db, ALL)}
+
+
+all_careers_cache: ReadThroughCache[str, List[CareerDetailResponse]] = ReadThroughCache("careers", _load_all_careers, max_size=1)
+career_cache: ReadThroughCache[str, Optional[CareerDetailResponse]] = ReadThroughCache("career_detail", _load_career)
+resource_index_cache: ReadThroughCache[str, ResourceIndex] = ReadThroughCache("resource_index", _load_resource_index, max_size=1)
+all_skills_cache: ReadThroughCache[str, List[SkillResponse]] = ReadThroughCache("skills", _load_all_skills, max_size=1)
+skill_index_cache: ReadThroughCache[str, Dict[int, SkillResponse]] = ReadThroughCache("skill_index", _load_skill_index, max_size=1)
+
+REFERENCE_CACHES = (all_careers_cache, career_cache, resource_index_cache, all_skills_cache, skill_index_cache)
+
+
+@on_catalog_change
+def invalidate_reference_caches(_version: int = 0):
+    for cache in REFERENCE_CACHES:
+        cache.invalidate()
+
+
+def reference_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {cache.name: cache.stats() for cache in REFERENCE_CACHES}
+
+
+async def warm_reference_caches():
+    """Preload every reference cache so the first requests are dictionary reads."""
+    async with AsyncSessionLocal() as db:
+        careers = await _load_all_careers(db, ALL)
+        all_careers_cache.put(ALL, careers)
+        for career in careers:
+            career_cache.put(career.soc_code, career)
+
+        all_skills_cache.put(ALL, await _load_all_skills(db, ALL))
+        skill_index_cache.put(ALL, await _load_skill_index(db, ALL))
+
+        resource_index_cache.put(ALL, await _load_resource_index(db, ALL))
@@ -0,0 +1,305 @@
+"""
+Request Metrics Service: Per-Route Latency, Query Counts and /api/metrics
+
+`RequestMetricsMiddleware` is a plain ASGI middleware (no per-request
+task or body buffering) that records, per route template:
+
+- request counts by status code and a latency histogram
+- the number of requests in flight
+- SQL statements executed and time spent in the database, measured with
+  `before/after_cursor_execute` events on `app.database.engine`
+
+The current request's counters live in a context variable, which SQLAlchemy
+carries into its greenlets, so background tasks never count against a
+request. Requests issuing more than `QUERY_BUDGET` statements (env, default
+25) are logged, with their most repeated statement shape (see
+`statement_shape`; a shape repeated per row is the signature of an N+1),
+and counted in `http_requests_over_query_budget_total`.
+
+`capture_queries()` collects the same per-statement counts around any block
+of code, including a request served in-process; `benchmarks/query_budgets.py`
+uses it to enforce per-endpoint query budgets.
+
+`render_metrics()` produces the Prometheus text exposition format served
+at `/api/metrics`; no client library is needed. The endpoint only answers
+scrapers that pass `metrics_access_allowed()`: a bearer token equal to
+`METRICS_TOKEN`, or a direct (not proxied) connection from an address in
+`METRICS_ALLOW` (default loopback only). Method labels are clamped to the
+standard HTTP verbs, so arbitrary methods cannot create new series.
+"""
+
+import hmac
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+from app.database import engine
+
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET = int(os.environ.get("QUERY_BUDGET", "25"))
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE"})
+OTHER_METHOD = "OTHER"
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_ALLOW = frozenset(
+    host.strip() for host in os.environ.get("METRICS_ALLOW", "127.0.0.1,::1").split(",") if host.strip()
+)
+FORWARDING_HEADERS = ("forwarded", "x-forwarded-for", "x-real-ip")
+ROUTE_TEMPLATE_KEY = "metrics.route"
+
+
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()']|'[^']*')*\)", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+")
+_VALUES_ROWS = re.compile(r"(\([?,\s]*\))(?:\s*,\s*\([?,\s]*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a SQL statement so executions that differ only in their values
+    compare equal: literals and placeholders become `?`, IN lists `IN (...)`
+    (expanding IN renders one placeholder per value), multi-row VALUES lists
+    one row, and whitespace collapses.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _VALUES_ROWS.sub(r"\1", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """SQL statements and database seconds attributed to one request or block."""
+
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def shapes(self) -> Dict[str, int]:
+        """Executions per normalized statement shape."""
+        shapes: Dict[str, int] = {}
+        for statement, count in self.statements.items():
+            shape = statement_shape(statement)
+            shapes[shape] = shapes.get(shape, 0) + count
+        return shapes
+
+    def repeated_shapes(self, min_count: int = 2) -> List[Tuple[str, int]]:
+        """Shapes executed at least `min_count` times, most repeated first."""
+        repeated = [(shape, count) for shape, count in self.shapes().items() if count >= min_count]
+        repeated.sort(key=lambda item: item[1], reverse=True)
+        return repeated
+
+
+_current_queries: ContextVar[Tuple[QueryStats, ...]] = ContextVar("current_queries", default=())
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Collect every SQL statement executed in this context (nests with requests)."""
+    stats = QueryStats()
+    token = _current_queries.set(_current_queries.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _current_queries.reset(token)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_queries.get():
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = _current_queries.get()
+    if collectors:
+        elapsed = time.perf_counter() - getattr(context, "_query_started", time.perf_counter())
+        for stats in collectors:
+            stats.record(statement, elapsed)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class RouteMetrics:
+    __slots__ = ("requests", "in_flight", "latency", "queries", "db_seconds", "over_budget")
+
+    def __init__(self):
+        self.requests: Dict[int, int] = {}
+        self.in_flight = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_seconds = Histogram(LATENCY_BUCKETS)
+        self.over_budget = 0
+
+
+_routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+
+def _route_metrics(method: str, route: str) -> RouteMetrics:
+    key = (method if method in HTTP_METHODS else OTHER_METHOD, route)
+    metrics = _routes.get(key)
+    if metrics is None:
+        metrics = _routes[key] = RouteMetrics()
+    return metrics
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = QueryStats()
+        token = _current_queries.set(_current_queries.get() + (queries,))
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_queries.reset(token)
+            template = scope.get(ROUTE_TEMPLATE_KEY) or UNMATCHED_ROUTE
+            metrics = _route_metrics(scope["method"], template)
+            metrics.requests[status_code] = metrics.requests.get(status_code, 0) + 1
+            metrics.latency.observe(elapsed)
+            metrics.queries.observe(queries.count)
+            metrics.db_seconds.observe(queries.seconds)
+            if queries.count > QUERY_BUDGET:
+                metrics.over_budget += 1
+                repeated = queries.repeated_shapes()
+                logger.warning(
+                    "%s %s ran %d SQL statements (budget %d, %.1f ms in DB)%s",
+                    scope["method"], template, queries.count, QUERY_BUDGET, queries.seconds * 1000,
+                    f"; repeated {repeated[0][1]}x: {repeated[0][0][:200]}" if repeated else ""
+                )
+
+
+class _RouteInFlight:
+    """
+    Wraps one route's ASGI app to count its in-flight requests and to tag
+    the (shared) scope with the route template for the middleware.
+    """
+
+    def __init__(self, app, template: str):
+        self.app = app
+        self.template = template
+
+    async def __call__(self, scope, receive, send):
+        scope[ROUTE_TEMPLATE_KEY] = self.template
+        metrics = _route_metrics(scope["method"], self.template)
+        metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            metrics.in_flight -= 1
+
+
+def instrument_routes(app):
+    """Wrap every registered route (call after all include_router calls)."""
+    for route in app.router.routes:
+        if hasattr(route, "app") and hasattr(route, "path") and not isinstance(route.app, _RouteInFlight):
+            route.app = _RouteInFlight(route.app, route.path)
+
+
+def metrics_access_allowed(request) -> bool:
+    """May this request read /api/metrics? (token, or a direct allowlisted client)"""
+    authorization = request.headers.get("authorization", "")
+    if METRICS_TOKEN and hmac.compare_digest(authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()):
+        return True
+    # Behind a reverse proxy every client looks local; only trust direct connections.
+    if any(header in request.headers for header in FORWARDING_HEADERS):
+        return False
+    return request.client is not None and request.client.host in METRICS_ALLOW
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, labels: Dict[str, str]) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+    lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {histogram.count}')
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.total}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def render_metrics() -> str:
+    """All route metrics in the Prometheus text exposition format."""
+    sections = {
+        "http_requests_total": ("counter", "Requests by route and status code.", []),
+        "http_requests_in_flight": ("gauge", "Requests currently being handled.", []),
+        "http_request_duration_seconds": ("histogram", "Request latency.", []),
+        "http_request_db_queries": ("histogram", "SQL statements per request.", []),
+        "http_request_db_seconds": ("histogram", "Time spent in SQL per request.", []),
+        "http_requests_over_query_budget_total": ("counter", f"Requests above {QUERY_BUDGET} SQL statements.", []),
+    }
+    for (method, route), metrics in sorted(_routes.items()):
+        labels = {"method": method, "route": route}
+        for status_code, count in sorted(metrics.requests.items()):
+            sections["http_requests_total"][2].append(f"http_requests_total{_labels(**labels, status=status_code)} {count}")
+        sections["http_requests_in_flight"][2].append(f"http_requests_in_flight{_labels(**labels)} {metrics.in_flight}")
+        sections["http_request_duration_seconds"][2].extend(_histogram_lines("http_request_duration_seconds", metrics.latency, labels))
+        sections["http_request_db_queries"][2].extend(_histogram_lines("http_request_db_queries", metrics.queries, labels))
+        sections["http_request_db_seconds"][2].extend(_histogram_lines("http_request_db_seconds", metrics.db_seconds, labels))
+        if metrics.over_budget:
+            sections["http_requests_over_query_budget_total"][2].append(
+                f"http_requests_over_query_budget_total{_labels(**labels)} {metrics.over_budget}"
+            )
+
+    lines = []
+    for name, (kind, help_text, samples) in sections.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
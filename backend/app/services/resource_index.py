@@ -0,0 +1,94 @@
+"""
+Resource Index Service: Pre-Ranked Learning Resources per Skill
+
+Learning resources are recommended for a student's missing skills. This
+module holds every resource in memory, grouped by skill and pre-sorted by
+recommendation rank, so lookups never touch the database:
+
+- Rank: free first, then easier difficulty, then fewer estimated hours,
+  then title.
+- `for_skills()` merges the per-skill lists with a k-way merge
+  (`heapq.merge`), so the top N across several skills costs O(N log k).
+- `learning_plan()` runs greedy set cover: resources sharing a URL are one
+  course covering several skills, and the plan repeatedly takes the course
+  covering the most still-missing skills (ties go to the better rank).
+
+The index itself is cached in `app.services.reference_cache` and rebuilt
+when the catalog version changes.
+"""
+
+import heapq
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.schemas import LearningResourceResponse
+
+
+DIFFICULTY_ORDER = {"beginner": 0, "intermediate": 1, "advanced": 2}
+UNKNOWN_DIFFICULTY = 1.5
+
+
+def resource_rank(resource: LearningResourceResponse) -> Tuple:
+    difficulty = DIFFICULTY_ORDER.get((resource.difficulty_level or "").lower(), UNKNOWN_DIFFICULTY)
+    hours = resource.estimated_hours if resource.estimated_hours is not None else float("inf")
+    return (not resource.is_free, difficulty, hours, resource.title, resource.id)
+
+
+class ResourceIndex:
+    """Immutable skill -> ranked resources index with course grouping by URL."""
+
+    def __init__(self, resources: Iterable[LearningResourceResponse]):
+        by_skill: Dict[int, List[LearningResourceResponse]] = {}
+        by_url: Dict[str, List[LearningResourceResponse]] = {}
+        for resource in resources:
+            by_skill.setdefault(resource.skill_id, []).append(resource)
+            by_url.setdefault(resource.url, []).append(resource)
+
+        self.by_skill = {skill_id: sorted(items, key=resource_rank) for skill_id, items in by_skill.items()}
+        self.courses: Dict[str, Tuple[Tuple, Set[int], List[LearningResourceResponse]]] = {}
+        for url, items in by_url.items():
+            items.sort(key=resource_rank)
+            self.courses[url] = (resource_rank(items[0]), {r.skill_id for r in items}, items)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.by_skill.values())
+
+    def for_skill(self, skill_id: int) -> List[LearningResourceResponse]:
+        return self.by_skill.get(skill_id, [])
+
+    def for_skills(self, skill_ids: Iterable[int], limit: Optional[int] = None) -> List[LearningResourceResponse]:
+        """Best-ranked resources across `skill_ids`, merged from the per-skill lists."""
+        lists = [self.by_skill[skill_id] for skill_id in dict.fromkeys(skill_ids) if skill_id in self.by_skill]
+        merged = heapq.merge(*lists, key=resource_rank)
+        return list(islice(merged, limit) if limit is not None else merged)
+
+    def learning_plan(self, skill_ids: Iterable[int]) -> Dict:
+        """Fewest courses covering `skill_ids` (greedy set cover)."""
+        skill_ids = list(skill_ids)
+        uncovered = {skill_id for skill_id in skill_ids if skill_id in self.by_skill}
+        missing = sorted(set(skill_ids) - uncovered)
+        candidates = {
+            url: course for url, course in self.courses.items()
+            if course[1] & uncovered
+        }
+
+        steps = []
+        while uncovered and candidates:
+            url, (rank, skills, items) = min(
+                candidates.items(),
+                key=lambda entry: (-len(entry[1][1] & uncovered), entry[1][0])
+            )
+            covered = skills & uncovered
+            uncovered -= covered
+            del candidates[url]
+            steps.append({
+                "resource": items[0],
+                "covers_skill_ids": sorted(covered),
+            })
+            candidates = {u: c for u, c in candidates.items() if c[1] & uncovered}
+
+        return {
+            "steps": steps,
+            "uncovered_skill_ids": sorted(set(missing) | uncovered),
+            "total_estimated_hours": sum(step["resource"].estimated_hours or 0 for step in steps),
+        }
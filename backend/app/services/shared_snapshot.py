@@ -0,0 +1,321 @@
+"""
+Shared Snapshot Service: Memory-Mapped Job/Skill Matrix Across Workers
+
+Ranking a student against every active job (`refresh_student_matches`)
+needs the whole job -> required skills matrix. Rather than each uvicorn
+worker querying or caching its own copy, the matrix is published as a
+node-local file that every worker maps read-only, so the pages live once in
+the OS page cache however many workers run:
+
+- Layout: a fixed header (magic, epoch, version, counts) followed by CSR
+  arrays in native byte order: sorted active `job_ids` (int64), `offsets`
+  (int64, one per job plus one) and the concatenated `skill_ids` (int32).
+  Readers get zero-copy typed views with `memoryview.cast`, so no NumPy.
+- Versioning: the `data_versions` row `job_matrix` is bumped inside any
+  transaction that creates, deletes, (de)activates or re-skills a job or
+  deletes a skill. Flushes only note the change; the UPDATE runs as the
+  last statement before COMMIT, so the row lock it takes is held for the
+  commit alone and concurrent job writes do not queue behind each other's
+  request work. A reader compares the row (one primary-key query) with
+  the mapped header and falls back to SQL when they differ, so a stale
+  snapshot is never used; the mismatch schedules a background republish.
+  Job writes also publish `JOB_TOPIC` on the invalidation bus, and every
+  worker republishes on receipt, so readers rarely see the mismatch.
+- Atomic swap: a new snapshot is written to a temporary file, fsynced and
+  `os.replace`d over the old one. Readers notice the new inode and remap;
+  views of the old mapping stay valid until they are dropped.
+
+The directory is `SHARED_SNAPSHOT_DIR` (default: a folder in the system
+temp dir). `job_matrix.stats()` is reported by /api/health.
+"""
+
+import array
+import asyncio
+import contextvars
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import AsyncSessionLocal
+from app.models import Job, Skill, data_versions, job_skills
+from app.services.invalidation_bus import JOB_TOPIC, invalidation_bus
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX development machines
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+JOB_MATRIX = "job_matrix"
+SNAPSHOT_DIR = os.environ.get("SHARED_SNAPSHOT_DIR") or os.path.join(tempfile.gettempdir(), "pathfinder-snapshots")
+SNAPSHOT_MAGIC = b"PFJOBMX1"
+HEADER = struct.Struct("<8s32sqqqq")
+HEADER_SIZE = 128
+_SESSION_FLAG = "job_matrix_changed"
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class JobMatrixSnapshot:
+    """Read-only view of one published snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.file_id = (stat.st_dev, stat.st_ino)
+        self.size = stat.st_size
+
+        magic, epoch, version, job_count, skill_count, created_ns = HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a job matrix snapshot")
+        self.epoch = epoch.decode("ascii")
+        self.version = version
+        self.created_at = created_ns / 1e9
+
+        view = memoryview(self._mmap)
+        position = HEADER_SIZE
+        self.job_ids = view[position:position + job_count * 8].cast("q")
+        position += job_count * 8
+        self.offsets = view[position:position + (job_count + 1) * 8].cast("q")
+        position += (job_count + 1) * 8
+        self.skill_ids = view[position:position + skill_count * 4].cast("i")
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def requirements(self) -> Dict[int, memoryview]:
+        """Required skill ids per active job, as zero-copy slices."""
+        offsets = self.offsets
+        skill_ids = self.skill_ids
+        return {
+            job_id: skill_ids[offsets[i]:offsets[i + 1]]
+            for i, job_id in enumerate(self.job_ids)
+        }
+
+    def matches(self, epoch: str, version: int) -> bool:
+        return self.epoch == epoch and self.version == version
+
+
+def write_snapshot(path: str, epoch: str, version: int, rows) -> int:
+    """Write (job_id, skill_id) rows ordered by job_id to `path` atomically."""
+    job_ids = array.array("q")
+    offsets = array.array("q", [0])
+    skill_ids = array.array("i")
+    for job_id, skill_id in rows:
+        if not job_ids or job_ids[-1] != job_id:
+            if job_ids:
+                offsets.append(len(skill_ids))
+            job_ids.append(job_id)
+        skill_ids.append(skill_id)
+    if job_ids:
+        offsets.append(len(skill_ids))
+
+    header = HEADER.pack(SNAPSHOT_MAGIC, epoch.encode("ascii"), version, len(job_ids), len(skill_ids), time.time_ns())
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(job_ids.tobytes())
+        f.write(offsets.tobytes())
+        f.write(skill_ids.tobytes())
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(job_ids)
+
+
+async def get_data_version(db: AsyncSession, name: str = JOB_MATRIX) -> Optional[Tuple[str, int]]:
+    row = (await db.execute(
+        select(data_versions.c.epoch, data_versions.c.version).where(data_versions.c.name == name)
+    )).first()
+    return (row.epoch, row.version) if row else None
+
+
+class SharedJobMatrix:
+    """Maps the current snapshot and republishes it when the data version moves."""
+
+    def __init__(self, directory: str = SNAPSHOT_DIR):
+        self.path = os.path.join(directory, "job_matrix.bin")
+        self._lock_path = os.path.join(directory, "job_matrix.lock")
+        self._snapshot: Optional[JobMatrixSnapshot] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.fallbacks = 0
+        self.publishes = 0
+        self.last_publish_ms: Optional[float] = None
+
+    def mapped(self) -> Optional[JobMatrixSnapshot]:
+        """The newest published snapshot, remapped if the file was swapped."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        if self._snapshot is None or self._snapshot.file_id != (stat.st_dev, stat.st_ino):
+            try:
+                self._snapshot = JobMatrixSnapshot(self.path)
+            except (OSError, ValueError):
+                logger.exception("Could not map job matrix snapshot")
+                return None
+        return self._snapshot
+
+    async def current(self, db: AsyncSession) -> Optional[JobMatrixSnapshot]:
+        """The mapped snapshot if it matches the database version, else None."""
+        version = await get_data_version(db)
+        snapshot = self.mapped()
+        if version and snapshot and snapshot.matches(*version):
+            self.hits += 1
+            return snapshot
+        self.fallbacks += 1
+        if version:
+            self.schedule_publish()
+        return None
+
+    async def publish(self, db: AsyncSession) -> Optional[int]:
+        """
+        Write a snapshot for the current data version unless one exists.
+
+        The version is read before the matrix, so a concurrent writer can only
+        make the file newer than its label, never older.
+        """
+        version = await get_data_version(db)
+        if not version:
+            return None
+        snapshot = self.mapped()
+        if snapshot and snapshot.matches(*version):
+            return snapshot.version
+
+        started = time.perf_counter()
+        rows = await db.execute(
+            select(job_skills.c.job_id, job_skills.c.skill_id)
+            .join(Job, Job.id == job_skills.c.job_id)
+            .where(Job.is_active == True)
+            .order_by(job_skills.c.job_id, job_skills.c.skill_id)
+        )
+        if await asyncio.to_thread(self._write_locked, version, rows.all()):
+            self.publishes += 1
+            self.last_publish_ms = round((time.perf_counter() - started) * 1000, 2)
+        return version[1]
+
+    def _write_locked(self, version: Tuple[str, int], rows) -> bool:
+        """Write under a node-wide file lock, unless another worker just did."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self._lock_path, "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            current = self._peek_version()
+            if current is not None and current == version:
+                return False
+            write_snapshot(self.path, version[0], version[1], rows)
+            return True
+
+    def _peek_version(self) -> Optional[Tuple[str, int]]:
+        try:
+            with open(self.path, "rb") as f:
+                magic, epoch, version, *_ = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return None
+        return (epoch.decode("ascii"), version) if magic == SNAPSHOT_MAGIC else None
+
+    def schedule_publish(self):
+        if self._publish_task is None or self._publish_task.done():
+            # A fresh context, so the request that noticed the stale snapshot
+            # is not charged for the republish queries.
+            self._publish_task = asyncio.get_running_loop().create_task(
+                self._publish_in_background(), context=contextvars.Context()
+            )
+
+    async def _publish_in_background(self):
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.publish(db)
+        except Exception:
+            logger.exception("Publishing the job matrix snapshot failed")
+
+    async def ensure_current(self):
+        async with AsyncSessionLocal() as db:
+            await self.publish(db)
+
+    async def stop(self):
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            try:
+                await self._publish_task
+            except asyncio.CancelledError:
+                pass
+            self._publish_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "path": self.path,
+            "version": snapshot.version if snapshot else None,
+            "jobs": len(snapshot) if snapshot else 0,
+            "bytes": snapshot.size if snapshot else 0,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "publishes": self.publishes,
+            "last_publish_ms": self.last_publish_ms,
+        }
+
+
+job_matrix = SharedJobMatrix()
+
+
+@invalidation_bus.subscribe(JOB_TOPIC)
+def _republish_on_job_change(_keys):
+    # publish() returns after one version query when another worker on the
+    # node already wrote the new snapshot.
+    job_matrix.schedule_publish()
+
+
+def _changes_job_matrix(session: Session) -> bool:
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Job) or (isinstance(obj, Skill) and obj in session.deleted):
+            return True
+    for obj in session.dirty:
+        if isinstance(obj, Job):
+            attrs = inspect(obj).attrs
+            if attrs.is_active.history.has_changes() or attrs.required_skills.history.has_changes():
+                return True
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _note_job_matrix_change(session, flush_context):
+    if not session.info.get(_SESSION_FLAG) and _changes_job_matrix(session):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_job_matrix_version(session):
+    # Most commits touch no job: skip them without flushing.
+    if not session.info.get(_SESSION_FLAG) and not _changes_job_matrix(session):
+        return
+    # before_commit fires ahead of commit's own flush; flush here so those
+    # changes are noted and the UPDATE is the transaction's last statement.
+    session.flush()
+    if session.info.pop(_SESSION_FLAG, None):
+        session.connection().execute(
+            update(data_versions)
+            .where(data_versions.c.name == JOB_MATRIX)
+            .values(version=data_versions.c.version + 1)
+        )
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_job_matrix_flag(session):
+    session.info.pop(_SESSION_FLAG, None)
@@ -0,0 +1,191 @@
+"""
+Static Assets Service: In-Memory SPA Manifest
+
+This module loads the built frontend (frontend/dist) into memory once at
+startup so the catch-all SPA route never touches the filesystem per request.
+
+For every file the manifest keeps:
+- the raw bytes plus a strong ETag derived from their content
+- a Brotli variant (prebuilt `.br` file, or compressed at load time when the
+  optional `brotli` package is installed)
+- a gzip variant (prebuilt `.gz` file, or compressed at load time)
+
+Vite emits content-hashed filenames under `assets/`, so those are served with
+a one-year immutable Cache-Control. `index.html` must always be revalidated.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+INDEX_FILE = "index.html"
+HASHED_ASSET_PATTERN = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+COMPRESSIBLE_SUFFIXES = {".js", ".mjs", ".css", ".html", ".svg", ".json", ".txt", ".map", ".xml", ".ico"}
+MIN_COMPRESS_SIZE = 1024
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+@dataclass
+class StaticEntry:
+    """A single file from the frontend build, held in memory."""
+    path: str
+    media_type: str
+    body: bytes
+    etag: str
+    cache_control: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+
+def _strong_etag(content: bytes) -> str:
+    return '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+
+
+def _variant_etag(etag: str, encoding: str) -> str:
+    return etag[:-1] + "-" + encoding + '"'
+
+
+def _accepted_encodings(request: Request) -> Dict[str, float]:
+    accepted = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        pieces = part.strip().split(";")
+        name = pieces[0].strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in pieces[1:]:
+            param = param.strip()
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class StaticManifest:
+    """In-memory manifest of a built single-page application."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.entries: Dict[str, StaticEntry] = {}
+        self.load()
+
+    def load(self):
+        entries = {}
+        for file_path in sorted(self.root.rglob("*")):
+            if not file_path.is_file() or file_path.suffix in (".br", ".gz"):
+                continue
+            relative = file_path.relative_to(self.root).as_posix()
+            entries[relative] = self._build_entry(file_path, relative)
+        self.entries = entries
+
+    def _build_entry(self, file_path: Path, relative: str) -> StaticEntry:
+        body = file_path.read_bytes()
+        media_type = mimetypes.guess_type(relative)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type in ("application/javascript", "image/svg+xml"):
+            media_type = f"{media_type}; charset=utf-8"
+
+        if relative.startswith("assets/") and HASHED_ASSET_PATTERN.search(relative):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+
+        entry = StaticEntry(
+            path=relative,
+            media_type=media_type,
+            body=body,
+            etag=_strong_etag(body),
+            cache_control=cache_control
+        )
+
+        brotli_file = file_path.with_name(file_path.name + ".br")
+        gzip_file = file_path.with_name(file_path.name + ".gz")
+        compressible = file_path.suffix in COMPRESSIBLE_SUFFIXES and len(body) >= MIN_COMPRESS_SIZE
+
+        if brotli_file.exists():
+            entry.encoded["br"] = brotli_file.read_bytes()
+        elif compressible and brotli is not None:
+            entry.encoded["br"] = brotli.compress(body, quality=11)
+
+        if gzip_file.exists():
+            entry.encoded["gzip"] = gzip_file.read_bytes()
+        elif compressible:
+            entry.encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+
+        for encoding, payload in list(entry.encoded.items()):
+            if len(payload) >= len(body):
+                del entry.encoded[encoding]
+
+        return entry
+
+    def lookup(self, path: str) -> Optional[StaticEntry]:
+        """Resolve a request path, falling back to index.html for client-side routes."""
+        path = path.lstrip("/")
+        entry = self.entries.get(path)
+        if entry:
+            return entry
+        if path.startswith("assets/"):
+            return None
+        return self.entries.get(INDEX_FILE)
+
+    def respond(self, request: Request, path: str) -> Response:
+        entry = self.lookup(path)
+        if entry is None:
+            return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+        accepted = _accepted_encodings(request)
+        encoding = None
+        for candidate in ("br", "gzip"):
+            if candidate in entry.encoded and accepted.get(candidate, 0) > 0:
+                encoding = candidate
+                break
+
+        etag = _variant_etag(entry.etag, encoding) if encoding else entry.etag
+        headers = {
+            "ETag": etag,
+            "Cache-Control": entry.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            body = entry.encoded[encoding]
+        else:
+            body = entry.body
+
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            return Response(status_code=status.HTTP_200_OK, headers=headers, media_type=entry.media_type)
+
+        return Response(content=body, headers=headers, media_type=entry.media_type)
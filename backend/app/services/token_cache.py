@@ -0,0 +1,125 @@
+"""
+Token Cache Service: Verified JWT Cache and Revocation List
+
+Access tokens live for 7 days and are presented on every request, but
+`python-jose` re-verifies the signature and re-parses the claims each time.
+This module lets `app.auth.decode_token` do that work once per token:
+
+- `VerifiedTokenCache` is a bounded LRU keyed by the SHA-256 digest of the
+  token (never the token itself). It stores the verified payload until the
+  token's `exp`, so an expired token is never served from cache.
+- `RevocationList` records logged-out tokens until they expire. Lookups go
+  through a Bloom filter first, so the common "not revoked" case is a few
+  bit tests; only possible hits consult the exact set.
+
+Both structures are per process. `app.auth` persists revocations in the
+`token_revocations` table (pruned as tokens expire), loads them into the
+list at startup and broadcasts new ones on the invalidation bus.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+TOKEN_CACHE_SIZE = 10000
+BLOOM_BITS = 1 << 16
+BLOOM_HASHES = 4
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class VerifiedTokenCache:
+    """LRU of verified token payloads, each valid until the token's own exp."""
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes) -> Optional[dict]:
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return payload
+
+    def put(self, digest: bytes, payload: dict):
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        self._entries[digest] = (float(expires_at), payload)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, digest: bytes):
+        self._entries.pop(digest, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+class RevocationList:
+    """Revoked token digests until expiry, fronted by a Bloom filter."""
+
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self._bloom = bytearray(bits // 8)
+        self._revoked: Dict[bytes, float] = {}
+
+    def _positions(self, digest: bytes):
+        for i in range(self.hashes):
+            yield int.from_bytes(digest[i * 4:i * 4 + 4], "big") % self.bits
+
+    def _add_to_bloom(self, digest: bytes):
+        for position in self._positions(digest):
+            self._bloom[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, digest: bytes) -> bool:
+        return all(self._bloom[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+    def revoke(self, digest: bytes, expires_at: float):
+        self._prune()
+        self._revoked[digest] = expires_at
+        self._add_to_bloom(digest)
+
+    def is_revoked(self, digest: bytes) -> bool:
+        if not self.might_contain(digest):
+            return False
+        expires_at = self._revoked.get(digest)
+        return expires_at is not None and expires_at > time.time()
+
+    def _prune(self):
+        now = time.time()
+        expired = [digest for digest, expires_at in self._revoked.items() if expires_at <= now]
+        if not expired:
+            return
+        for digest in expired:
+            del self._revoked[digest]
+        self._bloom = bytearray(self.bits // 8)
+        for digest in self._revoked:
+            self._add_to_bloom(digest)
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+verified_tokens = VerifiedTokenCache()
+revoked_tokens = RevocationList()
+
+
+def token_cache_stats() -> Dict[str, int]:
+    return {**verified_tokens.stats(), "revoked": len(revoked_tokens)}
@@ -0,0 +1,43 @@
+"""
+Startup timing report.
+
+`app.main` records how long each cold-start phase took (module imports,
+first database connection, migrations, seeding, cache warmup) so slow
+worker starts can be diagnosed from `/api/health`.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+
+class StartupReport:
+    def __init__(self):
+        self.phases_ms: Dict[str, float] = {}
+        self.migrations_applied: List[int] = []
+        self.ready_at: float = 0.0
+
+    def record(self, name: str, started: float):
+        self.phases_ms[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def mark_ready(self):
+        self.ready_at = time.time()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "phases_ms": dict(self.phases_ms),
+            "total_ms": round(sum(self.phases_ms.values()), 2),
+            "migrations_applied": list(self.migrations_applied),
+            "ready_at": self.ready_at or None,
+        }
+
+
+startup_report = StartupReport()
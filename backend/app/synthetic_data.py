@@ -3,6 +3,7 @@ from sqlalchemy import select, insert
 from app.database import AsyncSessionLocal
 from app.models import Skill, User, Profile, Job, UserRole, Application, Note, ApplicationStatus, user_skills, job_skills, advisor_students
 from app.auth import get_password_hash
+from app.services.match_store import rebuild_job_matches
 
 UNT_STUDENTS = [
     {
@@ -375,11 +376,13 @@ async def seed_unt_synthetic_data():
                 print("UNT synthetic data already exists!")
                 return
             
+            password_hash = get_password_hash("demo123")
+            
             student_users = []
             for student_data in UNT_STUDENTS:
                 user = User(
                     email=student_data["email"],
-                    password_hash=get_password_hash("demo123"),
+                    password_hash=password_hash,
                     role=UserRole.STUDENT
                 )
                 db.add(user)
@@ -410,7 +413,7 @@ async def seed_unt_synthetic_data():
             for advisor_data in UNT_ADVISORS:
                 user = User(
                     email=advisor_data["email"],
-                    password_hash=get_password_hash("demo123"),
+                    password_hash=password_hash,
                     role=UserRole.ADVISOR
                 )
                 db.add(user)
@@ -439,7 +442,7 @@ async def seed_unt_synthetic_data():
             for employer_data in DFW_EMPLOYERS:
                 user = User(
                     email=employer_data["email"],
-                    password_hash=get_password_hash("demo123"),
+                    password_hash=password_hash,
                     role=UserRole.EMPLOYER
                 )
                 db.add(user)
@@ -514,6 +517,9 @@ async def seed_unt_synthetic_data():
             
             print(f"Created {notes_created} advisor notes")
             
+            matches_stored = await rebuild_job_matches(db)
+            print(f"Stored {matches_stored} student-job matches")
+            
             await db.commit()
             print("\n=== UNT College of Information Synthetic Data Seeded Successfully! ===")
             print(f"Total: {len(student_users)} students, {len(advisor_users)} advisors, {len(DFW_EMPLOYERS)} employers, {len(all_jobs)} jobs")
@@ -0,0 +1,541 @@
+"""
+Synthetic Dataset Generator: Production-Sized Data for Performance Work
+
+`app.synthetic_data` seeds a few dozen hand-written demo accounts. This
+module generates datasets sized like a real deployment (10k, 100k or 1M
+students) in minutes:
+
+- Every account shares one precomputed bcrypt hash (password "demo123"), so
+  hashing costs one call instead of one per user.
+- Ids are allocated up front (after the current maximum per table) and rows
+  are written in batches: `COPY` through asyncpg on PostgreSQL, multi-row
+  `INSERT`s elsewhere. Serial sequences are moved past the new ids at the
+  end.
+- The output is deterministic for a given `--seed` and starting ids: all
+  randomness comes from one seeded generator consumed in a fixed order.
+- Skill assignments follow realistic frequencies: each student and job
+  belongs to a career track (data, web, backend, cloud, security, mobile)
+  and draws most skills from it, the rest from a Zipf-shaped popularity
+  ranking where Python, SQL and communication skills are common and Rust or
+  GraphQL are rare. Application targets are Zipf-skewed as well, so some
+  jobs attract hundreds of applicants and most attract a few.
+- Applications carry real `calculate_weighted_match` scores and a status
+  mix; interviews follow interview/accepted applications with realistic
+  durations, never overlapping on an employer's or a student's calendar
+  (tracked in an `IntervalIndex`); advisors keep notes on part of their
+  caseload.
+
+Students are generated and committed in chunks, so memory stays flat at 1M.
+Stored job matches (`job_matches`) are rebuilt at the end so they cover the
+new students and jobs. Ranking every student against every job is the
+expensive part; `--skip-matches` leaves the table alone (and warns if it
+already holds rows, which are then stale) so that
+`python -m app.services.match_store` can be run later.
+
+Usage (from backend/, after migrations and the initial seed):
+    python -m app.synthetic_dataset --scale 10k
+    python -m app.synthetic_dataset --scale 1m --seed 7
+    python -m app.synthetic_dataset --students 2500 --skip-matches
+"""
+
+import argparse
+import asyncio
+import enum
+import itertools
+import random
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Table, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.auth import get_password_hash
+from app.database import AsyncSessionLocal, engine
+from app.models import (
+    Application, ApplicationStatus, Interview, InterviewStatus, Job, JobMatch, Note, Profile, Skill, User, UserRole,
+    advisor_students, data_versions, job_skills, user_skills
+)
+from app.services.interview_schedule import IntervalIndex
+from app.services.match_store import rebuild_job_matches
+from app.services.ml_service import SkillData, calculate_weighted_match
+
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+PASSWORD = "demo123"
+EMAIL_DOMAIN = "synthetic.example.com"
+DATASET_NOW = datetime(2026, 1, 15, 12, 0, 0)
+STUDENT_CHUNK = 10_000
+WRITE_BATCH = 5_000
+
+STUDENTS_PER_ADVISOR = 250
+STUDENTS_PER_EMPLOYER = 100
+JOBS_PER_EMPLOYER = (1, 6)
+ACTIVE_JOB_SHARE = 0.85
+MEAN_APPLICATIONS = 3.0
+MAX_APPLICATIONS = 25
+NOTE_COVERAGE = 0.6
+
+TRACKS = {
+    "data": (0.30, ["Python", "SQL", "Data Analysis", "Machine Learning", "PostgreSQL", "Deep Learning",
+                    "TensorFlow", "PyTorch", "AWS"]),
+    "web": (0.25, ["JavaScript", "React", "TypeScript", "Node.js", "REST APIs", "Next.js", "Vue.js",
+                   "Angular", "Express.js", "GraphQL"]),
+    "backend": (0.20, ["Java", "SQL", "Python", "REST APIs", "PostgreSQL", "Spring Boot", "Django", "Docker",
+                       "Microservices", "Redis", "Go", "FastAPI", "MySQL", "C#"]),
+    "cloud": (0.12, ["AWS", "Linux", "Docker", "Kubernetes", "CI/CD", "Azure", "Google Cloud", "Python", "Git"]),
+    "security": (0.08, ["Cybersecurity", "Network Security", "Linux", "Python", "AWS", "SQL"]),
+    "mobile": (0.05, ["Swift", "Kotlin", "Java", "JavaScript", "REST APIs", "Git"]),
+}
+
+# Overall popularity, most common first; skills not listed rank after these.
+SKILL_POPULARITY = [
+    "Communication", "Python", "SQL", "Teamwork", "Problem Solving", "Git", "JavaScript", "Data Analysis",
+    "Critical Thinking", "Java", "Agile/Scrum", "Time Management", "AWS", "Linux", "React", "Project Management",
+    "Attention to Detail", "REST APIs", "Docker", "Leadership", "Adaptability", "PostgreSQL", "Machine Learning",
+    "TypeScript", "Node.js", "MySQL", "C++", "C#", "Azure", "Creativity",
+]
+
+TRACK_TITLES = {
+    "data": ["Data Analyst", "Data Scientist", "Machine Learning Engineer", "Analytics Engineer", "BI Developer"],
+    "web": ["Frontend Developer", "Full Stack Developer", "Web Developer", "UI Engineer"],
+    "backend": ["Software Engineer", "Backend Engineer", "API Developer", "Platform Engineer"],
+    "cloud": ["Cloud Engineer", "DevOps Engineer", "Site Reliability Engineer", "Systems Administrator"],
+    "security": ["Security Analyst", "SOC Analyst", "Security Engineer", "IT Auditor"],
+    "mobile": ["iOS Developer", "Android Developer", "Mobile Engineer"],
+}
+TRACK_SOC_CODES = {
+    "data": "15-2051", "web": "15-1254", "backend": "15-1252",
+    "cloud": "15-1244", "security": "15-1212", "mobile": "15-1252",
+}
+LEVELS = [("Entry Level", 0.5, 55_000), ("Mid Level", 0.35, 80_000), ("Senior Level", 0.15, 115_000)]
+LEVEL_PREFIXES = {"Entry Level": "Junior ", "Mid Level": "", "Senior Level": "Senior "}
+JOB_TYPES = [("Full-time", 0.75), ("Internship", 0.12), ("Contract", 0.08), ("Part-time", 0.05)]
+STATUSES = [
+    (ApplicationStatus.PENDING, 0.55), (ApplicationStatus.REVIEWED, 0.22), (ApplicationStatus.INTERVIEW, 0.10),
+    (ApplicationStatus.REJECTED, 0.09), (ApplicationStatus.ACCEPTED, 0.04),
+]
+INTERVIEW_SLOT_ATTEMPTS = 10
+INTERVIEW_DURATIONS = [(30, 0.25), (45, 0.3), (60, 0.38), (90, 0.07)]
+INTERVIEW_TYPES = [("video", 0.6), ("phone", 0.25), ("onsite", 0.15)]
+NOTE_TYPES = [("meeting", 0.45), ("general", 0.3), ("career", 0.15), ("follow_up", 0.1)]
+
+FIRST_NAMES = [
+    "Maria", "James", "Ashley", "Raj", "Sofia", "Marcus", "Emily", "Wei", "Daniel", "Priya", "Jose", "Hannah",
+    "Kevin", "Aisha", "Tyler", "Mei", "Carlos", "Olivia", "Andre", "Fatima", "Noah", "Grace", "Luis", "Chloe",
+    "Omar", "Isabella", "Ethan", "Sara", "Diego", "Ava", "Minh", "Zoe", "Samuel", "Leah", "Arjun", "Nia",
+]
+LAST_NAMES = [
+    "Garcia", "Chen", "Williams", "Patel", "Martinez", "Johnson", "Nguyen", "Smith", "Kim", "Rodriguez",
+    "Brown", "Lee", "Hernandez", "Davis", "Khan", "Lopez", "Wilson", "Tran", "Anderson", "Singh", "Thomas",
+    "Moore", "Jackson", "White", "Harris", "Clark", "Lewis", "Walker", "Young", "Allen",
+]
+CITIES = [
+    ("Denton, TX", 0.3), ("Dallas, TX", 0.25), ("Fort Worth, TX", 0.15), ("Plano, TX", 0.1),
+    ("Irving, TX", 0.07), ("Frisco, TX", 0.05), ("Richardson, TX", 0.05), ("Remote", 0.03),
+]
+PROGRAMS = [
+    "M.S. Data Science", "M.S. Information Science", "M.S. Computer Science", "B.S. Information Technology",
+    "M.S. Cybersecurity", "Ph.D. Information Science", "M.S. Library Science", "B.S. Computer Engineering",
+]
+COMPANY_WORDS = (
+    ["North", "Lone Star", "Trinity", "Prairie", "Summit", "Bluebonnet", "Cedar", "Red River", "Pecan", "Metro"],
+    ["Analytics", "Systems", "Health", "Logistics", "Financial", "Labs", "Digital", "Energy", "Networks", "Media"],
+    ["Inc.", "LLC", "Group", "Partners", "Technologies", "Corp."],
+)
+
+
+@dataclass
+class DatasetSpec:
+    students: int
+    seed: int = 42
+
+    @property
+    def advisors(self) -> int:
+        return max(1, self.students // STUDENTS_PER_ADVISOR)
+
+    @property
+    def employers(self) -> int:
+        return max(1, self.students // STUDENTS_PER_EMPLOYER)
+
+
+class Weighted:
+    """Draws from a fixed distribution with one C-level bisect per sample."""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def pick(self, rng: random.Random) -> Any:
+        return self.items[bisect_right(self.cumulative, rng.random() * self.total)]
+
+    def sample(self, rng: random.Random, k: int, exclude: Optional[Set[Any]] = None) -> List[Any]:
+        """Up to `k` distinct items, more frequent ones more likely."""
+        chosen: Dict[Any, None] = {}
+        exclude = exclude or set()
+        for _ in range(k * 4):
+            item = self.pick(rng)
+            if item not in exclude:
+                chosen[item] = None
+                if len(chosen) == k:
+                    break
+        return list(chosen)
+
+
+def _table_of(pairs: Sequence[Tuple[Any, float]]) -> Weighted:
+    return Weighted([item for item, _ in pairs], [weight for _, weight in pairs])
+
+
+def _zipf(items: Sequence[Any], exponent: float = 1.0) -> Weighted:
+    return Weighted(items, [1 / (rank + 1) ** exponent for rank in range(len(items))])
+
+
+class SkillModel:
+    """Per-track and global skill distributions over the skills in the database."""
+
+    def __init__(self, skills: Dict[int, SkillData]):
+        self.skills = skills
+        ids_by_name = {skill.name: skill_id for skill_id, skill in skills.items()}
+        ranked = [ids_by_name[name] for name in SKILL_POPULARITY if name in ids_by_name]
+        ranked += sorted(set(skills) - set(ranked))
+        self.popular = _zipf(ranked, exponent=0.9)
+        self.soft = _zipf([skill_id for skill_id in ranked if not skills[skill_id].is_technical])
+        self.tracks = Weighted(list(TRACKS), [weight for weight, _ in TRACKS.values()])
+        self.track_skills = {
+            track: _zipf([ids_by_name[name] for name in names if name in ids_by_name], exponent=0.7)
+            for track, (_, names) in TRACKS.items()
+        }
+
+    def draw(self, rng: random.Random, track: str, count: int, track_share: float, soft: int = 0) -> List[int]:
+        from_track = self.track_skills[track].sample(rng, round(count * track_share))
+        chosen = set(from_track)
+        chosen.update(self.soft.sample(rng, soft, exclude=chosen))
+        chosen.update(self.popular.sample(rng, max(0, count - len(chosen)), exclude=chosen))
+        return sorted(chosen)
+
+
+class BulkWriter:
+    """Batched inserts: COPY on PostgreSQL (asyncpg), executemany INSERTs elsewhere."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+        self.use_copy = conn.dialect.name == "postgresql" and conn.dialect.driver == "asyncpg"
+        self.rows_written: Dict[str, int] = {}
+
+    async def write(self, table: Table, columns: Sequence[str], rows: List[tuple]):
+        for start in range(0, len(rows), WRITE_BATCH):
+            batch = rows[start:start + WRITE_BATCH]
+            if self.use_copy:
+                raw = await self.conn.get_raw_connection()
+                # SQLAlchemy stores Python enums by member name.
+                records = [tuple(v.name if isinstance(v, enum.Enum) else v for v in row) for row in batch]
+                await raw.driver_connection.copy_records_to_table(table.name, records=records, columns=list(columns))
+            else:
+                await self.conn.execute(table.insert(), [dict(zip(columns, row)) for row in batch])
+        self.rows_written[table.name] = self.rows_written.get(table.name, 0) + len(rows)
+
+
+USER_COLUMNS = ("id", "email", "password_hash", "role", "created_at", "updated_at")
+PROFILE_COLUMNS = ("id", "user_id", "first_name", "last_name", "headline", "bio", "academic_background",
+                   "company_name", "company_description", "location", "created_at", "updated_at")
+JOB_COLUMNS = ("id", "employer_id", "title", "description", "location", "salary_min", "salary_max", "job_type",
+               "experience_level", "onet_soc_code", "deadline", "is_active", "created_at", "updated_at")
+APPLICATION_COLUMNS = ("id", "job_id", "applicant_id", "status", "cover_letter", "match_score", "created_at",
+                       "updated_at")
+INTERVIEW_COLUMNS = ("id", "application_id", "employer_id", "applicant_id", "scheduled_at", "duration_minutes",
+                     "interview_type", "status", "created_at", "updated_at")
+NOTE_COLUMNS = ("id", "advisor_id", "student_id", "content", "note_type", "created_at", "updated_at")
+SERIAL_TABLES = (User.__table__, Profile.__table__, Job.__table__, Application.__table__, Interview.__table__,
+                 Note.__table__)
+
+
+class IdAllocator:
+    def __init__(self, start: Dict[str, int]):
+        self.next = {name: value + 1 for name, value in start.items()}
+
+    def take(self, table: Table) -> int:
+        value = self.next[table.name]
+        self.next[table.name] = value + 1
+        return value
+
+
+class DatasetGenerator:
+    def __init__(self, spec: DatasetSpec, skills: Dict[int, SkillData], ids: IdAllocator, password_hash: str):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.skill_model = SkillModel(skills)
+        self.ids = ids
+        self.password_hash = password_hash
+        self.levels = _table_of([(level, weight) for level, weight, _ in LEVELS])
+        self.base_salary = {level: salary for level, _, salary in LEVELS}
+        self.job_types = _table_of(JOB_TYPES)
+        self.statuses = _table_of(STATUSES)
+        self.durations = _table_of(INTERVIEW_DURATIONS)
+        self.interview_types = _table_of(INTERVIEW_TYPES)
+        self.note_types = _table_of(NOTE_TYPES)
+        self.cities = _table_of(CITIES)
+        self.advisor_ids: List[int] = []
+        self.job_requirements: Dict[int, List[SkillData]] = {}
+        self.job_created: Dict[int, datetime] = {}
+        self.job_employer: Dict[int, int] = {}
+        # Booked interviews per employer and per student, so none overlap.
+        self.calendar = IntervalIndex()
+        self.jobs_by_track: Dict[str, Weighted] = {}
+        self.all_jobs: Optional[Weighted] = None
+
+    def _moment(self, days_back: int) -> datetime:
+        return DATASET_NOW - timedelta(seconds=self.rng.randrange(days_back * 86400))
+
+    def _person(self, role: UserRole, created_at: datetime, **profile) -> Tuple[tuple, tuple]:
+        user_id = self.ids.take(User.__table__)
+        first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+        user = (user_id, f"{role.value}{user_id}@{EMAIL_DOMAIN}", self.password_hash, role, created_at, created_at)
+        profile_row = (
+            self.ids.take(Profile.__table__), user_id, first, last, profile.get("headline"), profile.get("bio"),
+            profile.get("academic_background"), profile.get("company_name"), profile.get("company_description"),
+            profile.get("location", self.cities.pick(self.rng)), created_at, created_at,
+        )
+        return user, profile_row
+
+    async def write_advisors_and_employers(self, writer: BulkWriter):
+        users, profiles, jobs, requirements = [], [], [], []
+        for _ in range(self.spec.advisors):
+            user, profile = self._person(UserRole.ADVISOR, self._moment(1500), headline="Career Advisor")
+            users.append(user)
+            profiles.append(profile)
+            self.advisor_ids.append(user[0])
+
+        job_ids_by_track: Dict[str, List[int]] = {track: [] for track in TRACKS}
+        for _ in range(self.spec.employers):
+            company = " ".join(self.rng.choice(words) for words in COMPANY_WORDS)
+            location = self.cities.pick(self.rng)
+            user, profile = self._person(
+                UserRole.EMPLOYER, self._moment(1500), headline=f"Recruiting at {company}", company_name=company,
+                company_description=f"{company} is hiring across the Dallas-Fort Worth area.", location=location
+            )
+            users.append(user)
+            profiles.append(profile)
+            for _ in range(self.rng.randint(*JOBS_PER_EMPLOYER)):
+                track = self.skill_model.tracks.pick(self.rng)
+                level = self.levels.pick(self.rng)
+                job_type = self.job_types.pick(self.rng)
+                title = LEVEL_PREFIXES[level] + self.rng.choice(TRACK_TITLES[track])
+                salary_min = self.base_salary[level] + self.rng.randrange(0, 25_000, 1_000)
+                if job_type == "Internship":
+                    salary_min = self.rng.randrange(20, 40)
+                skill_ids = self.skill_model.draw(self.rng, track, self.rng.randint(4, 8), 0.7,
+                                                  soft=1 if self.rng.random() < 0.7 else 0)
+                required = [self.skill_model.skills[skill_id] for skill_id in skill_ids]
+                created_at = self._moment(180)
+                job_id = self.ids.take(Job.__table__)
+                jobs.append((
+                    job_id, user[0], title,
+                    f"{company} is hiring a {title} ({job_type.lower()}) for its {track} team. "
+                    f"You will work with {', '.join(skill.name for skill in required)}.",
+                    location, salary_min, round(salary_min * 1.3), job_type, level, TRACK_SOC_CODES[track],
+                    created_at + timedelta(days=self.rng.randint(30, 90)),
+                    self.rng.random() < ACTIVE_JOB_SHARE, created_at, created_at,
+                ))
+                requirements.extend((job_id, skill_id) for skill_id in skill_ids)
+                self.job_requirements[job_id] = required
+                self.job_created[job_id] = created_at
+                self.job_employer[job_id] = user[0]
+                job_ids_by_track[track].append(job_id)
+
+        # Popularity among applicants: a shuffled Zipf ranking per track.
+        for track, job_ids in job_ids_by_track.items():
+            if job_ids:
+                self.rng.shuffle(job_ids)
+                self.jobs_by_track[track] = _zipf(job_ids, exponent=0.8)
+        every_job = list(self.job_requirements)
+        self.rng.shuffle(every_job)
+        self.all_jobs = _zipf(every_job, exponent=0.8)
+
+        await writer.write(User.__table__, USER_COLUMNS, users)
+        await writer.write(Profile.__table__, PROFILE_COLUMNS, profiles)
+        await writer.write(Job.__table__, JOB_COLUMNS, jobs)
+        await writer.write(job_skills, ("job_id", "skill_id"), requirements)
+
+    async def write_students(self, writer: BulkWriter, count: int):
+        users, profiles, skills, assignments = [], [], [], []
+        applications, interviews, notes = [], [], []
+        for _ in range(count):
+            track = self.skill_model.tracks.pick(self.rng)
+            created_at = self._moment(730)
+            program = self.rng.choice(PROGRAMS)
+            user, profile = self._person(
+                UserRole.STUDENT, created_at, headline=f"{program} | {track.title()} focus",
+                bio=f"Student interested in {track} roles.", academic_background=f"{program}, University of North Texas"
+            )
+            student_id = user[0]
+            users.append(user)
+            profiles.append(profile)
+
+            count_skills = min(20, max(2, round(self.rng.gauss(8, 3))))
+            skill_ids = self.skill_model.draw(self.rng, track, count_skills, 0.6, soft=self.rng.randint(1, 3))
+            skills.extend((student_id, skill_id, self.rng.randint(1, 5)) for skill_id in skill_ids)
+            student_skills = [self.skill_model.skills[skill_id] for skill_id in skill_ids]
+
+            advisor_id = self.advisor_ids[self.rng.randrange(len(self.advisor_ids))]
+            assignments.append((advisor_id, student_id))
+
+            jobs = self.jobs_by_track.get(track) or self.all_jobs
+            wanted = min(MAX_APPLICATIONS, int(self.rng.expovariate(1 / MEAN_APPLICATIONS)))
+            targets = jobs.sample(self.rng, wanted - wanted // 4) + self.all_jobs.sample(self.rng, wanted // 4)
+            for job_id in dict.fromkeys(targets):
+                applied_at = max(self.job_created[job_id], created_at) + timedelta(hours=self.rng.randint(1, 24 * 30))
+                applied_at = min(applied_at, DATASET_NOW)
+                status = self.statuses.pick(self.rng)
+                score = calculate_weighted_match(student_skills, self.job_requirements[job_id]).score
+                application_id = self.ids.take(Application.__table__)
+                applications.append((
+                    application_id, job_id, student_id, status,
+                    "I am excited to apply; my coursework and projects match this role.",
+                    round(score * 100, 1), applied_at, applied_at,
+                ))
+                if status in (ApplicationStatus.INTERVIEW, ApplicationStatus.ACCEPTED) or (
+                    status == ApplicationStatus.REJECTED and self.rng.random() < 0.3
+                ):
+                    interview = self._interview(application_id, self.job_employer[job_id], student_id, applied_at)
+                    if interview:
+                        interviews.append(interview)
+
+            if self.rng.random() < NOTE_COVERAGE:
+                for _ in range(1 + int(self.rng.expovariate(0.7))):
+                    note_type = self.note_types.pick(self.rng)
+                    noted_at = max(created_at, self._moment(365))
+                    notes.append((
+                        self.ids.take(Note.__table__), advisor_id, student_id,
+                        f"{note_type.replace('_', ' ').title()}: discussed {track} roles, "
+                        f"{self.rng.choice(student_skills).name} projects and next steps.",
+                        note_type, noted_at, noted_at,
+                    ))
+
+        await writer.write(User.__table__, USER_COLUMNS, users)
+        await writer.write(Profile.__table__, PROFILE_COLUMNS, profiles)
+        await writer.write(user_skills, ("user_id", "skill_id", "proficiency"), skills)
+        await writer.write(advisor_students, ("advisor_id", "student_id"), assignments)
+        await writer.write(Application.__table__, APPLICATION_COLUMNS, applications)
+        await writer.write(Interview.__table__, INTERVIEW_COLUMNS, interviews)
+        await writer.write(Note.__table__, NOTE_COLUMNS, notes)
+
+    def _interview(self, application_id: int, employer_id: int, student_id: int,
+                   applied_at: datetime) -> Optional[tuple]:
+        """A weekday business-hours slot free on both calendars, or None after a few tries."""
+        duration = self.durations.pick(self.rng)
+        interview_type = self.interview_types.pick(self.rng)
+        day = (applied_at + timedelta(days=self.rng.randint(3, 21))).replace(minute=0, second=0, microsecond=0)
+        for _ in range(INTERVIEW_SLOT_ATTEMPTS):
+            while day.weekday() >= 5:
+                day += timedelta(days=1)
+            scheduled_at = day.replace(hour=self.rng.randint(9, 16), minute=self.rng.choice((0, 15, 30, 45)))
+            ends_at = scheduled_at + timedelta(minutes=duration)
+            if not (self.calendar.overlaps(("employer", employer_id), scheduled_at, ends_at)
+                    or self.calendar.overlaps(("student", student_id), scheduled_at, ends_at)):
+                break
+            day += timedelta(days=1)
+        else:
+            return None
+
+        if scheduled_at < DATASET_NOW:
+            status = InterviewStatus.COMPLETED if self.rng.random() < 0.85 else InterviewStatus.CANCELLED
+        else:
+            status = InterviewStatus.CONFIRMED if self.rng.random() < 0.5 else InterviewStatus.SCHEDULED
+        if status != InterviewStatus.CANCELLED:
+            self.calendar.add(("employer", employer_id), scheduled_at, ends_at)
+            self.calendar.add(("student", student_id), scheduled_at, ends_at)
+        return (
+            self.ids.take(Interview.__table__), application_id, employer_id, student_id, scheduled_at, duration,
+            interview_type, status, applied_at, applied_at,
+        )
+
+
+async def _load_skills(conn: AsyncConnection) -> Dict[int, SkillData]:
+    rows = await conn.execute(select(Skill.id, Skill.name, Skill.is_technical))
+    return {row.id: SkillData(id=row.id, name=row.name, is_technical=row.is_technical) for row in rows}
+
+
+async def _max_ids(conn: AsyncConnection) -> Dict[str, int]:
+    return {
+        table.name: (await conn.execute(select(func.coalesce(func.max(table.c.id), 0)))).scalar()
+        for table in SERIAL_TABLES
+    }
+
+
+async def _finish(conn: AsyncConnection):
+    """Move serial sequences past the explicit ids and mark the job matrix stale."""
+    if conn.dialect.name == "postgresql":
+        for table in SERIAL_TABLES:
+            await conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+            ))
+    await conn.execute(
+        update(data_versions).where(data_versions.c.name == "job_matrix").values(version=data_versions.c.version + 1)
+    )
+
+
+async def generate_dataset(spec: DatasetSpec, rebuild_matches: bool = True) -> Dict[str, int]:
+    started = time.perf_counter()
+    password_hash = get_password_hash(PASSWORD)
+
+    async with engine.begin() as conn:
+        skills = await _load_skills(conn)
+        if not skills:
+            raise SystemExit("No skills found; run migrations and the initial seed first")
+        generator = DatasetGenerator(spec, skills, IdAllocator(await _max_ids(conn)), password_hash)
+        writer = BulkWriter(conn)
+        await generator.write_advisors_and_employers(writer)
+    print(f"  {spec.advisors} advisors, {spec.employers} employers, {len(generator.job_requirements)} jobs "
+          f"({time.perf_counter() - started:.1f}s)")
+
+    written: Dict[str, int] = dict(writer.rows_written)
+    for start in range(0, spec.students, STUDENT_CHUNK):
+        async with engine.begin() as conn:
+            writer = BulkWriter(conn)
+            await generator.write_students(writer, min(STUDENT_CHUNK, spec.students - start))
+        for table, count in writer.rows_written.items():
+            written[table] = written.get(table, 0) + count
+        print(f"  {min(start + STUDENT_CHUNK, spec.students)}/{spec.students} students "
+              f"({time.perf_counter() - started:.1f}s)")
+
+    async with engine.begin() as conn:
+        await _finish(conn)
+        stored_matches = await conn.scalar(select(func.count()).select_from(JobMatch))
+
+    if rebuild_matches:
+        async with AsyncSessionLocal() as db:
+            written["job_matches"] = await rebuild_job_matches(db)
+            await db.commit()
+        print(f"  rebuilt job matches ({time.perf_counter() - started:.1f}s)")
+    elif stored_matches:
+        print(f"  warning: job_matches still holds {stored_matches} rows that predate this dataset; "
+              f"run `python -m app.services.match_store` to rebuild them")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", choices=sorted(SCALES, key=SCALES.get), default="10k", help="number of students")
+    size.add_argument("--students", type=int, help="exact number of students instead of a preset scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-matches", action="store_true",
+                        help="don't rebuild job_matches afterwards (slow at scale)")
+    args = parser.parse_args()
+
+    spec = DatasetSpec(students=args.students or SCALES[args.scale], seed=args.seed)
+    print(f"Generating {spec.students} students (seed {spec.seed})")
+    started = time.perf_counter()
+    written = asyncio.run(generate_dataset(spec, rebuild_matches=not args.skip_matches))
+    print(f"\nWrote {sum(written.values())} rows in {time.perf_counter() - started:.1f}s:")
+    for table, count in written.items():
+        print(f"  {table:<18} {count:>10}")
+    print(f"\nAll accounts use password: {PASSWORD} (emails like student123@{EMAIL_DOMAIN})")
+
+
+if __name__ == "__main__":
+    main()
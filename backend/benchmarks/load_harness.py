@@ -0,0 +1,422 @@
+"""
+Load-test harness: role-based user journeys at configurable concurrency.
+
+Runs `--users` virtual users, each logged in as a real account and looping
+over its role's journey until `--duration` seconds have passed:
+
+- student: browse `GET /api/jobs`, check its applications, view skill gaps
+  (single and batch), apply to a job it has not applied to, poll
+  notifications and interviews
+- employer: list its jobs and one job's applicants, bulk-update statuses,
+  find a free slot and schedule an interview in it, poll interviews and
+  notifications
+- advisor: list assigned students, open one (profile, applications, notes),
+  add a note, search its notes, view the analytics overview, poll
+  notifications
+
+Accounts are sampled from the database in `DATABASE_URL` (fill it first with
+`python -m app.synthetic_dataset`); every account must use `--password`.
+Journeys write (applications, statuses, interviews, notes), so use a
+load-test database.
+
+By default requests go to the app in-process (ASGI, with its startup and
+shutdown run as a server would), which shares one event loop with the
+virtual users; pass `--url` to drive a running server instead. Latency is
+measured per request and grouped by route template. The report gives
+throughput and p50/p95/p99 per endpoint, and is saved as JSON (with the git
+commit and run settings) for comparison with `--compare`.
+
+Usage (from backend/):
+    python -m benchmarks.load_harness --users 50 --duration 60
+    python -m benchmarks.load_harness --url http://localhost:5000 --mix student=8 employer=1 advisor=1
+    python -m benchmarks.load_harness --compare benchmarks/results/<earlier run>.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal, engine
+from app.models import User, UserRole
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_MIX = {"student": 7, "employer": 2, "advisor": 1}
+PERCENTILES = (50, 95, 99)
+PAGE_SIZE = 50
+APPLY_PROBABILITY = 0.3
+NOTE_PROBABILITY = 0.3
+NOTE_SEARCHES = ("next steps", "cloud", "python projects", "career -backend")
+BULK_UPDATE_SIZE = 5
+OPEN_STATUSES = ("pending", "reviewed")
+
+
+class EndpointStats:
+    __slots__ = ("latencies", "statuses", "errors")
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+
+    def record(self, seconds: float, status: str, ok: bool):
+        self.latencies.append(seconds)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not ok:
+            self.errors += 1
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(latencies: List[float], errors: int, statuses: Dict[str, int], elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    summary = {
+        "requests": len(ordered),
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(ordered, pct) * 1000, 2)
+    return summary
+
+
+class VirtualUser:
+    """One logged-in account with its own cookie jar."""
+
+    def __init__(self, client: httpx.AsyncClient, account: Tuple[int, str, str], stats: Dict[str, EndpointStats],
+                 rng: random.Random, think_seconds: float):
+        self.client = client
+        self.user_id, self.email, self.role = account
+        self.stats = stats
+        self.rng = rng
+        self.think_seconds = think_seconds
+
+    async def call(self, method: str, route: str, path: Optional[str] = None,
+                   expect: Tuple[int, ...] = (200,), **kwargs) -> Optional[Any]:
+        """Send one request and record it under `route`; returns the JSON body when the status is expected."""
+        name = f"{method} {route}"
+        endpoint = self.stats.get(name)
+        if endpoint is None:
+            endpoint = self.stats[name] = EndpointStats()
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path or route, **kwargs)
+        except httpx.HTTPError as exc:
+            endpoint.record(time.perf_counter() - started, type(exc).__name__, False)
+            return None
+        ok = response.status_code in expect
+        endpoint.record(time.perf_counter() - started, str(response.status_code), ok)
+        if self.think_seconds:
+            await asyncio.sleep(self.rng.uniform(0, 2 * self.think_seconds))
+        return response.json() if ok and response.status_code < 300 else None
+
+    async def login(self, password: str) -> bool:
+        body = await self.call("POST", "/api/auth/login", json={
+            "email": self.email, "password": password, "role": self.role
+        })
+        return body is not None
+
+
+async def student_journey(user: VirtualUser):
+    jobs = await user.call("GET", "/api/jobs", params={"limit": PAGE_SIZE})
+    if not jobs:
+        return
+    applications = await user.call("GET", "/api/applications/my-applications", params={"limit": 100}) or []
+    applied = {application["job_id"] for application in applications}
+
+    viewed = user.rng.sample(jobs, min(3, len(jobs)))
+    for job in viewed:
+        await user.call("GET", "/api/jobs/{job_id}/skill-gap", f"/api/jobs/{job['id']}/skill-gap")
+    await user.call("POST", "/api/jobs/skill-gap/batch", json={"job_ids": [job["id"] for job in jobs[:20]]})
+
+    candidates = [job for job in viewed if job["id"] not in applied]
+    if candidates and user.rng.random() < APPLY_PROBABILITY:
+        # 400: deadline passed, or another run applied first.
+        await user.call("POST", "/api/applications", expect=(201, 400), json={
+            "job_id": user.rng.choice(candidates)["id"], "cover_letter": "I would love to join your team."
+        })
+
+    await user.call("GET", "/api/notifications/unread-count")
+    await user.call("GET", "/api/notifications", params={"limit": 20})
+    await user.call("GET", "/api/interviews")
+
+
+async def employer_journey(user: VirtualUser):
+    jobs = await user.call("GET", "/api/jobs/my-jobs", params={"limit": PAGE_SIZE})
+    if not jobs:
+        return
+    job = user.rng.choice(jobs)
+    applications = await user.call("GET", "/api/applications/job/{job_id}", f"/api/applications/job/{job['id']}",
+                                   params={"limit": PAGE_SIZE})
+    open_applications = [a for a in applications or [] if a["status"] in OPEN_STATUSES]
+    if open_applications:
+        batch = user.rng.sample(open_applications, min(BULK_UPDATE_SIZE, len(open_applications)))
+        await user.call("PUT", "/api/applications/bulk-update", json={
+            "application_ids": [application["id"] for application in batch],
+            "status": "reviewed",
+            "feedback_notes": "Thanks, we are reviewing your application."
+        })
+        application_id = user.rng.choice(batch)["id"]
+        duration = user.rng.choice((30, 45, 60))
+        start_date = date.today() + timedelta(days=user.rng.randint(1, 14))
+        availability = await user.call("GET", "/api/interviews/availability", params={
+            "application_id": application_id,
+            "start_date": start_date.isoformat(),
+            "duration_minutes": duration,
+        })
+        if availability and availability["slots"]:
+            # 409: another virtual user booked the same slot in between.
+            await user.call("POST", "/api/interviews", expect=(201, 409), json={
+                "application_id": application_id,
+                "scheduled_at": availability["slots"][0]["start"],
+                "duration_minutes": duration,
+            })
+
+    await user.call("GET", "/api/interviews")
+    await user.call("GET", "/api/notifications/unread-count")
+
+
+async def advisor_journey(user: VirtualUser):
+    students = await user.call("GET", "/api/users/students", params={"limit": PAGE_SIZE})
+    if students:
+        student_id = user.rng.choice(students)["id"]
+        await user.call("GET", "/api/users/students/{student_id}", f"/api/users/students/{student_id}")
+        await user.call("GET", "/api/applications/student/{student_id}", f"/api/applications/student/{student_id}",
+                        params={"limit": PAGE_SIZE})
+        await user.call("GET", "/api/notes/student/{student_id}", f"/api/notes/student/{student_id}",
+                        params={"limit": PAGE_SIZE})
+        if user.rng.random() < NOTE_PROBABILITY:
+            await user.call("POST", "/api/notes", expect=(201,), json={
+                "student_id": student_id, "content": "Checked in on application progress.", "note_type": "general"
+            })
+
+    await user.call("GET", "/api/notes/search", params={"q": user.rng.choice(NOTE_SEARCHES), "limit": 20})
+    await user.call("GET", "/api/analytics/overview")
+    await user.call("GET", "/api/notifications/unread-count")
+
+
+JOURNEYS: Dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "student": student_journey,
+    "employer": employer_journey,
+    "advisor": advisor_journey,
+}
+
+
+async def sample_accounts(counts: Dict[str, int], rng: random.Random) -> Dict[str, List[Tuple[int, str, str]]]:
+    """Up to `count` random accounts per role, sampled from the first 10,000 by id."""
+    accounts = {}
+    async with AsyncSessionLocal() as db:
+        for role, count in counts.items():
+            if not count:
+                continue
+            rows = (await db.execute(
+                select(User.id, User.email)
+                .where(User.role == UserRole(role))
+                .order_by(User.id)
+                .limit(10_000)
+            )).all()
+            if not rows:
+                sys.exit(f"No {role} accounts in the database; generate some with `python -m app.synthetic_dataset`")
+            picked = rng.sample(rows, count) if len(rows) >= count else [rng.choice(rows) for _ in range(count)]
+            accounts[role] = [(user_id, email, role) for user_id, email in picked]
+    await engine.dispose()
+    return accounts
+
+
+@asynccontextmanager
+async def client_factory(url: Optional[str]) -> AsyncIterator[Callable[[], httpx.AsyncClient]]:
+    """Yields a factory of per-user clients; in-process runs the app's lifespan around the test."""
+    if url:
+        yield lambda: httpx.AsyncClient(base_url=url, timeout=60)
+        return
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        yield lambda: httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=60)
+
+
+async def run_user(user: VirtualUser, start_at: float, deadline: float) -> int:
+    """Loop the user's journey from `start_at` until the deadline; returns completed journeys."""
+    await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+    journey = JOURNEYS[user.role]
+    completed = 0
+    while time.perf_counter() < deadline:
+        await journey(user)
+        completed += 1
+    return completed
+
+
+async def run(args, counts: Dict[str, int]) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    accounts = await sample_accounts(counts, rng)
+    ordered = [account for role in JOURNEYS for account in accounts.get(role, [])]
+    rng.shuffle(ordered)
+
+    login_stats: Dict[str, EndpointStats] = {}
+    stats: Dict[str, EndpointStats] = {}
+    async with client_factory(args.url) as make_client:
+        users = [
+            VirtualUser(make_client(), account, login_stats, random.Random(args.seed + index), args.think_ms / 1000)
+            for index, account in enumerate(ordered)
+        ]
+        try:
+            # Logging in hashes a password per user; keep it out of the measured window.
+            login_started = time.perf_counter()
+            logged_in = await asyncio.gather(*(user.login(args.password) for user in users))
+            login_elapsed = time.perf_counter() - login_started
+            users = [user for user, ok in zip(users, logged_in) if ok]
+            if not users:
+                statuses = login_stats["POST /api/auth/login"].statuses
+                sys.exit(f"No user could log in with password {args.password!r} (results: {statuses})")
+            for user in users:
+                user.stats = stats
+
+            started = time.perf_counter()
+            deadline = started + args.ramp_up + args.duration
+            completed = await asyncio.gather(*(
+                run_user(user, started + args.ramp_up * index / len(users), deadline)
+                for index, user in enumerate(users)
+            ))
+            elapsed = time.perf_counter() - started
+        finally:
+            await asyncio.gather(*(user.client.aclose() for user in users))
+
+    all_latencies = [latency for endpoint in stats.values() for latency in endpoint.latencies]
+    all_statuses: Dict[str, int] = {}
+    for endpoint in stats.values():
+        for status, count in endpoint.statuses.items():
+            all_statuses[status] = all_statuses.get(status, 0) + count
+    login = login_stats["POST /api/auth/login"]
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "target": args.url or "in-process",
+            "users": counts,
+            "logged_in": len(users),
+            "duration_s": args.duration,
+            "ramp_up_s": args.ramp_up,
+            "think_ms": args.think_ms,
+            "seed": args.seed,
+            "elapsed_s": round(elapsed, 2),
+            "journeys_completed": sum(completed),
+        },
+        "login": summarize(login.latencies, login.errors, login.statuses, login_elapsed),
+        "total": summarize(all_latencies, sum(e.errors for e in stats.values()), all_statuses, elapsed),
+        "endpoints": {
+            name: summarize(endpoint.latencies, endpoint.errors, endpoint.statuses, elapsed)
+            for name, endpoint in sorted(stats.items())
+        },
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    meta = report["meta"]
+    print(f"\n{meta['target']} @ {meta['commit'] or 'unknown commit'}: {meta['users']} users "
+          f"({meta['logged_in']} logged in, login p50 {report['login']['p50_ms']} ms), "
+          f"{meta['elapsed_s']}s, {meta['journeys_completed']} journeys")
+    header = f"{'endpoint':<48}{'reqs':>8}{'err':>6}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'p95 vs base':>13}{'rps vs base':>13}"
+    print(header)
+    rows = list(report["endpoints"].items()) + [("TOTAL", report["total"])]
+    for name, summary in rows:
+        line = (f"{name:<48}{summary['requests']:>8}{summary['errors']:>6}{summary['throughput_rps']:>9}"
+                f"{summary['p50_ms']:>9}{summary['p95_ms']:>9}{summary['p99_ms']:>9}")
+        if baseline:
+            before = baseline["total"] if name == "TOTAL" else baseline["endpoints"].get(name)
+            line += f"{_change(before, summary, 'p95_ms'):>13}{_change(before, summary, 'throughput_rps'):>13}"
+        print(line)
+
+
+def _change(before: Optional[Dict[str, Any]], after: Dict[str, Any], key: str) -> str:
+    if not before or not before[key]:
+        return "-"
+    return f"{(after[key] - before[key]) / before[key] * 100:+.1f}%"
+
+
+def parse_mix(values: List[str]) -> Dict[str, int]:
+    mix = {}
+    for value in values:
+        role, _, weight = value.partition("=")
+        if role not in JOURNEYS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"invalid mix entry {value!r}; expected e.g. student=7")
+        mix[role] = int(weight)
+    return mix
+
+
+def users_per_role(users: int, mix: Dict[str, int]) -> Dict[str, int]:
+    """Split `users` by weight, giving rounding leftovers to the heaviest roles."""
+    total = sum(mix.values())
+    counts = {role: users * weight // total for role, weight in mix.items()}
+    for role in sorted(mix, key=mix.get, reverse=True)[:users - sum(counts.values())]:
+        counts[role] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="base URL of a running server (default: the app in-process)")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run after ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=0, help="seconds over which users start")
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause between a user's requests")
+    parser.add_argument("--mix", nargs="+", default=[f"{role}={weight}" for role, weight in DEFAULT_MIX.items()],
+                        help="role weights, e.g. student=7 employer=2 advisor=1")
+    parser.add_argument("--password", default="demo123", help="password shared by the sampled accounts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/<commit>-<time>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+    counts = users_per_role(args.users, mix)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    report = asyncio.run(run(args, counts))
+    print_report(report, baseline)
+
+    output = args.output
+    if output is None:
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        output = RESULTS_DIR / f"{report['meta']['commit'] or 'nocommit'}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
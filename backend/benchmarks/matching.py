@@ -0,0 +1,286 @@
+"""
+Micro-benchmarks for the matching service (`app.services.ml_service`).
+
+Measures, on synthetic skill data (the O*NET IT skills padded with
+generated ones):
+
+- `calculate_weighted_match` and `get_skill_gap_analysis` per call, over a
+  grid of candidate and job skill-set sizes
+- `calculate_batch_matches` per job, against job catalogs of 100 to 1M jobs
+  (jobs require 3-15 skills, as in the O*NET-derived catalog)
+
+Each operation runs on every engine: "reference" is the original per-job
+implementation, frozen below, and "current" is the code in ml_service.
+Every engine must return identical `MatchResult` data (and skill-gap
+dicts) for the same inputs; catalogs are generated and checked in chunks of
+`CHUNK_SIZE` jobs so 1M jobs fit in memory.
+
+Timings are compared with the per-operation ceilings in
+`benchmarks/matching_budgets.json` (nanoseconds per call, or per job for
+batches). The ceilings leave headroom for slower CI machines; tighten them
+after an optimization lands. The process exits with status 1 on a parity
+failure or an exceeded ceiling, so it can gate CI.
+
+Usage (from backend/):
+    python -m benchmarks.matching
+    python -m benchmarks.matching --catalog-sizes 100 10000 --engine current
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from app.services.ml_service import (
+    SOFT_WEIGHT,
+    TECHNICAL_WEIGHT,
+    MatchResult,
+    SkillData,
+    calculate_batch_matches,
+    calculate_weighted_match,
+    get_skill_gap_analysis,
+)
+from app.services.onet_ingest import IT_SKILLS
+
+BUDGETS_FILE = Path(__file__).resolve().parent / "matching_budgets.json"
+SKILL_SET_SIZES = (5, 20, 100)
+CATALOG_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+CATALOG_CANDIDATE_SKILLS = 20
+CHUNK_SIZE = 50_000
+POOL_SIZE = 400
+MIN_SAMPLE_SECONDS = 0.05
+SEED = 42
+
+Jobs = List[Tuple[int, List[SkillData]]]
+
+
+def reference_weighted_match(candidate_skills: List[SkillData], job_requirements: List[SkillData]) -> MatchResult:
+    """`calculate_weighted_match` as first written; the baseline every engine must agree with."""
+    if not job_requirements:
+        return MatchResult(score=0.0, matched_technical=[], matched_soft=[], missing_technical=[],
+                           missing_soft=[], technical_score=0.0, soft_score=0.0)
+
+    candidate_skill_names = {s.name.lower() for s in candidate_skills}
+
+    tech_requirements = [s for s in job_requirements if s.is_technical]
+    soft_requirements = [s for s in job_requirements if not s.is_technical]
+
+    matched_technical = []
+    missing_technical = []
+    for skill in tech_requirements:
+        if skill.name.lower() in candidate_skill_names:
+            matched_technical.append(skill.name)
+        else:
+            missing_technical.append(skill.name)
+
+    matched_soft = []
+    missing_soft = []
+    for skill in soft_requirements:
+        if skill.name.lower() in candidate_skill_names:
+            matched_soft.append(skill.name)
+        else:
+            missing_soft.append(skill.name)
+
+    total_weighted_requirements = len(tech_requirements) * TECHNICAL_WEIGHT + len(soft_requirements) * SOFT_WEIGHT
+    score = 0.0
+    if total_weighted_requirements:
+        score = (len(matched_technical) * TECHNICAL_WEIGHT + len(matched_soft) * SOFT_WEIGHT) / total_weighted_requirements
+
+    return MatchResult(
+        score=min(score, 1.0),
+        matched_technical=matched_technical,
+        matched_soft=matched_soft,
+        missing_technical=missing_technical,
+        missing_soft=missing_soft,
+        technical_score=len(matched_technical) / len(tech_requirements) if tech_requirements else 0.0,
+        soft_score=len(matched_soft) / len(soft_requirements) if soft_requirements else 0.0,
+    )
+
+
+def reference_batch_matches(candidate_skills: List[SkillData], jobs: Jobs) -> Dict[int, MatchResult]:
+    return {job_id: reference_weighted_match(candidate_skills, requirements) for job_id, requirements in jobs}
+
+
+# name -> (weighted match, batch matches)
+ENGINES: Dict[str, Tuple[Callable, Callable]] = {
+    "reference": (reference_weighted_match, reference_batch_matches),
+    "current": (calculate_weighted_match, calculate_batch_matches),
+}
+
+
+def make_skill_pool(size: int = POOL_SIZE) -> List[SkillData]:
+    """The IT skills first (most popular), then generated ones, ~80% technical."""
+    rng = random.Random(SEED)
+    pool = [SkillData(id=i + 1, name=s["name"], is_technical=s["is_technical"]) for i, s in enumerate(IT_SKILLS)]
+    for i in range(len(pool), size):
+        pool.append(SkillData(id=i + 1, name=f"Skill {i:04d}", is_technical=rng.random() < 0.8))
+    return pool
+
+
+def draw_skills(rng: random.Random, pool: List[SkillData], count: int) -> List[SkillData]:
+    """`count` distinct skills, skewed towards the front of the pool so sets overlap."""
+    if count >= len(pool):
+        return list(pool)
+    picked: Dict[int, SkillData] = {}
+    while len(picked) < count:
+        skill = pool[min(int(rng.expovariate(1 / max(count, 40))), len(pool) - 1)]
+        picked[skill.id] = skill
+    return list(picked.values())
+
+
+def with_case_variants(skills: List[SkillData]) -> List[SkillData]:
+    """Candidate copies whose names differ in case, which matching must ignore."""
+    return [
+        SkillData(id=s.id, name=s.name.upper() if i % 3 == 0 else s.name, is_technical=s.is_technical)
+        for i, s in enumerate(skills)
+    ]
+
+
+def catalog_chunks(pool: List[SkillData], size: int, seed: int) -> Iterator[Jobs]:
+    rng = random.Random(seed)
+    for start in range(0, size, CHUNK_SIZE):
+        yield [
+            (job_id, draw_skills(rng, pool, rng.randint(3, 15)))
+            for job_id in range(start + 1, min(start + CHUNK_SIZE, size) + 1)
+        ]
+
+
+def time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best-of-`repeat` seconds per call, looping enough calls for a stable sample."""
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        if time.perf_counter() - started >= MIN_SAMPLE_SECONDS:
+            break
+        calls *= 2
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def reference_skill_gap(candidate_skills: List[SkillData], job_requirements: List[SkillData]) -> Dict:
+    """Expected skill-gap output, rebuilt around the reference match."""
+    analysis = get_skill_gap_analysis(candidate_skills, job_requirements)
+    match_result = reference_weighted_match(candidate_skills, job_requirements)
+    analysis.update({
+        "overall_score": round(match_result.score * 100, 1),
+        "technical_score": round(match_result.technical_score * 100, 1),
+        "soft_score": round(match_result.soft_score * 100, 1),
+        "matched_technical": match_result.matched_technical,
+        "matched_soft": match_result.matched_soft,
+        "missing_technical": match_result.missing_technical,
+        "missing_soft": match_result.missing_soft,
+    })
+    return analysis
+
+
+def bench_single(pool: List[SkillData], engines: List[str], repeat: int,
+                 results: Dict[str, float], failures: List[str]):
+    rng = random.Random(SEED + 1)
+    for candidate_size in SKILL_SET_SIZES:
+        for job_size in SKILL_SET_SIZES:
+            candidate = with_case_variants(draw_skills(rng, pool, candidate_size))
+            job = draw_skills(rng, pool, job_size)
+            grid = f"c{candidate_size}/j{job_size}"
+
+            expected = reference_weighted_match(candidate, job)
+            for engine in engines:
+                weighted_match = ENGINES[engine][0]
+                if weighted_match(candidate, job) != expected:
+                    failures.append(f"weighted_match[{engine}] {grid}: result differs from reference")
+                results[f"weighted_match[{engine}] {grid}"] = time_per_call(lambda: weighted_match(candidate, job), repeat)
+
+            if get_skill_gap_analysis(candidate, job) != reference_skill_gap(candidate, job):
+                failures.append(f"skill_gap {grid}: result differs from reference")
+            results[f"skill_gap {grid}"] = time_per_call(lambda: get_skill_gap_analysis(candidate, job), repeat)
+
+
+def bench_batch(pool: List[SkillData], engines: List[str], sizes: List[int],
+                results: Dict[str, float], failures: List[str]):
+    rng = random.Random(SEED + 2)
+    candidate = with_case_variants(draw_skills(rng, pool, CATALOG_CANDIDATE_SKILLS))
+    for size in sizes:
+        elapsed = dict.fromkeys(engines, 0.0)
+        for jobs in catalog_chunks(pool, size, SEED + size):
+            expected = None
+            for engine in engines:
+                batch_matches = ENGINES[engine][1]
+                started = time.perf_counter()
+                matches = batch_matches(candidate, jobs)
+                elapsed[engine] += time.perf_counter() - started
+                if expected is None:
+                    expected = matches if engine == "reference" else reference_batch_matches(candidate, jobs)
+                if matches != expected:
+                    failures.append(f"batch_matches[{engine}] {size} jobs: results differ from reference")
+                del matches
+            del expected
+        for engine in engines:
+            results[f"batch_matches[{engine}] {size} jobs"] = elapsed[engine] / size
+        print(f"  batch_matches: {size:,} jobs")
+
+
+def load_budgets() -> Dict[str, int]:
+    return json.loads(BUDGETS_FILE.read_text())["max_ns"]
+
+
+def check(results: Dict[str, float], budgets: Dict[str, int]) -> List[str]:
+    violations = []
+    for name, seconds in results.items():
+        # Batch budgets are per job, whatever the catalog size.
+        key = name.rsplit(" ", 2)[0] if name.endswith(" jobs") else name
+        limit = budgets.get(key)
+        if limit is None:
+            violations.append(f"{name}: no budget in {BUDGETS_FILE.name}")
+        elif seconds * 1e9 > limit:
+            violations.append(f"{name}: {seconds * 1e9:,.0f} ns (budget {limit:,} ns)")
+    return violations
+
+
+def print_results(results: Dict[str, float], budgets: Dict[str, int]):
+    print(f"\n{'operation':<48}{'ns/op':>12}{'budget':>12}{'vs reference':>14}")
+    for name, seconds in results.items():
+        key = name.rsplit(" ", 2)[0] if name.endswith(" jobs") else name
+        reference = results.get(name.replace("[current]", "[reference]")) if "[current]" in name else None
+        speedup = f"{reference / seconds:.2f}x" if reference else ""
+        print(f"{name:<48}{seconds * 1e9:>12,.0f}{budgets.get(key, 0):>12,}{speedup:>14}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-sizes", type=int, nargs="+", default=list(CATALOG_SIZES))
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="engines to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-check", action="store_true", help="report timings without enforcing budgets")
+    args = parser.parse_args()
+
+    engines = args.engine or list(ENGINES)
+    pool = make_skill_pool()
+    budgets = load_budgets()
+    results: Dict[str, float] = {}
+    failures: List[str] = []
+
+    bench_single(pool, engines, args.repeat, results, failures)
+    bench_batch(pool, engines, args.catalog_sizes, results, failures)
+    print_results(results, budgets)
+
+    if not args.no_check:
+        failures.extend(check(results, budgets))
+    if failures:
+        print("\nMatching benchmark failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll engines agree" + ("" if args.no_check else " and all matching budgets met"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Test settings, applied before anything imports the app.
+
+app.database builds its engine from DATABASE_URL at import time, so the
+database is chosen here: QUERY_BUDGET_DATABASE_URL when set (a throwaway
+PostgreSQL database; it is dropped and recreated), otherwise a SQLite file in
+a temporary directory. A developer's DATABASE_URL is never used, because the
+query-budget tests drop every table.
+"""
+
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = tempfile.mkdtemp(prefix="pathfinder-tests-")
+
+os.environ["DATABASE_URL"] = (
+    os.environ.get("QUERY_BUDGET_DATABASE_URL") or f"sqlite+aiosqlite:///{os.path.join(TEST_DIR, 'test.db')}"
+)
+os.environ["SHARED_SNAPSHOT_DIR"] = os.path.join(TEST_DIR, "snapshots")
+os.environ["INVALIDATION_BUS"] = "local"
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
@@ -0,0 +1,18 @@
+"""
+Import-time budgets, from benchmarks/importtime_budgets.json.
+
+Each budgeted target is imported in fresh interpreters (best of three, as
+`python -m benchmarks.importtime` does). The test fails when a module
+exceeds its cumulative ceiling or a module that has to stay lazy is loaded.
+"""
+
+import pytest
+
+from benchmarks.importtime import best_of, check_budgets, load_budgets
+
+BUDGETS = load_budgets()
+
+
+@pytest.mark.parametrize("target", list(BUDGETS))
+def test_import_budget(target):
+    assert check_budgets(target, best_of(target, repeat=3), BUDGETS[target]) == []
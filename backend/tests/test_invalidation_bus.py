@@ -0,0 +1,81 @@
+"""
+Cross-process delivery over the "unix" transport.
+
+A second Python process subscribes to a topic; this process publishes a
+burst of events, which must arrive there as one coalesced callback.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+import pytest
+
+from app.services.invalidation_bus import InvalidationBus, UnixSocketTransport
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUBSCRIBER = textwrap.dedent("""
+    import asyncio, json, sys
+    from app.services.invalidation_bus import InvalidationBus, UnixSocketTransport
+
+    async def main():
+        bus = InvalidationBus(UnixSocketTransport(directory=sys.argv[1]))
+        calls = []
+        bus.subscribe("test", lambda keys: calls.append(sorted(keys)))
+        await bus.start()
+        print("ready", flush=True)
+        await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+        await asyncio.sleep(0.5)
+        await bus.stop()
+        print(json.dumps({"calls": calls, "stats": bus.stats()}), flush=True)
+
+    asyncio.run(main())
+""")
+
+
+async def _publish_burst(directory: str, keys):
+    bus = InvalidationBus(UnixSocketTransport(directory=directory))
+    local_calls = []
+    bus.subscribe("test", lambda changed: local_calls.append(sorted(changed)))
+    await bus.start()
+    try:
+        for key in keys:
+            bus.publish_now("test", key)
+    finally:
+        await bus.stop()
+    return local_calls
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+def test_unix_transport_delivers_across_processes_and_coalesces():
+    with tempfile.TemporaryDirectory() as directory:
+        subscriber = subprocess.Popen(
+            [sys.executable, "-c", SUBSCRIBER, directory],
+            cwd=BACKEND_DIR,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [BACKEND_DIR, os.environ.get("PYTHONPATH")]))},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert subscriber.stdout.readline().strip() == "ready"
+            keys = [1, 2, 3, 2, 4]
+            local_calls = asyncio.run(_publish_burst(directory, keys))
+            output, _ = subscriber.communicate("done\n", timeout=30)
+        finally:
+            if subscriber.poll() is None:
+                subscriber.kill()
+
+    result = json.loads(output.strip().splitlines()[-1])
+    # The publisher dispatches its own events synchronously, one per publish.
+    assert local_calls == [["1"], ["2"], ["3"], ["2"], ["4"]]
+    # The other process got every event, folded into a single callback.
+    assert result["calls"] == [["1", "2", "3", "4"]]
+    assert result["stats"]["received"] == len(keys)
+    assert result["stats"]["coalesced"] == len(keys) - 1
@@ -0,0 +1,29 @@
+"""
+Query budgets per endpoint, from benchmarks/query_budgets.json.
+
+Runs the query-budget harness in-process against the test database at the
+default sizes (1, 10 and 100 rows per list). Each case fails when its route
+answers with the wrong status, runs more statements than its budget at any
+size, or repeats a statement per row (an N+1).
+"""
+
+import asyncio
+from typing import Dict
+
+import pytest
+
+from benchmarks.query_budgets import CASES, DEFAULT_SIZES, CaseResult, check, load_budgets, measure, uncovered_routes
+
+
+@pytest.fixture(scope="module")
+def results() -> Dict[str, CaseResult]:
+    return {result.case.name: result for result in asyncio.run(measure(DEFAULT_SIZES, CASES))}
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_query_budget(results, case):
+    assert check([results[case.name]], load_budgets(), DEFAULT_SIZES) == []
+
+
+def test_every_route_has_a_budget_case():
+    assert uncovered_routes(CASES) == []
@@ -284,8 +284,15 @@ export interface JobSearchParams {
   min_match_score?: number
   sort_by?: 'created_at' | 'match_score' | 'salary'
   sort_order?: 'asc' | 'desc'
+  fields?: string[]
 }
 
+// The job list omits `description` unless it is requested through `fields`.
+export const JOB_CARD_FIELDS = [
+  'id', 'title', 'description', 'location', 'salary_min', 'salary_max', 'job_type',
+  'experience_level', 'deadline', 'required_skills', 'match_score',
+]
+
 export const jobsApi = {
   list: (params?: JobSearchParams) => {
     const searchParams = new URLSearchParams()
@@ -298,6 +305,7 @@ export const jobsApi = {
     if (params?.min_match_score) searchParams.set('min_match_score', String(params.min_match_score))
     if (params?.sort_by) searchParams.set('sort_by', params.sort_by)
     if (params?.sort_order) searchParams.set('sort_order', params.sort_order)
+    if (params?.fields) searchParams.set('fields', params.fields.join(','))
     const query = searchParams.toString()
     return fetchApi<JobWithMatch[]>(`/jobs${query ? `?${query}` : ''}`)
   },
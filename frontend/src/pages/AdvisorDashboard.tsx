@@ -10,7 +10,7 @@ import { Badge } from '@/components/ui/badge'
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogFooter } from '@/components/ui/dialog'
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
 import { Loader2, ArrowLeft, MessageSquare, GraduationCap, Target, FileText, BarChart3, TrendingUp, Users, Briefcase, Award } from 'lucide-react'
-import { UserWithStats, JobWithMatch } from '@/lib/api'
+import { UserWithStats, JobWithMatch, JOB_CARD_FIELDS } from '@/lib/api'
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell, Legend } from 'recharts'
 
 export function AdvisorDashboard() {
@@ -25,7 +25,7 @@ export function AdvisorDashboard() {
   const { data: studentDetail } = useStudent(selectedStudent?.id || 0)
   const { data: studentApplications } = useStudentApplications(selectedStudent?.id || 0)
   const { data: studentNotes } = useStudentNotes(selectedStudent?.id || 0)
-  const { data: jobs } = useJobs()
+  const { data: jobs } = useJobs({ fields: JOB_CARD_FIELDS })
   const { data: skillGap } = useSkillGap(selectedJob?.id || 0, selectedStudent?.id)
   const createNote = useCreateNote()
 
@@ -12,11 +12,11 @@ import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/com
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select'
 import { Badge } from '@/components/ui/badge'
 import { Search, Loader2, Filter, X, BookOpen, ExternalLink, GraduationCap, Clock } from 'lucide-react'
-import { JobWithMatch } from '@/lib/api'
+import { JobWithMatch, JOB_CARD_FIELDS } from '@/lib/api'
 
 export function StudentDashboard() {
   const { user } = useAuth()
-  const { data: jobs, isLoading: jobsLoading } = useJobs()
+  const { data: jobs, isLoading: jobsLoading } = useJobs({ fields: JOB_CARD_FIELDS })
   const { data: applications } = useMyApplications()
   const [searchTerm, setSearchTerm] = useState('')
   const [selectedJob, setSelectedJob] = useState<JobWithMatch | null>(null)